@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Compare the iterative loyalty AVLTree with the recursive one it replaced.
+
+Inserts n customers in shuffled order, searches each once, then deletes
+half of them, timing each phase for both implementations. The logger is
+set to WARNING so the per-operation messages are skipped and only the
+tree work is measured.
+
+Usage:
+    python -m scripts.benchmark_avl [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.logger import INFO, WARNING, configure_logging, log_operation
+from src.pos_system.loyalty.avl_tree import AVLNode, AVLTree
+
+
+class RecursiveAVLTree(AVLTree):
+    """The previous recursive insert/delete, recomputing heights at every level"""
+
+    def insert(self, customer):
+        inserted = False
+        def _insert(node, customer):
+            nonlocal inserted
+            if not node:
+                inserted = True
+                log_operation("Inserted: %s", customer)
+                return AVLNode(customer)
+            if customer.customer_id < node.customer.customer_id:
+                node.left = _insert(node.left, customer)
+            elif customer.customer_id > node.customer.customer_id:
+                node.right = _insert(node.right, customer)
+            else:
+                log_operation("Customer %s already exists.", customer.customer_id)
+                return node
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            balance = self.get_balance(node)
+            if balance > 1 and customer.customer_id < node.left.customer.customer_id:
+                return self.right_rotate(node)
+            if balance < -1 and customer.customer_id > node.right.customer.customer_id:
+                return self.left_rotate(node)
+            if balance > 1 and customer.customer_id > node.left.customer.customer_id:
+                node.left = self.left_rotate(node.left)
+                return self.right_rotate(node)
+            if balance < -1 and customer.customer_id < node.right.customer.customer_id:
+                node.right = self.right_rotate(node.right)
+                return self.left_rotate(node)
+            return node
+        self.root = _insert(self.root, customer)
+        return inserted
+
+    def delete(self, customer_id):
+        def _delete(node, customer_id):
+            if not node:
+                return None
+            if customer_id < node.customer.customer_id:
+                node.left = _delete(node.left, customer_id)
+            elif customer_id > node.customer.customer_id:
+                node.right = _delete(node.right, customer_id)
+            else:
+                log_operation("Deleted: %s", node.customer)
+                if not node.left:
+                    return node.right
+                if not node.right:
+                    return node.left
+                succ = node.right
+                while succ.left:
+                    succ = succ.left
+                node.customer = succ.customer
+                node.right = _delete(node.right, succ.customer.customer_id)
+            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+            balance = self.get_balance(node)
+            if balance > 1 and self.get_balance(node.left) >= 0:
+                return self.right_rotate(node)
+            if balance < -1 and self.get_balance(node.right) <= 0:
+                return self.left_rotate(node)
+            if balance > 1 and self.get_balance(node.left) < 0:
+                node.left = self.left_rotate(node.left)
+                return self.right_rotate(node)
+            if balance < -1 and self.get_balance(node.right) > 0:
+                node.right = self.right_rotate(node.right)
+                return self.left_rotate(node)
+            return node
+        self.root = _delete(self.root, customer_id)
+
+
+def _measure(tree_class, customers, deletes):
+    """Seconds spent inserting every customer, searching each, and deleting deletes"""
+    tree = tree_class()
+    start = time.perf_counter()
+    for customer in customers:
+        tree.insert(customer)
+    inserted = time.perf_counter()
+    for customer in customers:
+        tree.search(customer.customer_id)
+    searched = time.perf_counter()
+    for customer_id in deletes:
+        tree.delete(customer_id)
+    deleted = time.perf_counter()
+    return inserted - start, searched - inserted, deleted - searched
+
+
+def run(sizes):
+    print(f"{'Customers':>9} | {'Tree':<9} | {'Insert (s)':>10} | {'Search (s)':>10} | {'Delete (s)':>10}")
+    print("-" * 60)
+    configure_logging(level=WARNING)
+    try:
+        for n in sizes:
+            rng = random.Random(n)
+            customers = [Customer(f"CUST_{i:07d}", f"Customer {i}", rng.randrange(2000)) for i in range(n)]
+            rng.shuffle(customers)
+            deletes = [c.customer_id for c in rng.sample(customers, n // 2)]
+            baseline = _measure(RecursiveAVLTree, customers, deletes)
+            current = _measure(AVLTree, customers, deletes)
+            for name, times in (("recursive", baseline), ("iterative", current)):
+                print(f"{n:>9} | {name:<9} | {times[0]:>10.3f} | {times[1]:>10.3f} | {times[2]:>10.3f}")
+            print(f"{'':>9} | {'speedup':<9} | {baseline[0] / current[0]:>9.2f}x | {'':>10} | {baseline[2] / current[2]:>9.2f}x",
+                  flush=True)
+    finally:
+        configure_logging(level=INFO)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the iterative AVLTree against the recursive version")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark catalog loads into the inventory BinarySearchTree.
+
+Times sorted, reverse-sorted and random key orders. Sorted orders
+degenerate the tree into a linked list, so their cost is quadratic; sizes
+above ``--max-degenerate`` are reported as skipped for those orders.
+
+Usage:
+    python -m scripts.benchmark_bst_load [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+
+
+def _keys(order: str, n: int):
+    keys = list(range(n))
+    if order == "reverse":
+        keys.reverse()
+    elif order == "random":
+        random.Random(n).shuffle(keys)
+    return keys
+
+
+def run(sizes, max_degenerate: int):
+    print(f"{'Order':<10} | {'Keys':>9} | {'Load (s)':>10} | {'Delete (s)':>10}")
+    print("-" * 49)
+    for order in ("sorted", "reverse", "random"):
+        for n in sizes:
+            if order != "random" and n > max_degenerate:
+                print(f"{order:<10} | {n:>9} | {'skipped':>10} | {'skipped':>10}")
+                continue
+            keys = _keys(order, n)
+            tree = BinarySearchTree[int]()
+            start = time.perf_counter()
+            for key in keys:
+                tree.insert(key)
+            load = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for key in keys:
+                tree.delete(key)
+            delete = time.perf_counter() - start
+            print(f"{order:<10} | {n:>9} | {load:>10.3f} | {delete:>10.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BinarySearchTree catalog loads")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument(
+        "--max-degenerate",
+        type=int,
+        default=10_000,
+        help="Largest size to run for sorted/reverse orders (quadratic cost)",
+    )
+    args = parser.parse_args()
+    run(args.sizes, args.max_degenerate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Compare memory of object-node and array-backed inventory BSTs.
+
+Uses tracemalloc to measure the bytes allocated while building each tree
+from the same shuffled integer keys (values are shared, so only the
+per-node overhead is compared).
+
+Usage:
+    python -m scripts.benchmark_bst_memory [--sizes 10000 100000 1000000]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from src.pos_system.inventory.array_binary_search_tree import ArrayBinarySearchTree
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+
+
+def _measure(tree_class, keys):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = tree_class()
+    for key in keys:
+        tree.insert(key)
+    duration = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return current, peak, duration
+
+
+def run(sizes):
+    print(f"{'Keys':>9} | {'Tree':<22} | {'Bytes/node':>10} | {'Total (MB)':>10} | {'Peak (MB)':>9} | {'Load (s)':>8}")
+    print("-" * 82)
+    for n in sizes:
+        keys = list(range(n))
+        random.Random(n).shuffle(keys)
+        for tree_class in (BinarySearchTree, ArrayBinarySearchTree):
+            current, peak, duration = _measure(tree_class, keys)
+            print(f"{n:>9} | {tree_class.__name__:<22} | {current / n:>10.1f} | {current / 2**20:>10.2f} | {peak / 2**20:>9.2f} | {duration:>8.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare BST memory use with tracemalloc")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
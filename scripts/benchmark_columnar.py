@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Compare inventory reports on the tree against the columnar NumPy mirror.
+
+Builds a balanced inventory BST and a ColumnarInventory over the same
+synthetic products, then times total stock value and value per category:
+a traverse() with Python arithmetic per node versus vectorized aggregates.
+
+Usage:
+    python -m scripts.benchmark_columnar [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+from collections import defaultdict
+
+from src.pos_system.common.Product import Product
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.columnar_store import ColumnarInventory
+
+CATEGORIES = ["Dairy", "Beverages", "Bakery", "Seafood", "Grains & Pulses", "Fruits & Vegetables", "Oils & Fats"]
+
+
+def _tree_report(tree):
+    total = 0.0
+    by_category = defaultdict(float)
+    for node in tree.traverse():
+        product = node.value
+        value = product.price * product.quantity
+        total += value
+        by_category[product.category] += value
+    return total, dict(by_category)
+
+
+def _columnar_report(store):
+    return store.total_value(), store.value_by_category()
+
+
+def _best_of(function, argument, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(sizes):
+    print(f"{'Products':>9} | {'Tree report (ms)':>16} | {'Columnar (ms)':>13} | {'Speedup':>8}")
+    print("-" * 57)
+    for n in sizes:
+        rng = random.Random(n)
+        products = [Product(f"{i:010d}", f"Product {i}", rng.choice(CATEGORIES), round(rng.uniform(1, 50), 2), rng.randrange(100))
+                    for i in range(n)]
+        tree = BinarySearchTree.from_sorted((p.product_id, p) for p in products)
+        store = ColumnarInventory.from_products(products)
+        tree_time = _best_of(_tree_report, tree)
+        columnar_time = _best_of(_columnar_report, store)
+        print(f"{n:>9} | {tree_time * 1000:>16.2f} | {columnar_time * 1000:>13.2f} | {tree_time / columnar_time:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tree traversal reports against the columnar mirror")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Compare peak memory of the dict-based and streaming typed CSV loaders.
+
+Writes a synthetic products.csv of each size to a temporary directory and
+totals the stock value in two ways: load every row as a dict (as load_csv
+does) and convert to Product in a second pass, or stream Products with
+iter_records. tracemalloc reports the peak bytes allocated by each.
+
+Usage:
+    python -m scripts.benchmark_csv_loader [--sizes 100000 1000000 2000000]
+"""
+import argparse
+import csv
+import gc
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.pos_system.common.Product import Product
+from src.pos_system.common.data_loader import PRODUCT_SCHEMA, iter_records
+
+FIELDS = ["product_id", "name", "category", "price", "quantity", "reorder_level", "reorder_quantity"]
+
+
+def _write_csv(path: Path, n: int) -> None:
+    rng = random.Random(n)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for i in range(n):
+            writer.writerow([f"{i:010d}", f"Product {i}", "Dairy", f"{rng.uniform(1, 50):.2f}",
+                             rng.randrange(100), rng.randrange(100), rng.randrange(100)])
+
+
+def _dict_rows(path: Path) -> float:
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    products = [Product(r["product_id"], r["name"], r["category"], float(r["price"]), int(r["quantity"]),
+                        int(r["reorder_level"]), int(r["reorder_quantity"])) for r in rows]
+    return sum(p.price * p.quantity for p in products)
+
+
+def _streamed(path: Path) -> float:
+    return sum(p.price * p.quantity for p in iter_records(path, PRODUCT_SCHEMA))
+
+
+def _measure(loader, path: Path):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loader(path)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, duration
+
+
+def run(sizes):
+    print(f"{'Rows':>9} | {'Loader':<18} | {'Peak (MB)':>9} | {'Time (s)':>8}")
+    print("-" * 54)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = Path(tmp) / "products.csv"
+            _write_csv(path, n)
+            for name, loader in (("dict rows + Product", _dict_rows), ("iter_records", _streamed)):
+                peak, duration = _measure(loader, path)
+                print(f"{n:>9} | {name:<18} | {peak / 2**20:>9.2f} | {duration:>8.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CSV loader peak memory with tracemalloc")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 2_000_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare loading customers into the loyalty trees one by one and in bulk.
+
+The one-by-one variant inserts every customer into a BSTTree and then an
+AVLTree at INFO level (the previous load_customers, console output
+discarded); the bulk variant sorts once and builds both trees with
+from_sorted, as load_customers now does.
+
+Usage:
+    python -m scripts.benchmark_customer_load [--sizes 935 10000 100000]
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.pos_system.common import logger
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.data_loader import sorted_unique_customers
+from src.pos_system.common.logger import INFO, configure_logging, flush_logs
+from src.pos_system.loyalty.avl_tree import AVLTree
+from src.pos_system.loyalty.binary_tree import BSTTree
+
+
+def _insert_each(customers) -> float:
+    start = time.perf_counter()
+    bst, avl = BSTTree(), AVLTree()
+    for customer in customers:
+        bst.insert(customer)
+    for customer in customers:
+        avl.insert(customer)
+    flush_logs()
+    return time.perf_counter() - start
+
+
+def _bulk(customers) -> float:
+    start = time.perf_counter()
+    ordered, _ = sorted_unique_customers(customers)
+    BSTTree.from_sorted(ordered)
+    AVLTree.from_sorted(ordered)
+    return time.perf_counter() - start
+
+
+def run(sizes):
+    out = sys.stdout   # Table rows bypass the discarded console output
+    print(f"{'Customers':>9} | {'One by one (s)':>14} | {'Bulk (s)':>9} | {'Speedup':>8}")
+    print("-" * 50)
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        configure_logging(level=INFO, console=True, path=str(Path(tmp) / "load.log"))
+        try:
+            for n in sizes:
+                rng = random.Random(n)
+                customers = [Customer(f"CUST_{i:07d}", f"Customer {i}", rng.randrange(2000)) for i in range(n)]
+                rng.shuffle(customers)
+                each_time = _insert_each(customers)
+                bulk_time = _bulk(customers)
+                print(f"{n:>9} | {each_time:>14.3f} | {bulk_time:>9.3f} | {each_time / bulk_time:>7.1f}x", file=out, flush=True)
+        finally:
+            configure_logging(path=logger.DEFAULT_LOG_FILE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark one-by-one and bulk loyalty tree loads")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[935, 10_000, 100_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Compare persisting loyalty point updates by journal and by full CSV rewrite.
+
+For each size, applies the same point updates and makes each one durable
+two ways: rewriting customers.csv in full after every update (the snapshot
+written atomically once, as save_customers now does) and appending a
+CustomerJournal record with batched fsync. Files go to a temporary
+directory; the logger is set to WARNING.
+
+Usage:
+    python -m scripts.benchmark_journal [--sizes 935 10000] [--updates 200]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.journal import CustomerJournal, write_snapshot
+from src.pos_system.common.logger import INFO, WARNING, configure_logging
+from src.pos_system.loyalty import update_points
+from src.pos_system.loyalty.avl_tree import AVLTree
+
+
+def run(sizes, updates):
+    print(f"{'Customers':>9} | {'Rewrite (ms/update)':>19} | {'Journal (ms/update)':>19} | {'Speedup':>8}")
+    print("-" * 66)
+    configure_logging(level=WARNING)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for n in sizes:
+                rng = random.Random(n)
+                customers = [Customer(f"CUST_{i:07d}", f"Customer {i}", rng.randrange(2000)) for i in range(n)]
+                tree = AVLTree.from_sorted(customers)
+                ids = [rng.choice(customers).customer_id for _ in range(updates)]
+
+                start = time.perf_counter()
+                for cid in ids:
+                    update_points(tree, cid, 10)
+                    write_snapshot(Path(tmp) / "customers.csv", tree.inorder_traversal())
+                rewrite_time = (time.perf_counter() - start) / updates
+
+                journal = CustomerJournal(Path(tmp) / "customers.csv.journal")
+                start = time.perf_counter()
+                for cid in ids:
+                    update_points(tree, cid, 10)
+                    journal.record_customer(tree.search(cid))
+                journal.close()
+                journal_time = (time.perf_counter() - start) / updates
+
+                print(f"{n:>9} | {rewrite_time * 1e3:>19.3f} | {journal_time * 1e3:>19.3f} | {rewrite_time / journal_time:>7.0f}x",
+                      flush=True)
+    finally:
+        configure_logging(level=INFO)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark journaled point updates against full snapshot rewrites")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[935, 10_000])
+    parser.add_argument("--updates", type=int, default=200)
+    args = parser.parse_args()
+    run(args.sizes, args.updates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Compare loyalty tree load time under the old and new operation loggers.
+
+Loads the same customers into a BSTTree and an AVLTree (as load_customers
+does) three ways: with the previous log_operation (print, then open/append/
+close the log file on every call), with the batched background writer, and
+with the level raised to WARNING so per-operation messages are skipped.
+Console output is discarded in every variant; log files go to a temporary
+directory.
+
+Usage:
+    python -m scripts.benchmark_logger [--sizes 935 10000 50000]
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.pos_system.common import logger
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.logger import INFO, WARNING, configure_logging, flush_logs
+from src.pos_system.loyalty import avl_tree, binary_tree
+
+
+def _legacy_logger(path: Path):
+    def log_operation(message, *args, level=INFO):  # The per-call open/append/close logger being replaced
+        if args:
+            message = message % args
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{timestamp}] {message}")
+        with open(path, "a") as f:
+            f.write(f"[{timestamp}] {message}\n")
+    return log_operation
+
+
+def _load(customers) -> float:
+    start = time.perf_counter()
+    bst, avl = binary_tree.BSTTree(), avl_tree.AVLTree()
+    for customer in customers:
+        bst.insert(customer)
+    for customer in customers:
+        avl.insert(customer)
+    flush_logs()    # Count the time until the lines are actually on disk
+    return time.perf_counter() - start
+
+
+def run(sizes):
+    out = sys.stdout   # Table rows bypass the discarded console output
+    print(f"{'Customers':>9} | {'Legacy (s)':>10} | {'Batched (s)':>11} | {'WARNING (s)':>11} | {'Speedup':>7}")
+    print("-" * 63)
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for n in sizes:
+            rng = random.Random(n)
+            ids = [f"CUST_{i:07d}" for i in range(n)]
+            rng.shuffle(ids)
+            customers = [Customer(cid, f"Customer {cid}", rng.randrange(2000)) for cid in ids]
+
+            legacy = _legacy_logger(Path(tmp) / "legacy.log")
+            avl_tree.log_operation = binary_tree.log_operation = legacy
+            legacy_time = _load(customers)
+
+            avl_tree.log_operation = binary_tree.log_operation = logger.log_operation
+            configure_logging(level=INFO, console=True, path=str(Path(tmp) / "batched.log"))
+            batched_time = _load(customers)
+            configure_logging(level=WARNING)
+            quiet_time = _load(customers)
+            configure_logging(level=INFO, path=logger.DEFAULT_LOG_FILE)
+            print(f"{n:>9} | {legacy_time:>10.3f} | {batched_time:>11.3f} | {quiet_time:>11.3f} | {legacy_time / batched_time:>6.1f}x",
+                  file=out, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loyalty tree loads under each logger")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[935, 10_000, 50_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Compare per-key search against batched search_many for checkout baskets.
+
+Builds each inventory tree from the product catalog key format
+(NN-NNN-NNNN strings), then looks up random baskets of 20-60 SKUs either
+one search() at a time or with a single search_many() call. Only
+SplayTree uses a batched walk; BinarySearchTree.search_many is a per-key
+loop, because the walk measured 0.70-0.85x as fast as search() there.
+
+Usage:
+    python -m scripts.benchmark_search_many [--keys 100000] [--baskets 2000]
+"""
+import argparse
+import random
+import time
+
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.splay_tree import SplayTree
+
+
+def _product_ids(n: int, rng: random.Random):
+    ids = set()
+    while len(ids) < n:
+        ids.add(f"{rng.randrange(100):02d}-{rng.randrange(1000):03d}-{rng.randrange(10000):04d}")
+    return sorted(ids)
+
+
+def run(keys: int, baskets: int, sizes):
+    rng = random.Random(14)
+    ids = _product_ids(keys, rng)
+    items = [(pid, None) for pid in ids]
+    print(f"{keys} products, {baskets} baskets per size")
+    print(f"{'Tree':<18} | {'Basket':>6} | {'Per-key (us)':>12} | {'Batched (us)':>12} | {'Speedup':>7}")
+    print("-" * 68)
+    for tree_class in (BinarySearchTree, SplayTree):
+        for size in sizes:
+            workload = [rng.sample(ids, size) for _ in range(baskets)]
+            tree = tree_class.from_sorted(items)
+            start = time.perf_counter()
+            for basket in workload:
+                for key in basket:
+                    tree.search(key)
+            per_key = (time.perf_counter() - start) / baskets * 1e6
+
+            tree = tree_class.from_sorted(items)
+            start = time.perf_counter()
+            for basket in workload:
+                tree.search_many(basket)
+            batched = (time.perf_counter() - start) / baskets * 1e6
+            print(f"{tree_class.__name__:<18} | {size:>6} | {per_key:>12.1f} | {batched:>12.1f} | {per_key / batched:>6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched basket lookups")
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--baskets", type=int, default=2_000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[20, 40, 60])
+    args = parser.parse_args()
+    run(args.keys, args.baskets, args.sizes)
+
+
+if __name__ == "__main__":
+    main()
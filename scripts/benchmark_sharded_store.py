@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Throughput of the sharded inventory store by shard count.
+
+Runs a fixed mix of searches and updates from several threads against
+ShardedInventoryStore and reports operations per second. Under CPython's
+GIL the gain from more shards is reduced lock contention (threads rarely
+queue behind the same shard lock), not parallel tree work.
+
+Usage:
+    python -m scripts.benchmark_sharded_store [--shards 1 2 4 8 16] [--threads 8]
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.sharded_store import ShardedInventoryStore
+from src.pos_system.inventory.splay_tree import SplayTree
+
+
+def _run_once(tree_class, shards: int, threads: int, keys: int, ops: int, write_ratio: float) -> float:
+    store = ShardedInventoryStore.from_sorted([(k, k) for k in range(keys)], shards=shards, tree_class=tree_class)
+    barrier = threading.Barrier(threads + 1)
+
+    def work(seed):
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(ops):
+            key = rng.randrange(keys)
+            if rng.random() < write_ratio:
+                store.insert(key, key)
+            else:
+                store.search(key)
+
+    workers = [threading.Thread(target=work, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return threads * ops / (time.perf_counter() - start)
+
+
+def run(shard_counts, threads: int, keys: int, ops: int, write_ratio: float):
+    print(f"{threads} threads, {keys} keys, {ops} ops/thread, {write_ratio:.0%} writes")
+    print(f"{'Tree':<18} | {'Shards':>6} | {'Ops/sec':>12}")
+    print("-" * 42)
+    for tree_class in (BinarySearchTree, SplayTree):
+        for shards in shard_counts:
+            throughput = _run_once(tree_class, shards, threads, keys, ops, write_ratio)
+            print(f"{tree_class.__name__:<18} | {shards:>6} | {throughput:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ShardedInventoryStore throughput")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--ops", type=int, default=20_000, help="Operations per thread")
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+    run(args.shards, args.threads, args.keys, args.ops, args.write_ratio)
+
+
+if __name__ == "__main__":
+    main()
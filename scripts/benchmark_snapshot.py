@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Compare inventory startup from products.csv against a binary snapshot.
+
+Writes a synthetic products.csv of each size to a temporary directory,
+then times the CSV rebuild (DictReader -> Product -> sort -> from_sorted,
+as build_inventory_bst does) against load_snapshot of the same tree.
+
+Usage:
+    python -m scripts.benchmark_snapshot [--sizes 100000 250000 500000]
+"""
+import argparse
+import csv
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from src.pos_system.common.Product import Product
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.snapshot import load_snapshot, save_snapshot
+
+FIELDS = ["product_id", "name", "category", "price", "quantity", "reorder_level", "reorder_quantity"]
+CATEGORIES = ["Dairy", "Beverages", "Bakery", "Seafood", "Grains & Pulses", "Fruits & Vegetables", "Oils & Fats"]
+
+
+def _write_csv(path: Path, n: int) -> None:
+    rng = random.Random(n)
+    ids = set()
+    while len(ids) < n:
+        ids.add(f"{rng.randrange(100):02d}-{rng.randrange(1000):03d}-{rng.randrange(10000):04d}")
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for pid in ids:
+            writer.writerow([pid, f"Product {pid[-4:]}", rng.choice(CATEGORIES), f"{rng.uniform(1, 50):.2f}",
+                             rng.randrange(100), rng.randrange(100), rng.randrange(100)])
+
+
+def _rebuild_from_csv(path: Path) -> BinarySearchTree:
+    products = {}
+    with open(path, newline="") as f:
+        for record in csv.DictReader(f):
+            product = Product(record["product_id"], record["name"], record["category"], float(record["price"]),
+                              int(record["quantity"]), int(record["reorder_level"]), int(record["reorder_quantity"]))
+            products[product.product_id] = product
+    return BinarySearchTree.from_sorted(sorted(products.items(), key=lambda item: item[0]))
+
+
+def run(sizes):
+    print(f"{'Products':>9} | {'CSV rebuild (s)':>15} | {'Snapshot (s)':>12} | {'Speedup':>7} | {'CSV MB':>6} | {'Snap MB':>7}")
+    print("-" * 71)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            csv_path, snap_path = Path(tmp) / "products.csv", Path(tmp) / "products.snap"
+            _write_csv(csv_path, n)
+            start = time.perf_counter()
+            tree = _rebuild_from_csv(csv_path)
+            rebuild = time.perf_counter() - start
+            save_snapshot(tree, snap_path)
+            del tree
+
+            start = time.perf_counter()
+            load_snapshot(snap_path)
+            restore = time.perf_counter() - start
+            print(f"{n:>9} | {rebuild:>15.3f} | {restore:>12.3f} | {rebuild / restore:>6.2f}x | "
+                  f"{csv_path.stat().st_size / 2**20:>6.1f} | {snap_path.stat().st_size / 2**20:>7.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark snapshot restore against CSV rebuild")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 250_000, 500_000])
+    args = parser.parse_args()
+    run(args.sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark top-down against bottom-up splaying in the inventory SplayTree.
+
+Reports wall time plus key comparisons and rotations per workload, so the
+saving from the single-pass top-down splay is visible independently of
+machine noise. Bottom-up splaying recurses once per level, so the sorted
+workload is only run for it up to ``--max-degenerate`` keys.
+
+Usage:
+    python -m scripts.benchmark_splay [--sizes 1000 10000 100000]
+"""
+import argparse
+import random
+import sys
+import time
+
+from src.pos_system.inventory.splay_tree import SplayTree
+
+
+class CountingKey:
+    """Integer key wrapper that counts comparisons"""
+    comparisons = 0
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __lt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value < other.value
+
+    def __gt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value > other.value
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return other is not None and self.value == other.value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+class CountingSplayTree(SplayTree):
+    """SplayTree that counts rotations"""
+
+    def __init__(self, top_down: bool = True):
+        super().__init__(top_down=top_down)
+        self.rotations = 0
+
+    def _zig(self, node):
+        self.rotations += 1
+        return super()._zig(node)
+
+    def _zag(self, node):
+        self.rotations += 1
+        return super()._zag(node)
+
+
+def _workload(tree, keys, lookups):
+    for key in keys:
+        tree.insert(key)
+    for key in lookups:
+        tree.search(key)
+    for key in keys:
+        tree.delete(key)
+
+
+def run(sizes, max_degenerate: int):
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 4 * max_degenerate + 100))
+    print(f"{'Order':<8} | {'Keys':>7} | {'Mode':<10} | {'Time (s)':>9} | {'Comparisons':>12} | {'Rotations':>10}")
+    print("-" * 72)
+    for order in ("random", "sorted"):
+        for n in sizes:
+            values = list(range(n))
+            if order == "random":
+                random.Random(n).shuffle(values)
+            keys = [CountingKey(v) for v in values]
+            rng = random.Random(n + 1)
+            lookups = [keys[int(rng.paretovariate(1.2)) % n] for _ in range(n)] # skewed lookups
+            for top_down in (False, True):
+                mode = "top-down" if top_down else "bottom-up"
+                if not top_down and order == "sorted" and n > max_degenerate:
+                    print(f"{order:<8} | {n:>7} | {mode:<10} | {'skipped':>9} | {'':>12} | {'':>10}")
+                    continue
+                tree = CountingSplayTree(top_down=top_down)
+                CountingKey.comparisons = 0
+                start = time.perf_counter()
+                _workload(tree, keys, lookups)
+                duration = time.perf_counter() - start
+                print(f"{order:<8} | {n:>7} | {mode:<10} | {duration:>9.3f} | {CountingKey.comparisons:>12} | {tree.rotations:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark top-down vs bottom-up splaying")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--max-degenerate",
+        type=int,
+        default=10_000,
+        help="Largest sorted load to run bottom-up (recursion depth grows with n)",
+    )
+    args = parser.parse_args()
+    run(args.sizes, args.max_degenerate)
+
+
+if __name__ == "__main__":
+    main()
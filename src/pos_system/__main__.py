@@ -1,11 +1,11 @@
 """Supermarket POS System - Main entry point."""
 import time
 from src.pos_system.common.Customer import Customer
-from src.pos_system.loyalty.avl_tree import AVLTree
-from src.pos_system.loyalty.binary_tree import BSTTree
+from src.pos_system.loyalty.customer_tree import build_customer_tree
 from src.pos_system.common.data_loader import load_customers, save_customers
+from src.pos_system.common.journal import CustomerJournal, journal_path_for
 from src.pos_system.common.logger import log_operation, timed_operation
-from src.pos_system.loyalty import update_points, calculate_discount, top_n_customers, range_query
+from src.pos_system.loyalty import update_points, calculate_discount, top_n_customers, range_query, enable_points_index
 from src.pos_system.inventory.inventory_module import InventoryModule
 from src.pos_system.sales.bst import main as SalesModule
 import os
@@ -25,12 +25,16 @@ def sales_demo():
 
 def loyalty_demo():
     """Loyalty transactios demo by Chang Choon Kit"""
-    bst = BSTTree()
-    avl = AVLTree()
+    bst = build_customer_tree("loyalty_bst")
+    avl = build_customer_tree("avl")
 
-    # Load customers at start
+    # Load customers at start, replaying changes journaled since the last save
     customer_file = os.path.join("data", "loyalty", "customers.csv")
-    load_customers(customer_file, bst, avl)
+    journal_file = journal_path_for(customer_file)
+    load_customers(customer_file, bst, avl, journal_path=journal_file)
+    enable_points_index(bst)
+    enable_points_index(avl)
+    journal = CustomerJournal(journal_file)
 
     while True:
         print("\n--- Supermarket Loyalty System ---")
@@ -50,6 +54,7 @@ def loyalty_demo():
             bst_result, bst_time = timed_operation(bst.insert, customer)
             avl_result, avl_time = timed_operation(avl.insert, customer)
             if bst_result or avl_result:
+                journal.record_customer(customer)
                 print(f"Customer {cid} inserted.")
                 print(f"BST insert duration: {bst_time:.6f} seconds")
                 print(f"AVL insert duration: {avl_time:.6f} seconds")
@@ -62,6 +67,7 @@ def loyalty_demo():
             bst_result, bst_time = timed_operation(update_points, bst, cid, points)
             avl_result, avl_time = timed_operation(update_points, avl, cid, points)
             if bst_result or avl_result:
+                journal.record_customer(avl.search(cid) or bst.search(cid))
                 print(f"Customer {cid} inserted.")
                 print(f"BST search and update duration: {bst_time:.6f} seconds")
                 print(f"AVL search and update duration: {avl_time:.6f} seconds")
@@ -72,6 +78,7 @@ def loyalty_demo():
             cid = input("Customer ID to remove: ")
             bst_result, bst_time = timed_operation(bst.delete, cid)
             avl_result, avl_time = timed_operation(avl.delete, cid)
+            journal.record_removal(cid)
             print(f"Customer {cid} removed.")
             print(f"BST delete duration: {bst_time:.6f} seconds")
             print(f"AVL delete duration: {avl_time:.6f} seconds")
@@ -119,8 +126,9 @@ def loyalty_demo():
             print(f"BST range query duration: {bst_time:.6f} seconds")
             print(f"AVL range query duration: {avl_time:.6f} seconds")
         elif choice == "7":
-            # Save before exit
-            save_customers(customer_file, bst, avl)
+            # Compact the journal into the snapshot before exit
+            save_customers(customer_file, bst, avl, journal=journal)
+            journal.close()
             print("Exiting system.")
             break
 
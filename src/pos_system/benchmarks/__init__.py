@@ -0,0 +1,10 @@
+"""Workload-driven benchmark suite for every registered tree backend.
+
+Run ``python -m src.pos_system.benchmarks run --output results.json`` and
+``python -m src.pos_system.benchmarks compare old.json new.json``.
+"""
+from .compare import compare_results
+from .runner import run_benchmarks, run_once, summarise
+from .workloads import WORKLOADS, Workload
+
+__all__ = ["WORKLOADS", "Workload", "compare_results", "run_benchmarks", "run_once", "summarise"]
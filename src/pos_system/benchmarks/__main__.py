@@ -0,0 +1,74 @@
+"""Command line for the tree benchmark suite.
+
+Usage:
+    python -m src.pos_system.benchmarks run [--backends bst splay] [--workloads uniform zipf]
+        [--sizes 1000 10000 1000000] [--ops 10000] [--repeats 5] [--output results.json]
+    python -m src.pos_system.benchmarks compare baseline.json current.json [--threshold 0.1]
+"""
+import argparse
+import json
+import sys
+
+from src.pos_system.common.tree_registry import backend_names
+from src.pos_system.benchmarks import compare, runner
+from src.pos_system.benchmarks.workloads import WORKLOADS
+
+
+def _run(args) -> int:
+    print(runner.HEADER)
+    print("-" * len(runner.HEADER))
+    results = runner.run_benchmarks(args.backends, args.workloads, args.sizes, args.ops, args.repeats,
+                                    args.warmup, args.max_degenerate, args.seed,
+                                    progress=lambda result: print(runner.format_result(result), flush=True))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+def _compare(args) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+    rows = compare.compare_results(baseline, current, args.threshold, args.metric)
+    print(compare.HEADER)
+    print("-" * len(compare.HEADER))
+    for row in rows:
+        print(compare.format_row(row))
+    regressions = sum(row["verdict"] == "regression" for row in rows)
+    print(f"{len(rows)} compared, {regressions} regressions (threshold {args.threshold:.0%} on {args.metric})")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.pos_system.benchmarks", description="Tree benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run workloads and report latency percentiles")
+    run.add_argument("--backends", nargs="+", choices=backend_names(), help="Default: every registered backend")
+    run.add_argument("--workloads", nargs="+", choices=list(WORKLOADS), help="Default: every workload")
+    run.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    run.add_argument("--ops", type=int, default=10_000, help="Timed operations per repeat")
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--warmup", type=int, default=1, help="Untimed repeats before measuring")
+    run.add_argument("--max-degenerate", type=int, default=5_000,
+                     help="Largest size for the sorted workload on unbalanced trees (quadratic cost)")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--output", help="Write results as JSON to this file")
+    run.set_defaults(handler=_run)
+
+    diff = commands.add_parser("compare", help="Flag regressions between two JSON result files")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    diff.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown counted as a regression")
+    diff.add_argument("--metric", choices=compare.METRICS, default="median_ns")
+    diff.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Compare two benchmark result files and flag regressions."""
+from typing import Dict, List, Tuple
+
+Key = Tuple[str, str, int]
+
+METRICS = ("median_ns", "p95_ns", "p99_ns")
+
+
+def _index(run: dict) -> Dict[Key, dict]:
+    return {(r["backend"], r["workload"], r["size"]): r for r in run["results"] if r["status"] == "ok"}
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.10, metric: str = "median_ns") -> List[dict]:
+    """Rows for every combination measured in both runs.
+
+    Each row has the baseline/current value of metric, their ratio and a
+    verdict: "regression" if current is more than threshold slower,
+    "improvement" if more than threshold faster, else "same".
+
+    Raises:
+        ValueError: If metric is not one of METRICS
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric!r}, expected one of {METRICS}")
+    before, after = _index(baseline), _index(current)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key][metric], after[key][metric]
+        ratio = new / old if old else float("inf")
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "same"
+        backend, workload, size = key
+        rows.append({"backend": backend, "workload": workload, "size": size,
+                     "baseline": old, "current": new, "ratio": ratio, "verdict": verdict})
+    return rows
+
+
+def format_row(row: dict) -> str:
+    marker = {"regression": "  <-- REGRESSION", "improvement": "  (faster)"}.get(row["verdict"], "")
+    return (f"{row['backend']:<12} | {row['workload']:<16} | {row['size']:>8} | {row['baseline'] / 1000:>10.2f} | "
+            f"{row['current'] / 1000:>10.2f} | {row['ratio']:>6.2f}x{marker}")
+
+
+HEADER = f"{'Backend':<12} | {'Workload':<16} | {'Size':>8} | {'Before us':>10} | {'After us':>10} | {'Ratio':>7}"
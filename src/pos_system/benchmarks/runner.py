@@ -0,0 +1,169 @@
+"""Run workloads against tree backends and summarise per-operation latency."""
+import contextlib
+import inspect
+import os
+import platform
+import random
+import sys
+import time
+from collections import deque
+from datetime import datetime, timezone
+from itertools import takewhile
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from src.pos_system.common.logger import WARNING, configure_logging, logging_settings
+from src.pos_system.common.tree_registry import UnsupportedOperation, backend_names, create_tree
+from src.pos_system.benchmarks.workloads import WORKLOADS, Workload
+
+# Backends without rebalancing: sorted input makes them linked lists
+UNBALANCED = {"bst", "array_bst", "loyalty_bst", "sales_bst"}
+
+
+def percentile(sorted_values: Sequence[int], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100)) # Ceiling of n * q / 100
+    return float(sorted_values[int(rank) - 1])
+
+
+def _preload(tree, keys: List[int], seed: int):
+    """Insert the workload's starting keys (untimed), bulk-loading when possible"""
+    if not keys:
+        return tree
+    if hasattr(tree, "from_sorted"):
+        return type(tree).from_sorted((key, None) for key in keys)
+    shuffled = keys[:]
+    random.Random(seed).shuffle(shuffled)
+    for key in shuffled:
+        tree.insert(key)
+    return tree
+
+
+def _operation_table(tree) -> Dict[str, object]:
+    table = {"insert": tree.insert, "search": tree.search, "delete": tree.delete}
+    if hasattr(tree, "iter_range"):
+        table["range"] = lambda low, high: deque(tree.iter_range(low, high), maxlen=0)
+    elif "start" in inspect.signature(tree.traverse).parameters: # Resumable in-order walk
+        table["range"] = lambda low, high: deque(takewhile(lambda node: node.key <= high, tree.traverse(start=low)), maxlen=0)
+    return table
+
+
+def run_once(backend: str, workload: Workload, seed: int = 0) -> List[int]:
+    """Time every operation of workload on a fresh tree, returning latencies in ns
+
+    Raises:
+        UnsupportedOperation: If the backend cannot run one of the operations
+    """
+    tree = _preload(create_tree(backend), workload.preload, seed)
+    table = _operation_table(tree)
+    needed = {name for name, _ in workload.operations}
+    if not needed <= table.keys():
+        raise UnsupportedOperation(f"{backend} has no {sorted(needed - table.keys())} operation")
+    latencies = []
+    record = latencies.append
+    clock = time.perf_counter_ns
+    for name, args in workload.operations:
+        function = table[name]
+        start = clock()
+        function(*args)
+        record(clock() - start)
+    return latencies
+
+
+def summarise(latencies: List[int]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    return {
+        "ops": len(ordered),
+        "mean_ns": total / len(ordered) if ordered else 0.0,
+        "median_ns": percentile(ordered, 50),
+        "p95_ns": percentile(ordered, 95),
+        "p99_ns": percentile(ordered, 99),
+        "ops_per_sec": len(ordered) * 1e9 / total if total else 0.0,
+    }
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence trees that print or log every operation (eg. the loyalty trees) while timing
+
+    Logging is raised to WARNING without console output, so per-operation
+    messages are neither written to the log file nor counted in latencies.
+    """
+    settings = logging_settings()
+    configure_logging(level=WARNING, console=False)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        configure_logging(**settings)
+
+
+def run_benchmarks(backends: Optional[Iterable[str]] = None, workloads: Optional[Iterable[str]] = None,
+                   sizes: Iterable[int] = (1_000, 10_000), ops: int = 10_000, repeats: int = 5,
+                   warmup: int = 1, max_degenerate: int = 5_000, seed: int = 0, progress=None) -> dict:
+    """Run every (backend, workload, size) combination.
+
+    Each combination runs warmup discarded repeats, then repeats timed ones
+    on fresh trees; latencies of all timed repeats are pooled.
+
+    Args:
+        ops: Timed operations per repeat (the sorted workload always inserts size keys)
+        max_degenerate: Largest size to run the sorted workload on unbalanced backends
+        progress: Optional callable receiving each result as it completes
+
+    Returns:
+        {"meta": {...}, "results": [...]} ready to be written as JSON
+    """
+    backends = list(backends or backend_names())
+    workloads = list(workloads or WORKLOADS)
+    results = []
+    for size in sizes:
+        for workload_name in workloads:
+            workload = WORKLOADS[workload_name](size, ops, seed)
+            for backend in backends:
+                result = {"backend": backend, "workload": workload_name, "size": size}
+                if workload.degenerate and backend in UNBALANCED and size > max_degenerate:
+                    result.update(status="skipped", reason=f"sorted input is quadratic above {max_degenerate}")
+                else:
+                    try:
+                        latencies = []
+                        with _quiet():
+                            for i in range(warmup + repeats):
+                                run = run_once(backend, workload, seed + i)
+                                if i >= warmup:
+                                    latencies.extend(run)
+                        result.update(status="ok", repeats=repeats, **summarise(latencies))
+                    except UnsupportedOperation as error:
+                        result.update(status="unsupported", reason=str(error))
+                    except RecursionError:
+                        result.update(status="error", reason="RecursionError (tree too deep for a recursive implementation)")
+                results.append(result)
+                if progress:
+                    progress(result)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "ops": ops,
+            "repeats": repeats,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def format_result(result: dict) -> str:
+    head = f"{result['backend']:<12} | {result['workload']:<16} | {result['size']:>8}"
+    if result["status"] != "ok":
+        return f"{head} | {result['status']}: {result.get('reason', '')}"
+    return (f"{head} | {result['median_ns'] / 1000:>9.2f} | {result['p95_ns'] / 1000:>9.2f} | "
+            f"{result['p99_ns'] / 1000:>9.2f} | {result['ops_per_sec']:>12,.0f}")
+
+
+HEADER = (f"{'Backend':<12} | {'Workload':<16} | {'Size':>8} | {'Median us':>9} | {'p95 us':>9} | "
+          f"{'p99 us':>9} | {'Ops/sec':>12}")
@@ -0,0 +1,96 @@
+"""Named, seeded benchmark workloads.
+
+A workload is a list of keys to preload (untimed) and a list of timed
+operations ``(name, args)`` where name is "insert", "search", "delete" or
+"range" (args ``(low, high)``, inclusive). Keys are even integers
+``0, 2, ..., 2(n-1)`` so odd keys are guaranteed misses / fresh inserts.
+"""
+import random
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Callable, Dict, List, Tuple
+
+Operation = Tuple[str, tuple]
+
+
+@dataclass
+class Workload:
+    name: str
+    size: int
+    preload: List[int] = field(default_factory=list)
+    operations: List[Operation] = field(default_factory=list)
+    degenerate: bool = False # Feeds sorted keys, quadratic for unbalanced trees
+
+
+def _keys(n: int) -> List[int]:
+    return list(range(0, 2 * n, 2))
+
+
+def uniform(n: int, ops: int, seed: int) -> Workload:
+    """Searches for preloaded keys drawn uniformly at random"""
+    rng = random.Random(seed)
+    keys = _keys(n)
+    return Workload("uniform", n, keys, [("search", (rng.choice(keys),)) for _ in range(ops)])
+
+
+def zipf(n: int, ops: int, seed: int, s: float = 1.1) -> Workload:
+    """Searches skewed by Zipf(s): rank r is drawn with weight 1 / r**s.
+
+    Ranks are assigned to keys in random order, so hot keys are scattered
+    through the key space rather than clustered at one end.
+    """
+    rng = random.Random(seed)
+    keys = _keys(n)
+    by_rank = keys[:]
+    rng.shuffle(by_rank)
+    cumulative = list(accumulate(1.0 / rank ** s for rank in range(1, n + 1)))
+    total = cumulative[-1]
+    operations = [("search", (by_rank[min(bisect_left(cumulative, rng.random() * total), n - 1)],)) for _ in range(ops)]
+    return Workload("zipf", n, keys, operations)
+
+
+def sorted_inserts(n: int, ops: int, seed: int) -> Workload:
+    """Builds the tree from ascending keys (the timed operations are the inserts)"""
+    return Workload("sorted", n, [], [("insert", (key,)) for key in _keys(n)], degenerate=True)
+
+
+def sequential_range(n: int, ops: int, seed: int, width: int = 100) -> Workload:
+    """Range scans of width keys over consecutive windows, wrapping at the end"""
+    keys = _keys(n)
+    window = min(width, n)
+    operations = []
+    for i in range(ops):
+        start = (i * window) % max(n - window + 1, 1)
+        operations.append(("range", (keys[start], keys[start + window - 1])))
+    return Workload("sequential-range", n, keys, operations)
+
+
+def delete_heavy(n: int, ops: int, seed: int) -> Workload:
+    """50% deletes of live keys, 30% inserts of fresh keys, 20% searches"""
+    rng = random.Random(seed)
+    live = _keys(n)
+    next_key = 1    # Odd keys were never preloaded
+    operations = []
+    for _ in range(ops):
+        roll = rng.random()
+        if roll < 0.5 and live:
+            i = rng.randrange(len(live))
+            live[i], live[-1] = live[-1], live[i]
+            operations.append(("delete", (live.pop(),)))
+        elif roll < 0.8 or not live:
+            operations.append(("insert", (next_key,)))
+            live.append(next_key)
+            next_key += 2
+        else:
+            operations.append(("search", (rng.choice(live),)))
+    return Workload("delete-heavy", n, _keys(n), operations)
+
+
+WORKLOADS: Dict[str, Callable[[int, int, int], Workload]] = {
+    "uniform": uniform,
+    "zipf": zipf,
+    "sorted": sorted_inserts,
+    "sequential-range": sequential_range,
+    "delete-heavy": delete_heavy,
+}
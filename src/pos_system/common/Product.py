@@ -8,14 +8,18 @@ class Product:
         category (str): The category of the product.
         price (float): The price of the product.
         quantity (int): The available stock quantity of the product.
+        reorder_level (int): Stock quantity below which the product should be reordered.
+        reorder_quantity (int): Quantity to order when restocking.
     """
 
-    def __init__(self, product_id: str, name: str, category: str, price: float, quantity: int):
+    def __init__(self, product_id: str, name: str, category: str, price: float, quantity: int, reorder_level: int = 0, reorder_quantity: int = 0):
         self.product_id = product_id
         self.name = name
         self.category = category
         self.price = price
         self.quantity = quantity
+        self.reorder_level = reorder_level
+        self.reorder_quantity = reorder_quantity
 
     def __repr__(self):
         return f"Product(id={self.product_id}, name={self.name}, category={self.category}, price={self.price}, quantity={self.quantity})"
\ No newline at end of file
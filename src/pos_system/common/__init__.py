@@ -1,5 +1,6 @@
 """Common utilities and interfaces for tree modules."""
 
-from .interfaces import Node, TreeInterface
+from .interfaces import Node, TreeInterface, UnsupportedOperation
+from .tree_registry import backend_names, create_tree, register_backend
 
-__all__ = ["Node", "TreeInterface"]
+__all__ = ["Node", "TreeInterface", "UnsupportedOperation", "backend_names", "create_tree", "register_backend"]
@@ -4,11 +4,16 @@ This module provides helper functions to load sample data from CSV files
 and populate tree structures for testing and algorithm analysis.
 """
 import csv
+import os
+import pickle
+import zlib
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Set, Tuple, Type, Union
 from src.pos_system.common.Customer import Customer
-from src.pos_system.common.logger import log_operation, timed_operation
-import time
+from src.pos_system.common.Product import Product
+from src.pos_system.common.journal import replay_journal, write_snapshot
+from src.pos_system.common.logger import WARNING, log_operation, timed_operation
 
 def get_data_path(module_name: str, filename: str) -> Path:
     """Get the full path to a data file.
@@ -25,15 +30,91 @@ def get_data_path(module_name: str, filename: str) -> Path:
     return base_path / module_name / filename
 
 
-def load_csv(module_name: str, filename: str) -> List[Dict[str, Any]]:
+# In-process parse cache: (resolved path, kind) -> (source signature, parsed data)
+_parse_cache: Dict[Tuple[Path, str], Tuple[Tuple[int, int], Any]] = {}
+
+PARSE_CACHE_VERSION = 1
+
+
+def _signature(path: Path) -> Tuple[int, int]:
+    """(mtime in ns, size) of a source file; any edit changes at least one"""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def disk_cache_path(path: Union[str, Path], kind: str) -> Path:
+    """Parsed-cache file kept next to a CSV, eg. products.csv.rows.cache"""
+    path = Path(path)
+    return path.with_name(f"{path.name}.{kind}.cache")
+
+
+def _cached_parse(path: Path, kind: str, parse: Callable[[Path], Any], disk_cache: bool) -> Any:
+    """Return parse(path), reusing an earlier result while the file is unchanged.
+
+    The in-process cache is always used. With disk_cache, the parsed data is
+    also pickled next to the CSV so the next process can skip parsing; the
+    cache file records the source signature and is ignored once it differs.
+    """
+    path = path.resolve()
+    signature = _signature(path)
+    cached = _parse_cache.get((path, kind))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = None
+    cache_file = disk_cache_path(path, kind)
+    if disk_cache and cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                version, cached_signature, cached_data = pickle.load(f)
+            if version == PARSE_CACHE_VERSION and tuple(cached_signature) == signature:
+                data = cached_data
+        except Exception as error: # Unreadable, wrong shape or stale class path: reparse
+            log_operation(f"Ignoring parse cache {cache_file}: {error}", level=WARNING)
+    if data is None:
+        data = parse(path)
+        if disk_cache:  # Write to a temp file and rename, so readers never see half a cache
+            temp_file = cache_file.with_name(cache_file.name + ".tmp")
+            with open(temp_file, 'wb') as f:
+                pickle.dump((PARSE_CACHE_VERSION, signature, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+    _parse_cache[(path, kind)] = (signature, data)
+    return data
+
+
+def invalidate_parse_cache(path: Optional[Union[str, Path]] = None, disk: bool = False) -> None:
+    """Drop cached parses of one CSV file, or of every file when path is None.
+
+    Args:
+        path: Source CSV whose entries to drop
+        disk: Also delete the matching on-disk cache files
+    """
+    resolved = Path(path).resolve() if path is not None else None
+    for cache_path, kind in list(_parse_cache):
+        if resolved is None or cache_path == resolved:
+            del _parse_cache[(cache_path, kind)]
+            if disk:
+                disk_cache_path(cache_path, kind).unlink(missing_ok=True)
+
+
+def _parse_rows(path: Path) -> List[Dict[str, Any]]:
+    with open(path, 'r') as f:
+        return list(csv.DictReader(f))
+
+
+def load_csv(module_name: str, filename: str, disk_cache: bool = False) -> List[Dict[str, Any]]:
     """Load a CSV file and return as list of dicts.
+
+    Parsed rows are cached per (path, mtime, size), so repeated loads of an
+    unchanged file only copy the cached rows.
     
     Args:
         module_name: One of 'inventory', 'sales', or 'loyalty'
         filename: Name of the CSV file
+        disk_cache: Also keep a parsed copy next to the CSV for later runs
     
     Returns:
-        List of dictionaries, one per row
+        List of dictionaries, one per row (fresh dicts, safe to modify)
         
     Raises:
         FileNotFoundError: If the file does not exist
@@ -43,107 +124,236 @@ def load_csv(module_name: str, filename: str) -> List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"Data file not found: {path}")
     
-    rows = []
-    with open(path, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            rows.append(row)
-    
-    return rows
+    rows = _cached_parse(path, "rows", _parse_rows, disk_cache)
+    return [dict(row) for row in rows]
 
 
-def load_inventory_products(filename: str = "products.csv") -> List[Dict[str, Any]]:
+def load_inventory_products(filename: str = "products.csv", disk_cache: bool = False) -> List[Dict[str, Any]]:
     """Load product inventory data.
     
     Returns:
         List of product records with product_id, name, price, quantity
     """
-    return load_csv("inventory", filename)
+    return load_csv("inventory", filename, disk_cache)
 
 
-def load_sales_transactions(filename: str = "transactions.csv") -> List[Dict[str, Any]]:
+def load_sales_transactions(filename: str = "transactions.csv", disk_cache: bool = False) -> List[Dict[str, Any]]:
     """Load sales transaction data.
     
     Returns:
         List of transaction records
     """
-    return load_csv("sales", filename)
+    return load_csv("sales", filename, disk_cache)
 
 
-def load_customers(file_path, bst, avl):
-    try:
-        with open(file_path, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            customers = [
-                Customer(
-                    customer_id=row['customer_id'],
-                    name=row['name'],
-                    loyalty_points=int(row['loyalty_points']),
-                    tier=row['tier'],
-                    join_date=row['join_date']
-                ) for row in reader
-            ]
-
-        # --------- BST insertion ---------
-        start_bst = time.perf_counter()
-        for customer in customers:
-            bst.insert(customer)
-        end_bst = time.perf_counter()
-        total_bst_duration = end_bst - start_bst
+@dataclass
+class RecordSchema:
+    """How to turn one CSV row into a typed record.
+
+    Attributes:
+        record_class: Called with one keyword argument per field
+        fields: (column, converter) pairs in constructor argument order; the
+            column name is also the keyword
+        defaults: Values for columns that are missing or empty
+    """
+    record_class: Type
+    fields: Tuple[Tuple[str, Callable[[str], Any]], ...]
+    defaults: Dict[str, Any] = field(default_factory=dict)
+
+
+PRODUCT_SCHEMA = RecordSchema(Product, (
+    ("product_id", str), ("name", str), ("category", str), ("price", float),
+    ("quantity", int), ("reorder_level", int), ("reorder_quantity", int),
+), defaults={"reorder_level": 0, "reorder_quantity": 0})
 
-        # --------- AVL insertion ---------
-        start_avl = time.perf_counter()
+CUSTOMER_SCHEMA = RecordSchema(Customer, (
+    ("customer_id", str), ("name", str), ("loyalty_points", int), ("tier", str), ("join_date", str),
+))
+
+
+@dataclass
+class LoadStats:
+    """Counters filled in while an iter_records stream is consumed"""
+    rows: int = 0
+    loaded: int = 0
+    malformed: int = 0
+    errors: List[str] = field(default_factory=list) # First few malformed rows, for diagnostics
+
+    MAX_ERRORS = 10
+
+
+def iter_records(path: Union[str, Path], schema: RecordSchema, stats: Optional[LoadStats] = None) -> Iterator[Any]:
+    """Stream a CSV file as typed records, one row at a time.
+
+    Rows are converted straight from csv.reader lists (no per-row dict), and
+    nothing is kept after a record is yielded, so memory stays flat however
+    large the file is. Rows with the wrong number of cells or a value the
+    converter rejects are skipped and counted in stats.
+
+    Args:
+        path: CSV file with a header row
+        schema: Columns to read and how to convert them
+        stats: Optional LoadStats updated as the generator advances
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the header lacks a column that has no default
+    """
+    if stats is None:
+        stats = LoadStats()
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        positions = {name: i for i, name in enumerate(header)}
+        missing = [name for name, _ in schema.fields if name not in positions and name not in schema.defaults]
+        if missing:
+            raise ValueError(f"{path} is missing columns {missing}")
+        # (keyword, column index or None, converter, default) resolved once for the whole file
+        plan = [(name, positions.get(name), convert, schema.defaults.get(name)) for name, convert in schema.fields]
+        record_class, width = schema.record_class, len(header)
+        for row in reader:
+            if not row:     # Blank line
+                continue
+            stats.rows += 1
+            try:
+                if len(row) != width:
+                    raise ValueError(f"expected {width} cells, got {len(row)}")
+                kwargs = {}
+                for name, index, convert, default in plan:
+                    cell = row[index] if index is not None else ""
+                    kwargs[name] = convert(cell) if cell != "" or name not in schema.defaults else default
+                record = record_class(**kwargs)
+            except (ValueError, TypeError) as error:
+                stats.malformed += 1
+                if len(stats.errors) < LoadStats.MAX_ERRORS:
+                    stats.errors.append(f"line {reader.line_num}: {error}")
+                continue
+            stats.loaded += 1
+            yield record
+    if stats.malformed:
+        log_operation(f"Skipped {stats.malformed} malformed rows of {stats.rows} in {path}", level=WARNING)
+
+
+def _schema_kind(schema: RecordSchema) -> str:
+    """Cache kind for a schema, eg. "product-1a2b3c4d"
+
+    The suffix is a checksum of the field names, converters and defaults, so
+    two schemas for the same class never share cached rows.
+    """
+    layout = repr(([name for name, _ in schema.fields],
+                   [getattr(convert, "__qualname__", repr(convert)) for _, convert in schema.fields],
+                   sorted(schema.defaults.items())))
+    return f"{schema.record_class.__name__.lower()}-{zlib.crc32(layout.encode('utf-8')):08x}"
+
+
+def load_records(path: Union[str, Path], schema: RecordSchema, disk_cache: bool = False) -> List[Any]:
+    """Load a whole CSV file as typed records, parsing it at most once per change.
+
+    The converted field values are cached per (path, mtime, size) like
+    load_csv; every call builds new record objects from them, so callers may
+    modify the records they get.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the header lacks a column that has no default
+    """
+    names = [name for name, _ in schema.fields]
+
+    def _parse(source: Path) -> List[Tuple]:
+        return [tuple(getattr(record, name) for name in names) for record in iter_records(source, schema)]
+
+    kind = _schema_kind(schema)
+    values = _cached_parse(Path(path), kind, _parse, disk_cache)
+    record_class = schema.record_class
+    return [record_class(*row) for row in values]
+
+
+def iter_inventory_products(filename: str = "products.csv", stats: Optional[LoadStats] = None) -> Iterator[Product]:
+    """Stream inventory data as Product objects.
+
+    Returns:
+        Generator of Product, skipping malformed rows
+    """
+    return iter_records(get_data_path("inventory", filename), PRODUCT_SCHEMA, stats)
+
+
+def sorted_unique_customers(customers: Iterable[Customer]) -> Tuple[List[Customer], int]:
+    """Sort customers by customer_id once, keeping the first row of each id
+
+    The first row wins, as it does when the rows are inserted one by one.
+
+    Returns:
+        The customers in increasing customer_id order and the number of duplicate rows dropped
+    """
+    ordered = sorted(customers, key=lambda customer: customer.customer_id) # Stable: file order within an id
+    unique = [customer for i, customer in enumerate(ordered)
+              if i == 0 or customer.customer_id != ordered[i - 1].customer_id]
+    return unique, len(ordered) - len(unique)
+
+
+def _fill_customer_tree(tree, customers: List[Customer]) -> None:
+    """Bulk-build an empty tree from sorted unique customers, or insert them one by one"""
+    from_sorted = getattr(type(tree), "from_sorted", None)
+    if from_sorted is None or tree.root is not None or tree.points_index is not None:
         for customer in customers:
-            avl.insert(customer)
-        end_avl = time.perf_counter()
-        total_avl_duration = end_avl - start_avl
+            tree.insert(customer)
+        return
+    tree.root = from_sorted(customers).root
+
+
+def load_customers(file_path, bst, avl, journal_path=None):
+    """Load the customer snapshot into both loyalty trees
 
-        print(f"Total BST load duration: {total_bst_duration:.6f} seconds")
-        print(f"Total AVL load duration: {total_avl_duration:.6f} seconds")
-        log_operation(f"Loaded {len(customers)} customers: BST {total_bst_duration:.6f}s, AVL {total_avl_duration:.6f}s")
+    Customers are sorted by id once and each empty tree is built balanced in
+    O(n) with a single summary log line; trees that already hold customers
+    (or have a points index) fall back to inserting one by one. When
+    journal_path is given, changes journaled since the snapshot are replayed
+    over it first (see common.journal).
+    """
+    try:
+        customers, duplicates = sorted_unique_customers(iter_records(file_path, CUSTOMER_SCHEMA))
     except FileNotFoundError:
         log_operation(f"Customer file {file_path} not found. Starting with empty data.")
+        customers, duplicates = [], 0
+    if duplicates:
+        log_operation("Skipped %d duplicate customer ids in %s (first row kept)", duplicates, file_path, level=WARNING)
+
+    if journal_path is not None:
+        by_id = {customer.customer_id: customer for customer in customers}
+        replayed = replay_journal(journal_path, by_id)
+        if replayed:
+            customers = sorted(by_id.values(), key=lambda customer: customer.customer_id)
+            log_operation(f"Replayed {replayed} journal records from {journal_path}")
+
+    # --------- BST build ---------
+    _, total_bst_duration = timed_operation(_fill_customer_tree, bst, customers)
+
+    # --------- AVL build ---------
+    _, total_avl_duration = timed_operation(_fill_customer_tree, avl, customers)
 
+    print(f"Total BST load duration: {total_bst_duration:.6f} seconds")
+    print(f"Total AVL load duration: {total_avl_duration:.6f} seconds")
+    log_operation(f"Loaded {len(customers)} customers: BST {total_bst_duration:.6f}s, AVL {total_avl_duration:.6f}s")
 
-def save_customers(file_path, bst, avl):
-    # --------- Save BST customers ---------
-    def save_bst():
-        customers = bst.inorder_traversal()
-        with open(file_path, 'w', newline='') as csvfile:
-            fieldnames = ['customer_id', 'name', 'loyalty_points', 'tier', 'join_date']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for c in customers:
-                writer.writerow({
-                    'customer_id': c.customer_id,
-                    'name': c.name,
-                    'loyalty_points': c.loyalty_points,
-                    'tier': c.tier,
-                    'join_date': c.join_date
-                })
-
-    _, bst_time = timed_operation(save_bst)
-
-    # --------- Save AVL customers ---------
-    def save_avl():
-        customers = avl.inorder_traversal()
-        with open(file_path, 'w', newline='') as csvfile:
-            fieldnames = ['customer_id', 'name', 'loyalty_points', 'tier', 'join_date']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for c in customers:
-                writer.writerow({
-                    'customer_id': c.customer_id,
-                    'name': c.name,
-                    'loyalty_points': c.loyalty_points,
-                    'tier': c.tier,
-                    'join_date': c.join_date
-                })
-
-    _, avl_time = timed_operation(save_avl)
-
-    print(f"BST save duration: {bst_time:.6f} seconds")
-    print(f"AVL save duration: {avl_time:.6f} seconds")
+
+def save_customers(file_path, bst, avl, journal=None):
+    """Compact: atomically rewrite the customer snapshot once, then empty the journal
+
+    Both trees hold the same customers, so the snapshot is written from the
+    AVL tree only; bst is accepted for callers that pass both.
+
+    Args:
+        file_path: Customer CSV to replace
+        bst: Loyalty BSTTree (not read)
+        avl: Loyalty AVLTree whose customers are written
+        journal: CustomerJournal whose records the new snapshot now covers
+    """
+    customers = avl.inorder_traversal() if avl.root else []
+    rows, save_time = timed_operation(write_snapshot, file_path, customers)
+    if journal is not None:
+        journal.reset()
+    print(f"Customer snapshot save duration: {save_time:.6f} seconds")
+    log_operation(f"Saved {rows} customers to {file_path}")
 
 
 def extract_data_from_common_dataset(input_file: Optional[str] = None) -> Dict[str, int]:
@@ -193,6 +403,8 @@ def extract_data_from_common_dataset(input_file: Optional[str] = None) -> Dict[s
                 'category': row.get('Catagory', '').strip(),
                 'price': row.get('Unit_Price', '0').strip().replace('$', ''),
                 'quantity': row.get('Stock_Quantity', '0').strip(),
+                'reorder_level': row.get('Reorder_Level', '0').strip(),
+                'reorder_quantity': row.get('Reorder_Quantity', '0').strip(),
             }
         
         # Extract sales data (create synthetic transaction records)
@@ -224,7 +436,7 @@ def extract_data_from_common_dataset(input_file: Optional[str] = None) -> Dict[s
     inventory_path = input_file.parent.parent / "inventory" / "products.csv"
     inventory_path.parent.mkdir(parents=True, exist_ok=True)
     with open(inventory_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['product_id', 'name', 'category', 'price', 'quantity'])
+        writer = csv.DictWriter(f, fieldnames=['product_id', 'name', 'category', 'price', 'quantity', 'reorder_level', 'reorder_quantity'])
         writer.writeheader()
         writer.writerows(inventory_products.values())
     
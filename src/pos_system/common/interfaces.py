@@ -15,6 +15,10 @@ class Node(Generic[T]):
     right: Optional["Node[T]"] = None
 
 
+class UnsupportedOperation(Exception):
+    """Raised by a tree for an operation its structure does not provide (eg. delete on a B-tree)"""
+
+
 class TreeInterface(ABC, Generic[T]):
     """A minimal interface that tree implementations should follow."""
 
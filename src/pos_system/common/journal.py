@@ -0,0 +1,176 @@
+"""Write-ahead journal for loyalty customer changes.
+
+customers.csv is the snapshot; every change made after it is appended to a
+journal beside it (customers.csv.journal), one JSON line per change holding
+the customer's full new state or its removal. Records are absolute rather
+than deltas, so replaying a record twice gives the same result.
+
+Each append reaches the OS at once, so a crashed process loses nothing;
+fsync is batched (every sync_every records, or on the first append after
+sync_interval seconds), which bounds what a power loss can take. A final
+line torn by a crash is cut off when the journal is reopened. Recovery
+replays the journal over the snapshot; compaction writes the snapshot once
+to a temp file, fsyncs it, renames it over the old one and then empties the
+journal.
+"""
+import csv
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Union
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.logger import WARNING, log_operation
+
+JOURNAL_SUFFIX = ".journal"
+UPSERT = "upsert"
+DELETE = "delete"
+CUSTOMER_FIELDS = ("customer_id", "name", "loyalty_points", "tier", "join_date")
+
+
+def journal_path_for(snapshot_path: Union[str, Path]) -> Path:
+    """Journal file kept beside a customer snapshot"""
+    return Path(str(snapshot_path) + JOURNAL_SUFFIX)
+
+
+def _drop_torn_tail(path: Path) -> None:
+    """Cut a final line left without its newline by a crash mid-append
+
+    Otherwise the next append would be joined onto it and both records
+    skipped as one unreadable line on replay.
+    """
+    try:
+        f = open(path, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:  # Scan back in blocks for the last newline
+            start = max(0, end - 4096)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b"\n")
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        if end != size:
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+            log_operation("Dropped a torn final record (%d bytes) from journal %s", size - end, path, level=WARNING)
+
+
+class CustomerJournal:
+    """Append-only log of customer changes with batched fsync"""
+
+    def __init__(self, path: Union[str, Path], sync_every: int = 32, sync_interval: float = 1.0):
+        self.path = Path(path)
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.records = 0 # Appended since the journal was opened or last emptied
+        self.syncs = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        _drop_torn_tail(self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def record_customer(self, customer: Customer) -> None:
+        """Journal a customer's current state (registration, points or tier change)"""
+        entry = {"op": UPSERT}
+        for name in CUSTOMER_FIELDS:
+            entry[name] = getattr(customer, name)
+        self._append(entry)
+
+    def record_removal(self, customer_id: str) -> None:
+        self._append({"op": DELETE, "customer_id": customer_id})
+
+    def _append(self, entry: dict) -> None:
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()  # In the OS from here on, even if the process dies
+        self.records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """fsync every record appended so far"""
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self.syncs += 1
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def reset(self) -> None:
+        """Empty the journal once its records are in the snapshot"""
+        self._file.truncate(0)
+        os.fsync(self._file.fileno())
+        self.records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+def replay_journal(path: Union[str, Path], customers: Dict[str, Customer]) -> int:
+    """Apply a journal's records over customers (keyed by customer_id)
+
+    A missing journal applies nothing. Unreadable lines, such as a final
+    line torn by a crash mid-append, are skipped and counted in one warning.
+
+    Returns:
+        The number of records applied
+    """
+    applied = skipped = 0
+    try:
+        f = open(path, encoding="utf-8")
+    except FileNotFoundError:
+        return 0
+    with f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                if entry["op"] == UPSERT:
+                    customer = Customer(*(entry[name] for name in CUSTOMER_FIELDS))
+                    customers[customer.customer_id] = customer
+                elif entry["op"] == DELETE:
+                    customers.pop(entry["customer_id"], None)
+                else:
+                    raise ValueError(f"Unknown journal op {entry['op']!r}")
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+                continue
+            applied += 1
+    if skipped:
+        log_operation("Skipped %d unreadable records in journal %s", skipped, path, level=WARNING)
+    return applied
+
+
+def write_snapshot(path: Union[str, Path], customers: Iterable[Customer]) -> int:
+    """Atomically replace the customer CSV at path and return the rows written
+
+    The rows go to a temp file beside it, which is fsynced and renamed over
+    path, so readers see either the old snapshot or the new one.
+    """
+    path = Path(path)
+    temp_file = path.with_name(path.name + ".tmp")
+    rows = 0
+    with open(temp_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(CUSTOMER_FIELDS)
+        for customer in customers:
+            writer.writerow([getattr(customer, name) for name in CUSTOMER_FIELDS])
+            rows += 1
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_file, path)
+    if hasattr(os, "O_DIRECTORY"):  # Make the rename itself durable (POSIX only)
+        fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    return rows
@@ -1,15 +1,204 @@
-from datetime import datetime
+"""Operation logging with levels and a background file writer.
+
+log_operation prints the message (when console output is on) and queues
+the line for a writer thread, which appends queued lines to the log file
+in batches with the file kept open. The queue is bounded: when it is full,
+callers wait for the writer instead of dropping lines. If the file cannot
+be written, the writer warns once and drops lines rather than blocking
+callers. Queued lines are flushed at interpreter exit.
+
+Messages below the configured level return before any formatting; pass
+arguments separately (``log_operation("Inserted: %s", customer)``) so they
+are only formatted when the level is enabled.
+"""
+import atexit
+import queue
+import sys
+import threading
 import time
+from typing import Optional
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+DEFAULT_LOG_FILE = "customer_log.txt"
+
+_level = INFO
+_console = True
+_path = DEFAULT_LOG_FILE
+_queue_size = 10_000
+_batch_size = 512
+_writer = None
+_writer_lock = threading.Lock()
+_timestamp_cache = (None, "") # (second, formatted timestamp)
+
+
+class AsyncLogWriter:
+    """Background thread appending queued lines to one file in batches
+
+    If the file cannot be opened or written (bad path, disk full), the
+    writer warns once on stderr, records the error and from then on drops
+    lines instead of queueing them, so callers never block on a dead writer.
+    """
+
+    _STOP = None
+
+    def __init__(self, path: str, queue_size: int = 10_000, batch_size: int = 512):
+        self.path = path
+        self.batch_size = batch_size
+        self.batches_written = 0
+        self.error: Optional[BaseException] = None # Set once writing has failed
+        self.dropped = 0 # Lines lost since the failure
+        self._dropped_lock = threading.Lock() # Callers and the writer thread both count drops
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        """Queue one line (including its newline); blocks while the queue is full"""
+        if self.error is not None:
+            self._drop(1)
+            return
+        self._queue.put(line)
+
+    def _drop(self, count: int) -> None:
+        with self._dropped_lock:
+            self.dropped += count
+
+    def _fail(self, error: BaseException) -> None:
+        if self.error is None:
+            self.error = error
+            sys.stderr.write(f"Log writer for {self.path} failed ({error}); log lines are dropped\n")
+
+    def _run(self) -> None:
+        f = None
+        try:
+            f = open(self.path, "a") # Opened once for the writer's lifetime
+        except OSError as error:
+            self._fail(error)
+        while True: # Keeps draining after a failure, so put() and flush() never hang
+            batch = [self._queue.get()]
+            try:    # Take whatever else is already waiting, up to batch_size lines
+                while len(batch) < self.batch_size:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            lines = [line for line in batch if line is not self._STOP]
+            try:
+                if lines and self.error is None:
+                    f.write("".join(lines))
+                    f.flush()
+                    self.batches_written += 1
+                elif lines:
+                    self._drop(len(lines))
+            except Exception as error:
+                self._fail(error)
+                self._drop(len(lines))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if len(lines) != len(batch):
+                break
+        if f is not None:
+            try:
+                f.close()
+            except OSError:
+                pass
+
+    def flush(self) -> None:
+        """Wait until every queued line has been written"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the remaining lines and stop the thread"""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+
+def _get_writer() -> AsyncLogWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AsyncLogWriter(_path, _queue_size, _batch_size)
+    return _writer
+
+
+def configure_logging(level=None, console=None, path=None, queue_size=None, batch_size=None) -> None:
+    """Change logging settings; unspecified settings are kept.
+
+    Args:
+        level: Minimum level written (DEBUG, INFO, WARNING or ERROR)
+        console: Also print each message to stdout
+        path: Log file; the current writer is flushed and replaced
+        queue_size: Maximum lines waiting for the writer
+        batch_size: Maximum lines per file write
+    """
+    global _level, _console, _path, _queue_size, _batch_size
+    if level is not None:
+        _level = level
+    if console is not None:
+        _console = console
+    if path is not None or queue_size is not None or batch_size is not None:
+        shutdown_logging()  # Next message starts a writer with the new settings
+        _path = path if path is not None else _path
+        _queue_size = queue_size if queue_size is not None else _queue_size
+        _batch_size = batch_size if batch_size is not None else _batch_size
+
+
+def logging_settings() -> dict:
+    """Current level and console settings, to restore later with configure_logging(**settings)"""
+    return {"level": _level, "console": _console}
+
+
+def is_enabled(level: int) -> bool:
+    """True if messages at level are logged; lets hot paths skip building messages"""
+    return level >= _level
+
+
+def _timestamp() -> str:
+    global _timestamp_cache
+    second = int(time.time())
+    if _timestamp_cache[0] != second:   # Format once per second
+        _timestamp_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _timestamp_cache[1]
+
+
+def log_operation(message, *args, level: int = INFO):
+    if level < _level:
+        return
+    if args:
+        message = message % args
+    line = f"[{_timestamp()}] {message}"
+    if _console:
+        print(line)  # prints to console
+    _get_writer().write(line + "\n")
+
+
+def flush_logs() -> None:
+    """Block until every logged line is in the log file"""
+    if _writer is not None:
+        _writer.flush()
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the writer thread (a later message starts a new one)"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+
+atexit.register(shutdown_logging)
 
-def log_operation(message):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{timestamp}] {message}")  # prints to console
-    with open("customer_log.txt", "a") as f:
-        f.write(f"[{timestamp}] {message}\n")
 
 def timed_operation(func, *args, **kwargs):
     start = time.perf_counter()
     result = func(*args, **kwargs)
     end = time.perf_counter()
     duration = end - start
-    return result, duration
\ No newline at end of file
+    return result, duration
@@ -0,0 +1,127 @@
+"""Adapters giving every module's trees the common TreeInterface.
+
+TreeInterface is key/value: ``insert(key, value)``, ``search(key)`` returning
+a node with ``key``/``value`` (or None), ``delete(key)`` and ``traverse()``
+yielding nodes in key order; insert replaces the value of an existing key.
+The inventory trees already follow it; the loyalty trees store customers
+keyed by ``customer_id`` and the sales trees use ``search_key``, so they
+are wrapped here. The wrapped tree stays available as ``adapter.tree``.
+Operations a wrapped tree cannot perform raise UnsupportedOperation.
+"""
+from typing import Generator, Optional, TypeVar
+from src.pos_system.common.interfaces import Node, TreeInterface, UnsupportedOperation
+from src.pos_system.common.tree_utils import in_order
+
+T = TypeVar("T")
+
+
+class KeyedRecord:
+    """Value stored in a loyalty tree, which orders records by customer_id"""
+
+    __slots__ = ("customer_id", "value")
+
+    def __init__(self, customer_id, value):
+        self.customer_id = customer_id
+        self.value = value
+
+    def __str__(self):  # Loyalty trees log the records they insert
+        return f"{self.customer_id}: {self.value}"
+
+
+class CustomerTreeAdapter(TreeInterface[T]):
+    """Key/value view of a loyalty BSTTree or AVLTree"""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def insert(self, key: T, value: Optional[object] = None) -> None:
+        if not self.tree.insert(KeyedRecord(key, value)):   # Loyalty trees keep the first record, replace it
+            self.tree.delete(key)
+            self.tree.insert(KeyedRecord(key, value))
+
+    def search(self, key: T) -> Optional[Node[T]]:
+        record = self.tree.search(key)
+        return Node(key, record.value) if record is not None else None
+
+    def delete(self, key: T) -> None:
+        self.tree.delete(key)
+
+    def traverse(self) -> Generator[Node[T], None, None]:
+        if self.tree.root is None:
+            return
+        for record in self.tree.inorder_traversal():
+            yield Node(record.customer_id, record.value)
+
+
+class BTreeAdapter(TreeInterface[T]):
+    """Key/value view of a sales BTree (no delete)"""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def _locate(self, key: T):
+        """(B-tree node, index) holding key, or (None, -1)"""
+        node = self.tree.root
+        while True: # Same descent as BTree._search, but tells a missing key from a None value
+            i = 0
+            while i < len(node.keys) and key > node.keys[i][0]:
+                i += 1
+            if i < len(node.keys) and key == node.keys[i][0]:
+                return node, i
+            if node.leaf:
+                return None, -1
+            node = node.children[i]
+
+    def insert(self, key: T, value: Optional[object] = None) -> None:
+        node, i = self._locate(key)
+        if node is not None:    # BTree.insert would add a second copy of the key, replace in place
+            node.keys[i] = (key, value)
+            return
+        self.tree.insert(key, value)
+
+    def search(self, key: T) -> Optional[Node[T]]:
+        node, i = self._locate(key)
+        return Node(key, node.keys[i][1]) if node is not None else None
+
+    def delete(self, key: T) -> None:
+        raise UnsupportedOperation("BTree does not support delete")
+
+    def traverse(self) -> Generator[Node[T], None, None]:
+        stack = [(self.tree.root, 0)] # (node, index of the next child to visit)
+        while stack:
+            node, i = stack.pop()
+            if node.leaf:
+                for key, value in node.keys:
+                    yield Node(key, value)
+                continue
+            if i > 0:   # Key between child i-1 and child i
+                key, value = node.keys[i - 1]
+                yield Node(key, value)
+            if i < len(node.keys):  # Come back for the next child
+                stack.append((node, i + 1))
+            stack.append((node.children[i], 0))
+
+
+class KeyDataTreeAdapter(TreeInterface[T]):
+    """Key/value view of the sales BST (nodes hold ``key`` and ``data``)"""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def insert(self, key: T, value: Optional[object] = None) -> None:
+        self.tree.insert(key, value)
+
+    def search(self, key: T) -> Optional[Node[T]]:
+        node = self.tree.root
+        while node is not None:
+            if key == node.key:
+                return Node(key, node.data)
+            node = node.left if key < node.key else node.right
+        return None
+
+    def delete(self, key: T) -> None:
+        raise UnsupportedOperation("The sales BST does not support delete")
+
+    def traverse(self) -> Generator[Node[T], None, None]:
+        for node in in_order(self.tree.root):
+            yield Node(node.key, node.data)
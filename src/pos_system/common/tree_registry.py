@@ -0,0 +1,97 @@
+"""Registry of tree backends selectable by name.
+
+Every backend is a zero-argument-or-options factory returning a
+TreeInterface (key/value insert, search, delete, traverse), so module
+builders can take a backend name and benchmarks can swap structures
+without code changes. Factories import their tree lazily, so registering a
+backend never imports another module's code. A backend raises
+UnsupportedOperation (re-exported here) for operations its structure
+lacks, such as delete on the sales trees.
+
+Built-in backends:
+    bst, splay, array_bst   inventory trees (native TreeInterface)
+    avl, loyalty_bst        loyalty AVLTree / BSTTree via CustomerTreeAdapter
+    btree, sales_bst        sales BTree (t=3) / BST via the sales adapters
+"""
+from typing import Callable, Dict, List
+from src.pos_system.common.interfaces import TreeInterface, UnsupportedOperation
+from src.pos_system.common.tree_adapters import BTreeAdapter, CustomerTreeAdapter, KeyDataTreeAdapter
+
+TreeFactory = Callable[..., TreeInterface]
+
+_BACKENDS: Dict[str, TreeFactory] = {}
+
+
+class UnknownBackendError(ValueError):
+    """Raised when a backend name has not been registered"""
+
+
+def register_backend(name: str, factory: TreeFactory, replace: bool = False) -> None:
+    """Make factory available as create_tree(name)
+
+    Raises:
+        ValueError: If name is already registered and replace is False
+    """
+    if name in _BACKENDS and not replace:
+        raise ValueError(f"Tree backend {name!r} is already registered")
+    _BACKENDS[name] = factory
+
+
+def backend_names() -> List[str]:
+    return sorted(_BACKENDS)
+
+
+def get_backend(name: str) -> TreeFactory:
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise UnknownBackendError(f"Unknown tree backend {name!r}, expected one of {backend_names()}") from None
+
+
+def create_tree(name: str, **options) -> TreeInterface:
+    """Build an empty tree of the named backend, passing options to its factory"""
+    return get_backend(name)(**options)
+
+
+def _inventory_bst() -> TreeInterface:
+    from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+    return BinarySearchTree()
+
+
+def _inventory_splay(top_down: bool = True) -> TreeInterface:
+    from src.pos_system.inventory.splay_tree import SplayTree
+    return SplayTree(top_down=top_down)
+
+
+def _inventory_array_bst() -> TreeInterface:
+    from src.pos_system.inventory.array_binary_search_tree import ArrayBinarySearchTree
+    return ArrayBinarySearchTree()
+
+
+def _loyalty_avl() -> TreeInterface:
+    from src.pos_system.loyalty.avl_tree import AVLTree
+    return CustomerTreeAdapter(AVLTree())
+
+
+def _loyalty_bst() -> TreeInterface:
+    from src.pos_system.loyalty.binary_tree import BSTTree
+    return CustomerTreeAdapter(BSTTree())
+
+
+def _sales_btree(t: int = 3) -> TreeInterface:
+    from src.pos_system.sales.transaction_trees import BTree
+    return BTreeAdapter(BTree(t))
+
+
+def _sales_bst() -> TreeInterface:
+    from src.pos_system.sales.transaction_trees import BST
+    return KeyDataTreeAdapter(BST())
+
+
+register_backend("bst", _inventory_bst)
+register_backend("splay", _inventory_splay)
+register_backend("array_bst", _inventory_array_bst)
+register_backend("avl", _loyalty_avl)
+register_backend("loyalty_bst", _loyalty_bst)
+register_backend("btree", _sales_btree)
+register_backend("sales_bst", _sales_bst)
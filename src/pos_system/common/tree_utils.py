@@ -0,0 +1,99 @@
+"""Building blocks shared by the linked binary trees of every module.
+
+build_balanced turns sorted items into a perfectly balanced tree in O(n),
+in_order is the explicit-stack in-order walk behind each tree's traverse(),
+and search_sorted answers a batch of keys in one walk. Nodes only need
+``left``/``right`` links and (for the walks) a ``key``.
+"""
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Generator, Optional, Sequence, TypeVar
+
+N = TypeVar("N")
+
+
+def check_strictly_increasing(keys: Sequence, what: str = "Keys") -> None:
+    """Raise ValueError naming the first pair of keys that is not strictly increasing"""
+    for i in range(1, len(keys)):
+        if not keys[i - 1] < keys[i]:
+            raise ValueError(f"{what} must be strictly increasing: {keys[i - 1]!r} then {keys[i]!r}")
+
+
+def build_balanced(count: int, make_node: Callable[[int, Optional[N], Optional[N], int], N]) -> Optional[N]:
+    """Build a perfectly balanced tree over sorted positions 0..count-1 in O(n)
+
+    The middle position becomes the root of each range, so depth stays
+    O(log n) and sibling heights differ by at most one.
+
+    Args:
+        count: Number of sorted items
+        make_node: Called as make_node(index, left, right, size) once per item,
+            children first; returns the node for items[index]
+
+    Returns:
+        The root, or None when count is 0
+    """
+    def _build(low: int, high: int) -> Optional[N]:
+        if low > high:
+            return None
+        mid = (low + high) // 2
+        left = _build(low, mid - 1)
+        right = _build(mid + 1, high)
+        return make_node(mid, left, right, high - low + 1)
+
+    return _build(0, count - 1)
+
+
+def in_order(root, reverse: bool = False, start: Any = None) -> Generator:
+    """Yield the nodes under root in key order with an explicit stack
+
+    Each node is yielded in O(1) amortized time and degenerate trees cannot
+    overflow the call stack.
+
+    Args:
+        reverse: Yield keys in descending order instead
+        start: Resume from the first key >= start (<= start when reversed)
+    """
+    stack = []
+    node = root
+    while stack or node is not None:
+        while node is not None: # Go down left (right when reversed), skipping keys before start
+            if start is not None and (start < node.key if reverse else node.key < start):
+                node = node.left if reverse else node.right
+            else:
+                stack.append(node)
+                node = node.right if reverse else node.left
+        if not stack:   # Every remaining key is before start
+            return
+        node = stack.pop()
+        yield node # Current node
+        node = node.left if reverse else node.right # Go down the other subtree
+
+
+def search_sorted(root, keys: Sequence) -> Dict[Any, Any]:
+    """Find many keys in one walk, returning {key: node} for the keys present
+
+    A node splits the sorted keys into the ones below it (left subtree) and
+    above it (right), so shared path prefixes are descended once.
+    """
+    ordered = sorted(set(keys))
+    found = {}
+    stack = [(root, 0, len(ordered))]
+    while stack:
+        node, low, high = stack.pop()
+        if node is None or low >= high:
+            continue
+        if high - low == 1: # One key left on this path: plain descent
+            key = ordered[low]
+            while node is not None and key != node.key:
+                node = node.left if key < node.key else node.right
+            if node is not None:
+                found[key] = node
+            continue
+        mid = bisect_left(ordered, node.key, low, high)
+        if mid < high and ordered[mid] == node.key:
+            found[node.key] = node
+            stack.append((node.right, mid + 1, high))
+        else:
+            stack.append((node.right, mid, high))
+        stack.append((node.left, low, mid))
+    return found
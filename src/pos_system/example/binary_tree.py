@@ -6,6 +6,7 @@ straightforward BST implementation intended for teaching and tests.
 from typing import Optional, TypeVar, Generator
 
 from ..common.interfaces import Node, TreeInterface
+from ..common.tree_utils import in_order
 
 T = TypeVar("T")
 
@@ -66,12 +67,10 @@ class BinaryTree(TreeInterface[T]):
 
         self.root = _delete(self.root, key)
 
-    def traverse(self) -> Generator[Node[T], None, None]:
-        def _inorder(n: Optional[Node[T]]):
-            if n is None:
-                return
-            yield from _inorder(n.left)
-            yield n
-            yield from _inorder(n.right)
+    def traverse(self, reverse: bool = False, start: Optional[T] = None) -> Generator[Node[T], None, None]:
+        """In-order traversal with an explicit stack.
 
-        yield from _inorder(self.root)
+        ``reverse`` yields keys in descending order; ``start`` resumes from
+        the first key >= start (<= start when reversed).
+        """
+        return in_order(self.root, reverse, start)
@@ -1,6 +1,8 @@
 """Inventory module: product inventory management implementations."""
 
 from .binary_search_tree import BinarySearchTree, BinarySearchNode
+from .array_binary_search_tree import ArrayBinarySearchTree, ArrayNodeView
 from .splay_tree import SplayTree, SplayNode
+from .sharded_store import ShardedInventoryStore
 
-__all__ = ["BinarySearchTree", "BinarySearchNode", "SplayTree", "SplayNode"]
+__all__ = ["BinarySearchTree", "BinarySearchNode", "ArrayBinarySearchTree", "ArrayNodeView", "SplayTree", "SplayNode", "ShardedInventoryStore"]
@@ -0,0 +1,239 @@
+"""
+Array-backed Binary Search Tree for the inventory module.
+
+Same operations as BinarySearchTree, but nodes are slots in parallel arrays
+instead of Python objects: keys and values in lists, child links and subtree
+sizes in ``array('i')``. Deleted slots go on a free list (chained through the
+left-link array) and are reused by later inserts.
+"""
+from array import array
+from typing import Generic, Iterable, Optional, Tuple, TypeVar, Generator
+from src.pos_system.common.interfaces import TreeInterface
+from src.pos_system.common.tree_utils import build_balanced, check_strictly_increasing
+from src.pos_system.common.Product import Product
+
+T = TypeVar("T")
+
+NIL = -1 # Null child / empty free list
+
+
+class ArrayNodeView(Generic[T]):
+    """Lightweight handle to one slot, exposing the BinarySearchNode attributes"""
+
+    __slots__ = ("_tree", "index")
+
+    def __init__(self, tree: "ArrayBinarySearchTree[T]", index: int):
+        self._tree = tree
+        self.index = index
+
+    @property
+    def key(self) -> T:
+        return self._tree._keys[self.index]
+
+    @property
+    def value(self) -> Optional[Product]:
+        return self._tree._values[self.index]
+
+    @value.setter
+    def value(self, value: Optional[Product]) -> None:
+        self._tree._values[self.index] = value
+
+    @property
+    def left(self) -> Optional["ArrayNodeView[T]"]:
+        return self._tree._view(self._tree._left[self.index])
+
+    @property
+    def right(self) -> Optional["ArrayNodeView[T]"]:
+        return self._tree._view(self._tree._right[self.index])
+
+    @property
+    def size(self) -> int:
+        return self._tree._size[self.index]
+
+    def __repr__(self): # Helpful representation for debugging
+        left = self.left.key if self.left else None
+        right = self.right.key if self.right else None
+        return f"ArrayNodeView(key={self.key}, value={str(self.value)}, left={left}, right={right})"
+
+
+class ArrayBinarySearchTree(TreeInterface[T]):
+    """Binary Search Tree for Product nodes stored in parallel arrays"""
+
+    def __init__(self):
+        self._keys: list = []
+        self._values: list = []
+        self._left = array('i')
+        self._right = array('i')
+        self._size = array('i') # Number of nodes in each subtree (order statistics)
+        self._root = NIL
+        self._free = NIL # Head of the free slot list, chained through _left
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[T, Optional[Product]]]) -> "ArrayBinarySearchTree[T]":
+        """Bulk-load a perfectly balanced tree in O(n).
+
+        Args:
+            items: (key, Product) pairs sorted by strictly increasing key
+
+        Raises:
+            ValueError: If the keys are not strictly increasing
+        """
+        items = list(items)
+        check_strictly_increasing([key for key, _ in items])
+
+        # Slot i holds items[i]; only the links depend on the balanced shape
+        tree = cls()
+        n = len(items)
+        tree._keys = [key for key, _ in items]
+        tree._values = [value for _, value in items]
+        tree._left = array('i', [NIL]) * n
+        tree._right = array('i', [NIL]) * n
+        tree._size = array('i', [1]) * n
+
+        def _node(index: int, left: Optional[int], right: Optional[int], size: int) -> int:
+            tree._left[index] = NIL if left is None else left
+            tree._right[index] = NIL if right is None else right
+            tree._size[index] = size
+            return index
+
+        root = build_balanced(n, _node)
+        tree._root = NIL if root is None else root
+        return tree
+
+    def _view(self, index: int) -> Optional[ArrayNodeView[T]]:
+        return ArrayNodeView(self, index) if index != NIL else None
+
+    @property
+    def root(self) -> Optional[ArrayNodeView[T]]:
+        return self._view(self._root)
+
+    def _allocate(self, key: T, value: Optional[Product]) -> int:
+        """Take a slot from the free list, or append a new one"""
+        index = self._free
+        if index == NIL:
+            self._keys.append(key)
+            self._values.append(value)
+            self._left.append(NIL)
+            self._right.append(NIL)
+            self._size.append(1)
+            return len(self._keys) - 1
+        self._free = self._left[index]
+        self._keys[index] = key
+        self._values[index] = value
+        self._left[index] = NIL
+        self._right[index] = NIL
+        self._size[index] = 1
+        return index
+
+    def _release(self, index: int) -> None:
+        """Push a slot on the free list and drop its references"""
+        self._keys[index] = None
+        self._values[index] = None
+        self._left[index] = self._free
+        self._free = index
+
+    def insert(self, key: T, value: Optional[Product] = None) -> None:
+        if self._root == NIL:   # Empty tree: new slot becomes root
+            self._root = self._allocate(key, value)
+            return
+        keys, left, right = self._keys, self._left, self._right
+        path = [] # Ancestors of the new slot, their subtree sizes grow by one
+        index = self._root
+        while True:
+            path.append(index)
+            node_key = keys[index]
+            if key < node_key:  # Left subtree
+                if left[index] == NIL:  # Found empty slot to insert
+                    left[index] = self._allocate(key, value)
+                    break
+                index = left[index]
+            elif key > node_key:    # Right subtree
+                if right[index] == NIL: # Found empty slot to insert
+                    right[index] = self._allocate(key, value)
+                    break
+                index = right[index]
+            else:   # Key already exists, update value
+                self._values[index] = value
+                return
+        size = self._size
+        for ancestor in path:
+            size[ancestor] += 1
+
+    def _find(self, key: T) -> int:
+        keys, left, right = self._keys, self._left, self._right
+        index = self._root
+        while index != NIL:
+            node_key = keys[index]
+            if key == node_key:
+                return index
+            index = left[index] if key < node_key else right[index]
+        return NIL
+
+    def search(self, key: T) -> Optional[ArrayNodeView[T]]:
+        return self._view(self._find(key))
+
+    def delete(self, key: T) -> None:
+        keys, left, right = self._keys, self._left, self._right
+        path = [] # Ancestors of the released slot, their subtree sizes shrink by one
+        parent = NIL
+        index = self._root
+        while index != NIL and key != keys[index]:
+            path.append(index)
+            parent = index
+            index = left[index] if key < keys[index] else right[index]
+        if index == NIL:    # Key not found
+            return
+
+        # Slot with two children: Move inorder successor's content here
+        if left[index] != NIL and right[index] != NIL:
+            path.append(index)
+            successor_parent = index
+            successor = right[index]
+            while left[successor] != NIL:   # Find smallest key in right subtree
+                path.append(successor)
+                successor_parent = successor
+                successor = left[successor]
+            keys[index] = keys[successor]
+            self._values[index] = self._values[successor]
+            # Release the successor slot instead (has no left child)
+            parent, index = successor_parent, successor
+
+        # Slot with 1 child or no child: Splice its only child into the parent
+        child = left[index] if left[index] != NIL else right[index]
+        if parent == NIL:
+            self._root = child
+        elif left[parent] == index:
+            left[parent] = child
+        else:
+            right[parent] = child
+        self._release(index)
+        size = self._size
+        for ancestor in path:
+            size[ancestor] -= 1
+
+    def __len__(self) -> int:
+        return self._size[self._root] if self._root != NIL else 0
+
+    def traverse(self, reverse: bool = False, start: Optional[T] = None) -> Generator[ArrayNodeView[T], None, None]:
+        """Inorder Traversal (Good for printing sorted order)
+
+        Args:
+            reverse: Yield keys in descending order instead
+            start: Resume from the first key >= start (<= start when reversed)
+        """
+        keys = self._keys
+        near, far = (self._right, self._left) if reverse else (self._left, self._right)
+        stack = []
+        index = self._root
+        while stack or index != NIL:
+            while index != NIL: # Go down left (right when reversed), skipping keys before start
+                if start is not None and (start < keys[index] if reverse else keys[index] < start):
+                    index = far[index]
+                else:
+                    stack.append(index)
+                    index = near[index]
+            if not stack:   # Every remaining key is before start
+                return
+            index = stack.pop()
+            yield ArrayNodeView(self, index)
+            index = far[index] # Go down the other subtree
@@ -2,8 +2,9 @@
 Tan Seng Hooi's Binary Search Tree implementation for the inventory module.
 """
 from dataclasses import dataclass
-from typing import Generic, Optional, TypeVar, Generator
+from typing import Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar, Generator
 from src.pos_system.common.interfaces import TreeInterface
+from src.pos_system.common.tree_utils import build_balanced, check_strictly_increasing, in_order
 from src.pos_system.common.Product import Product
 
 T = TypeVar("T")
@@ -17,6 +18,7 @@ class BinarySearchNode(Generic[T]):
         self.value = value # The Product object (contains other data)
         self.left = None
         self.right = None
+        self.size = 1 # Number of nodes in this subtree (order statistics)
     
     def __repr__(self): # Helpful representation for debugging
         left = self.left.key if self.left else None
@@ -29,20 +31,53 @@ class BinarySearchTree(TreeInterface[T]):
     def __init__(self):
         self.root: Optional[BinarySearchNode[T]] = None
 
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[T, Optional[Product]]]) -> "BinarySearchTree[T]":
+        """Bulk-load a perfectly balanced tree in O(n).
+
+        Args:
+            items: (key, Product) pairs sorted by strictly increasing key
+
+        Raises:
+            ValueError: If the keys are not strictly increasing
+        """
+        items = list(items)
+        check_strictly_increasing([key for key, _ in items])
+
+        def _node(index: int, left, right, size: int) -> BinarySearchNode[T]:
+            node = BinarySearchNode(*items[index])
+            node.left, node.right, node.size = left, right, size
+            return node
+
+        tree = cls()
+        tree.root = build_balanced(len(items), _node)
+        return tree
+
     def insert(self, key: T, value: Optional[BinarySearchNode[T]] = None) -> None:
-        # Helper insertion function for recursion
-        def _insert(node: Optional[BinarySearchNode[T]], key: T, value: Optional[BinarySearchNode[T]]) -> BinarySearchNode[T]:
-            if node is None:    # Base case: Found empty slot to insert
-                return BinarySearchNode(key, value)
+        # Iterative descent: sorted loads degenerate the tree into a list,
+        # so a recursive insert would hit the recursion limit
+        if self.root is None:   # Empty tree: new node becomes root
+            self.root = BinarySearchNode(key, value)
+            return
+        path = [] # Ancestors of the new node, their subtree sizes grow by one
+        node = self.root
+        while True:
+            path.append(node)
             if key < node.key:  # Left subtree
-                node.left = _insert(node.left, key, value)
+                if node.left is None:   # Found empty slot to insert
+                    node.left = BinarySearchNode(key, value)
+                    break
+                node = node.left
             elif key > node.key:    # Right subtree
-                node.right = _insert(node.right, key, value)
+                if node.right is None:  # Found empty slot to insert
+                    node.right = BinarySearchNode(key, value)
+                    break
+                node = node.right
             else:   # Key already exists, update value
                 node.value = value
-            return node
-        
-        self.root = _insert(self.root, key, value) # Start from root of tree
+                return
+        for ancestor in path:
+            ancestor.size += 1
 
     def search(self, key: T) -> Optional[BinarySearchNode[T]]:
         node = self.root    # Start from root
@@ -52,39 +87,143 @@ class BinarySearchTree(TreeInterface[T]):
             node = node.left if key < node.key else node.right # Traverse left or right
         return None
     
+    def search_many(self, keys: Sequence[T]) -> List[Optional[BinarySearchNode[T]]]:
+        """Look up a batch of keys (eg. a checkout basket).
+
+        Returns the node (or None) for each key, in input order. Plain
+        per-key search: on this tree a shared-prefix walk costs more in
+        sorting and bookkeeping than it saves (see benchmark_search_many).
+        """
+        return [self.search(key) for key in keys]
+
     def delete(self, key: T) -> None:
-        # Helper deletion function for recursion
-        def _delete(node: Optional[BinarySearchNode[T]], key: T) -> Optional[BinarySearchNode[T]]:
-            if node is None:
-                return None
+        # Find the node to delete and its parent without recursion
+        path = [] # Ancestors of the removed node, their subtree sizes shrink by one
+        parent = None
+        node = self.root
+        while node and key != node.key:
+            path.append(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+        if node is None:    # Key not found
+            return
+
+        # Node with two children: Get inorder successor (smallest in right subtree)
+        if node.left is not None and node.right is not None:
+            path.append(node)
+            successor_parent = node
+            successor = node.right
+            while successor.left:   # Find smallest key in right subtree
+                path.append(successor)
+                successor_parent = successor
+                successor = successor.left
+            # Copy successor's content to this node
+            node.key = successor.key
+            node.value = successor.value
+            # Delete the inorder successor instead (has no left child)
+            parent, node = successor_parent, successor
+
+        # Node with 1 child or no child: Splice its only child into the parent
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        for ancestor in path:
+            ancestor.size -= 1
+
+    def __len__(self) -> int:
+        return self.root.size if self.root else 0
+
+    def select(self, index: int) -> BinarySearchNode[T]:
+        """Node with the index-th smallest key (0-based) in O(h)
+
+        Raises:
+            IndexError: If index is outside 0..len(tree)-1
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Index {index} out of range for tree of size {len(self)}")
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if index < left_size:   # Target is in left subtree
+                node = node.left
+            elif index > left_size: # Skip left subtree and this node
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node
+
+    def rank(self, key: T) -> int:
+        """Number of keys smaller than key in O(h) (the index key has or would have)"""
+        result = 0
+        node = self.root
+        while node:
             if key < node.key:
-                node.left = _delete(node.left, key)
-            elif key > node.key:
-                node.right = _delete(node.right, key)
+                node = node.left
             else:
-                # Node with 1 child or no child
-                if node.left is None:
-                    return node.right
-                if node.right is None:
-                    return node.left
-                # Node with two children: Get inorder successor (smallest in right subtree)
-                current = node.right
-                while current and current.left: # Find smallest key in right subtree
-                    current = current.left
-                successor = current
-                # Copy successor's content to this node
-                node.key = successor.key
-                node.value = successor.value
-                # Delete the inorder successor
-                node.right = _delete(node.right, successor.key)
-            return node
-        self.root = _delete(self.root, key)
-
-    def traverse(self) -> Generator[BinarySearchNode[T], None, None]:
-        """Inorder Traversal (Good for printing sorted order)"""
-        def _inorder_traversal(node: Optional[BinarySearchNode[T]]) -> Generator[BinarySearchNode[T], None, None]:
-            if node:
-                yield from _inorder_traversal(node.left) # Go down left subtree
-                yield node # Current node (root if first invocation)
-                yield from _inorder_traversal(node.right) # Go down right subtree
-        yield from _inorder_traversal(self.root)
+                if key == node.key:
+                    return result + (node.left.size if node.left else 0)
+                result += (node.left.size if node.left else 0) + 1 # Left subtree and this node are smaller
+                node = node.right
+        return result
+
+    def traverse(self, reverse: bool = False, start: Optional[T] = None) -> Generator[BinarySearchNode[T], None, None]:
+        """Inorder Traversal (Good for printing sorted order)
+
+        Uses an explicit stack, so each node is yielded in O(1) amortized
+        time and degenerate trees cannot overflow the call stack.
+
+        Args:
+            reverse: Yield keys in descending order instead
+            start: Resume from the first key >= start (<= start when reversed)
+        """
+        return in_order(self.root, reverse, start)
+
+    def floor(self, key: T) -> Optional[BinarySearchNode[T]]:
+        """Node with the largest key <= key, or None"""
+        result = None
+        node = self.root
+        while node:
+            if key == node.key:
+                return node
+            if key < node.key:
+                node = node.left
+            else:   # node is a candidate, look for a larger one on the right
+                result = node
+                node = node.right
+        return result
+
+    def ceiling(self, key: T) -> Optional[BinarySearchNode[T]]:
+        """Node with the smallest key >= key, or None"""
+        result = None
+        node = self.root
+        while node:
+            if key == node.key:
+                return node
+            if key > node.key:
+                node = node.right
+            else:   # node is a candidate, look for a smaller one on the left
+                result = node
+                node = node.left
+        return result
+
+    def iter_range(self, low: Optional[T] = None, high: Optional[T] = None) -> Generator[BinarySearchNode[T], None, None]:
+        """Inorder nodes with low <= key <= high (None means unbounded).
+
+        Subtrees entirely below low are never visited and the walk stops at
+        the first key above high, so the cost is O(h + k) for k results.
+        """
+        for node in self.traverse(start=low):
+            if high is not None and node.key > high:    # Past the range, nothing larger can match
+                return
+            yield node
+
+    def iter_prefix(self, prefix: str) -> Generator[BinarySearchNode[T], None, None]:
+        """Inorder nodes whose string key starts with prefix (eg. "29-205-")"""
+        for node in self.iter_range(prefix):
+            if not node.key.startswith(prefix): # Sorted order: first mismatch ends the prefix block
+                return
+            yield node
@@ -0,0 +1,57 @@
+"""
+Category secondary index for the inventory module.
+
+Maps each Product.category to its own BinarySearchTree keyed by product_id,
+so listing or counting one category costs O(k) / O(1) instead of a full
+traversal of the primary tree.
+"""
+from typing import Dict, Generator, Iterable, List
+from src.pos_system.common.Product import Product
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+
+
+class CategoryIndex:
+    """category -> ordered set of product ids (with their Product objects)"""
+
+    def __init__(self):
+        self._trees: Dict[str, BinarySearchTree[str]] = {}
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "CategoryIndex":
+        """Build the index in O(n) from products already sorted by product_id"""
+        groups: Dict[str, List] = {}
+        for product in products:
+            groups.setdefault(product.category, []).append((product.product_id, product))
+        index = cls()
+        for category, items in groups.items():
+            index._trees[category] = BinarySearchTree.from_sorted(items)
+        return index
+
+    def add(self, product: Product) -> None:
+        tree = self._trees.get(product.category)
+        if tree is None:
+            tree = self._trees[product.category] = BinarySearchTree()
+        tree.insert(product.product_id, product)
+
+    def remove(self, product: Product) -> None:
+        tree = self._trees.get(product.category)
+        if tree is None:
+            return
+        tree.delete(product.product_id)
+        if tree.root is None:   # Drop empty categories so categories() stays accurate
+            del self._trees[product.category]
+
+    def categories(self) -> List[str]:
+        return sorted(self._trees)
+
+    def count(self, category: str) -> int:
+        tree = self._trees.get(category)
+        return len(tree) if tree else 0
+
+    def products(self, category: str) -> Generator[Product, None, None]:
+        """Products of one category in product_id order"""
+        tree = self._trees.get(category)
+        if tree is None:
+            return
+        for node in tree.traverse():
+            yield node.value
@@ -0,0 +1,148 @@
+"""
+Columnar shadow store for inventory analytics.
+
+Mirrors the inventory tree as NumPy columns (price, quantity, category code)
+so reports such as total stock value or value per category are one
+vectorized pass instead of a tree traversal with Python arithmetic per node.
+Each product keeps a stable slot while it exists; removed slots are marked
+free (category code -1) and reused by later inserts.
+
+NumPy is optional: HAS_NUMPY is False when it is not installed and
+ColumnarInventory then raises ImportError.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+from src.pos_system.common.Product import Product
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:  # Analytics are unavailable, the rest of the inventory module still works
+    np = None
+    HAS_NUMPY = False
+
+FREE = -1 # Category code of an unused slot
+
+
+class ColumnarInventory:
+    """Price/quantity/category columns keyed by a stable per-product slot"""
+
+    def __init__(self, capacity: int = 1024):
+        if not HAS_NUMPY:
+            raise ImportError("ColumnarInventory requires numpy (pip install numpy)")
+        capacity = max(capacity, 1)
+        self.prices = np.zeros(capacity, dtype=np.float64)
+        self.quantities = np.zeros(capacity, dtype=np.int64)
+        self.category_codes = np.full(capacity, FREE, dtype=np.int32)
+        self.categories: List[str] = [] # code -> category name
+        self._category_codes: Dict[str, int] = {}
+        self._slots: Dict[str, int] = {} # product_id -> slot
+        self._free: List[int] = []
+        self._used = 0 # Slots [0, _used) have been handed out at least once
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "ColumnarInventory":
+        """Build the columns in one pass (later duplicates of a product_id win)"""
+        by_id = {product.product_id: product for product in products}
+        store = cls(capacity=len(by_id))
+        n = len(by_id)
+        store.prices[:n] = [p.price for p in by_id.values()]
+        store.quantities[:n] = [p.quantity for p in by_id.values()]
+        store.category_codes[:n] = [store._category_code(p.category) for p in by_id.values()]
+        store._slots = {pid: slot for slot, pid in enumerate(by_id)}
+        store._used = n
+        return store
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _category_code(self, category: str) -> int:
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self.categories)
+            self.categories.append(category)
+        return code
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._used == len(self.prices):  # Grow every column by doubling
+            capacity = 2 * len(self.prices)
+            self.prices = np.resize(self.prices, capacity)
+            self.quantities = np.resize(self.quantities, capacity)
+            codes = np.full(capacity, FREE, dtype=np.int32)
+            codes[:self._used] = self.category_codes[:self._used]
+            self.category_codes = codes
+        self._used += 1
+        return self._used - 1
+
+    def update(self, product: Product) -> None:
+        """Add a product or refresh its columns after a change"""
+        slot = self._slots.get(product.product_id)
+        if slot is None:
+            slot = self._slots[product.product_id] = self._allocate()
+        self.prices[slot] = product.price
+        self.quantities[slot] = product.quantity
+        self.category_codes[slot] = self._category_code(product.category)
+
+    def remove(self, product_id: str) -> None:
+        slot = self._slots.pop(product_id, None)
+        if slot is None:
+            return
+        self.prices[slot] = 0.0
+        self.quantities[slot] = 0
+        self.category_codes[slot] = FREE
+        self._free.append(slot)
+
+    def _live(self, category: Optional[str] = None):
+        """Boolean mask over the used slots: every product, or one category's"""
+        codes = self.category_codes[:self._used]
+        if category is None:
+            return codes != FREE
+        code = self._category_codes.get(category)
+        if code is None:
+            return np.zeros(self._used, dtype=bool)
+        return codes == code
+
+    def total_value(self) -> float:
+        """Sum of price * quantity over all products (free slots hold zeros)"""
+        n = self._used
+        return float(np.dot(self.prices[:n], self.quantities[:n]))
+
+    def value_by_category(self) -> Dict[str, float]:
+        """Stock value (price * quantity) per category that has products"""
+        live = self._live()
+        codes = self.category_codes[:self._used][live]
+        values = self.prices[:self._used][live] * self.quantities[:self._used][live]
+        totals = np.bincount(codes, weights=values, minlength=len(self.categories))
+        counts = np.bincount(codes, minlength=len(self.categories))
+        return {self.categories[code]: float(totals[code]) for code in np.flatnonzero(counts)}
+
+    def quantity_by_category(self) -> Dict[str, int]:
+        """Units in stock per category that has products"""
+        live = self._live()
+        codes = self.category_codes[:self._used][live]
+        totals = np.bincount(codes, weights=self.quantities[:self._used][live], minlength=len(self.categories))
+        counts = np.bincount(codes, minlength=len(self.categories))
+        return {self.categories[code]: int(totals[code]) for code in np.flatnonzero(counts)}
+
+    def mean_price(self, category: Optional[str] = None) -> float:
+        """Mean unit price of all products, or of one category
+
+        Raises:
+            ValueError: If no product matches
+        """
+        prices = self.prices[:self._used][self._live(category)]
+        if prices.size == 0:
+            raise ValueError(f"No products in {category or 'inventory'}")
+        return float(prices.mean())
+
+    def price_percentiles(self, percentiles: Sequence[float], category: Optional[str] = None) -> List[float]:
+        """Unit price at each percentile (0-100), over all products or one category
+
+        Raises:
+            ValueError: If no product matches
+        """
+        prices = self.prices[:self._used][self._live(category)]
+        if prices.size == 0:
+            raise ValueError(f"No products in {category or 'inventory'}")
+        return [float(value) for value in np.percentile(prices, percentiles)]
@@ -1,9 +1,13 @@
-from src.pos_system.common.data_loader import load_inventory_products
+import random
+from src.pos_system.common.data_loader import PRODUCT_SCHEMA, get_data_path, load_records
+from src.pos_system.common.interfaces import TreeInterface
+from src.pos_system.common.tree_registry import create_tree
 from src.pos_system.common.Product import Product
 from src.pos_system.inventory.binary_search_tree import BinarySearchTree, BinarySearchNode
 from src.pos_system.inventory.splay_tree import SplayTree, SplayNode
+from src.pos_system.inventory.name_index import NameIndex
 from enum import Enum
-from typing import Type, Union, List
+from typing import Iterable, Type, Union, List, Tuple
 
 KeyType = Union[int, str]
 
@@ -11,29 +15,15 @@ class InventoryKeyType(Enum):
     PRODUCT_ID = 1
     PRODUCT_NAME = 2
 
-def build_inventory_bst(key_type: InventoryKeyType = InventoryKeyType.PRODUCT_ID, class_type: Type[KeyType] = str, entries: int = -1) -> BinarySearchTree:
-    """Build a binary search tree of products from inventory data.
-    
-    Returns:
-        BinarySearchTree with product_id or name as keys and Product objects as values
-    """
+def sorted_product_items(products: Iterable[Product], key_type: InventoryKeyType = InventoryKeyType.PRODUCT_ID, class_type: Type[KeyType] = str) -> List[Tuple[KeyType, Product]]:
+    """Return (key, Product) pairs sorted by key, ready for from_sorted.
 
-    # Setup and load data
-    product_records = load_inventory_products()
-    if entries > 0:
-        product_records = product_records[:entries]
+    Duplicate keys keep the last record, matching repeated inserts.
+    """
 
-    bst = BinarySearchTree()
-    
     # Node key creation
-    for record in product_records:
-        product = Product(
-            product_id=str(record["product_id"]),
-            name=str(record["name"]),
-            category=str(record["category"]),
-            price=float(record["price"]),
-            quantity=int(record["quantity"])
-        )
+    products_by_key = {}
+    for product in products:
 
         if key_type == InventoryKeyType.PRODUCT_ID:
             raw_key = product.product_id
@@ -45,46 +35,62 @@ def build_inventory_bst(key_type: InventoryKeyType = InventoryKeyType.PRODUCT_ID
         else:
             node_key = product.name
 
-        node = BinarySearchNode(key=node_key, value=product)
-        bst.insert(node.key, node.value)
-    
-    return bst
+        products_by_key[node_key] = product # Later duplicates overwrite earlier ones
+
+    return sorted(products_by_key.items(), key=lambda item: item[0]) # Sort once for the bulk load
+
+def _sorted_product_items(key_type: InventoryKeyType, class_type: Type[KeyType], entries: int) -> List[Tuple[KeyType, Product]]:
+    """Load products and return (key, Product) pairs sorted by key."""
+
+    # Setup and load typed data (parsed once per products.csv change)
+    products = load_records(get_data_path("inventory", "products.csv"), PRODUCT_SCHEMA)
+    if entries > 0:
+        products = products[:entries]
+    return sorted_product_items(products, key_type, class_type)
+
+def build_inventory_bst(key_type: InventoryKeyType = InventoryKeyType.PRODUCT_ID, class_type: Type[KeyType] = str, entries: int = -1) -> BinarySearchTree:
+    """Build a binary search tree of products from inventory data.
+
+    Returns:
+        BinarySearchTree with product_id or name as keys and Product objects as values
+    """
+    return BinarySearchTree.from_sorted(_sorted_product_items(key_type, class_type, entries))
 
 def build_inventory_splay_tree(key_type: InventoryKeyType = InventoryKeyType.PRODUCT_ID, class_type: Type[KeyType] = str, entries: int = -1) -> SplayTree:
     """Build a splay tree of products from inventory data.
-    
+
     Returns:
         SplayTree with product_id or name as keys and Product objects as values
     """
+    return SplayTree.from_sorted(_sorted_product_items(key_type, class_type, entries))
 
-    # Setup and load data
-    product_records = load_inventory_products()
-    if entries > 0:
-        product_records = product_records[:entries]
+def build_inventory_tree(backend: str = "bst", key_type: InventoryKeyType = InventoryKeyType.PRODUCT_ID, class_type: Type[KeyType] = str, entries: int = -1, **options) -> TreeInterface:
+    """Build a product tree of any registered backend (see common.tree_registry).
 
-    splay_tree = SplayTree()
-    
-    # Node key creation
-    for record in product_records:
-        product = Product(
-            product_id=str(record["product_id"]),
-            name=str(record["name"]),
-            category=str(record["category"]),
-            price=float(record["price"]),
-            quantity=int(record["quantity"])
-        )
+    Backends with a from_sorted bulk loader use it; the others get the
+    products inserted in a fixed shuffled order, so unbalanced trees are not
+    fed sorted keys.
 
-        if key_type == InventoryKeyType.PRODUCT_ID:
-            raw_key = product.product_id
+    Args:
+        backend: Tree backend name, eg. "bst", "splay", "avl" or "btree"
+        options: Passed to the backend factory
 
-            if class_type is int:
-                node_key = int(raw_key.replace("-", ""))
-            else:
-                node_key = raw_key
-        else:
-            node_key = product.name
+    Returns:
+        TreeInterface with product_id or name as keys and Product objects as values
+    """
+    items = _sorted_product_items(key_type, class_type, entries)
+    tree = create_tree(backend, **options)
+    if hasattr(tree, "from_sorted"):
+        return type(tree).from_sorted(items, **options)
+    random.Random(len(items)).shuffle(items)
+    for key, product in items:
+        tree.insert(key, product)
+    return tree
+
+def build_inventory_name_index(entries: int = -1) -> NameIndex:
+    """Build a name autocomplete index of products from inventory data.
 
-        node = SplayNode(key=node_key, value=product)
-        splay_tree.insert(node.key, node.value)
-    
-    return splay_tree
\ No newline at end of file
+    Returns:
+        NameIndex over every product (duplicate names are kept per product_id)
+    """
+    return NameIndex.from_products(product for _, product in _sorted_product_items(InventoryKeyType.PRODUCT_ID, str, entries))
@@ -1,15 +1,209 @@
+import threading
 import time
+from pathlib import Path
+from itertools import islice
+from typing import Iterator, Optional
 from src.pos_system.inventory.binary_search_tree import BinarySearchTree, BinarySearchNode
 from src.pos_system.inventory.splay_tree import SplayTree, SplayNode
-from src.pos_system.inventory.inventory_data_loader import build_inventory_bst, build_inventory_splay_tree, InventoryKeyType
+from src.pos_system.inventory.inventory_data_loader import build_inventory_bst, build_inventory_splay_tree, sorted_product_items, InventoryKeyType
+from src.pos_system.inventory.category_index import CategoryIndex
+from src.pos_system.inventory.name_index import NameIndex
+from src.pos_system.inventory.low_stock_heap import LowStockHeap
+from src.pos_system.inventory.stock_reservation import Basket, StockReservation, reserve
+from src.pos_system.inventory.columnar_store import HAS_NUMPY, ColumnarInventory
+from src.pos_system.inventory.snapshot import SnapshotError, load_snapshot, save_snapshot
 from src.pos_system.common.Product import Product
-from src.pos_system.common.data_loader import load_inventory_products
-from src.pos_system.common.logger import log_operation, timed_operation
+from src.pos_system.common.data_loader import get_data_path, iter_inventory_products, load_inventory_products
+from src.pos_system.common.logger import ERROR, WARNING, log_operation, timed_operation
 
 class InventoryModule:
 
-    def __init__(self):
-        self.inventory_data_bst = build_inventory_bst(key_type=InventoryKeyType.PRODUCT_ID, class_type=str, entries=100)
+    def __init__(self, snapshot_path: Optional[str] = None, lazy: bool = False, hot_entries: int = 100, analytics: bool = HAS_NUMPY):
+        """Load the inventory tree.
+
+        With snapshot_path, the tree is restored from that binary snapshot
+        when it is newer than products.csv; otherwise it is rebuilt from the
+        CSV and the snapshot is (re)written for the next start.
+
+        With lazy=True, only the first hot_entries rows of products.csv are
+        read before returning; a background thread reads the rest, bulk-builds
+        the full tree and indexes off the lock and swaps them in. Check
+        is_ready or call wait_until_loaded() for completion. Products added,
+        removed or restocked during warmup keep that change: the loader skips
+        their later CSV rows.
+
+        With analytics (the default when NumPy is installed), a columnar
+        mirror of prices/quantities is kept in self.analytics for reports.
+
+        Raises:
+            ValueError: If lazy is combined with snapshot_path
+            ImportError: If analytics is requested without NumPy
+        """
+        if lazy and snapshot_path is not None:
+            raise ValueError("lazy loading cannot be combined with snapshot_path")
+        self._lock = threading.RLock() # Guards the tree and indexes while the loader runs
+        self._loaded = threading.Event()
+        self._changed_during_warmup = set() # product_ids the loader must not overwrite
+        self.load_error: Optional[BaseException] = None
+        self._analytics_enabled = analytics
+        if lazy:
+            rows = iter_inventory_products()
+            tree = BinarySearchTree.from_sorted(sorted_product_items(islice(rows, hot_entries)))
+        else:
+            tree = self._load_tree(snapshot_path)
+        self._install(tree, self._build_indexes(tree))
+        if lazy:    # The loader continues from the same reader, after the hot rows
+            self._loader = threading.Thread(target=self._load_remaining, args=(rows,),
+                                            name="inventory-loader", daemon=True)
+            self._loader.start()
+        else:
+            self._loaded.set()
+
+    def _build_indexes(self, tree: BinarySearchTree) -> tuple:
+        """Secondary indexes over every product in tree (category, name, low stock, analytics)"""
+        products = [node.value for node in tree.traverse()]
+        return (CategoryIndex.from_products(products), NameIndex.from_products(products), LowStockHeap.from_products(products),
+                ColumnarInventory.from_products(products) if self._analytics_enabled else None)
+
+    def _install(self, tree: BinarySearchTree, indexes: tuple) -> None:
+        """Make tree and its _build_indexes() result the live structures"""
+        self.inventory_data_bst = tree
+        self.category_index, self.name_index, self.low_stock, self.analytics = indexes
+
+    def _load_tree(self, snapshot_path: Optional[str]) -> BinarySearchTree:
+        if snapshot_path is None:
+            return build_inventory_bst(key_type=InventoryKeyType.PRODUCT_ID, class_type=str, entries=100)
+        snapshot = Path(snapshot_path)
+        csv_path = get_data_path("inventory", "products.csv")
+        if snapshot.exists() and snapshot.stat().st_mtime >= csv_path.stat().st_mtime:
+            try:
+                return load_snapshot(snapshot, BinarySearchTree)
+            except SnapshotError as error:
+                log_operation(f"Ignoring inventory snapshot: {error}", level=WARNING)
+        tree = build_inventory_bst(key_type=InventoryKeyType.PRODUCT_ID, class_type=str)
+        save_snapshot(tree, snapshot)
+        return tree
+
+    def _load_remaining(self, rows: Iterator[Product]) -> None:
+        """Background thread: read the rows after the hot set and swap in the full catalog.
+
+        The tree is bulk-built with from_sorted off the lock (inserting
+        sorted rows one by one would degenerate it into a chain). Changes
+        made while it builds are replayed onto the new structures before
+        the swap.
+        """
+        try:
+            remaining = sorted_product_items(rows)
+
+            with self._lock:    # Short: the tree still holds only the hot set and warmup changes
+                current = [(node.key, node.value) for node in self.inventory_data_bst.traverse()]
+                changed = self._changed_during_warmup
+                self._changed_during_warmup = set() # Collects changes made during the build
+
+            merged = dict(current)
+            for product_id, product in remaining:
+                if product_id not in changed:   # Later CSV rows win, except over warmup changes
+                    merged[product_id] = product
+            tree = BinarySearchTree.from_sorted(sorted(merged.items()))
+            indexes = self._build_indexes(tree)
+
+            with self._lock:    # Swap in, then replay what changed while building
+                late = {pid: self.find_product(pid) for pid in self._changed_during_warmup}
+                self._install(tree, indexes)
+                for product_id, product in late.items():
+                    if product is None:
+                        self._remove_product(product_id)
+                    else:
+                        self._add_product(product)
+        except Exception as error:
+            self.load_error = error
+            log_operation(f"Background inventory load failed: {error}", level=ERROR)
+        finally:
+            with self._lock:
+                self._changed_during_warmup.clear()
+                self._loaded.set()
+
+    @property
+    def is_ready(self) -> bool:
+        """True once the whole catalog is loaded (always True unless lazy)"""
+        return self._loaded.is_set()
+
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Block until the background load finishes, returning is_ready"""
+        return self._loaded.wait(timeout)
+
+    def _mark_changed(self, product_ids) -> None:
+        if not self._loaded.is_set():   # Warmup: the user's change wins over later CSV rows
+            self._changed_during_warmup.update(product_ids)
+
+    def find_product(self, product_id: str) -> Optional[Product]:
+        with self._lock:
+            node = self.inventory_data_bst.search(product_id)
+            return node.value if node else None
+
+    def add_product(self, product: Product) -> None:
+        """Insert or replace a product and keep the secondary indexes in sync"""
+        with self._lock:
+            self._mark_changed((product.product_id,))
+            self._add_product(product)
+
+    def _add_product(self, product: Product) -> None:
+        existing = self.inventory_data_bst.search(product.product_id)
+        if existing:    # Replacing: the old record may sit under another category
+            self.category_index.remove(existing.value)
+            self.name_index.remove(existing.value)
+        self.inventory_data_bst.insert(product.product_id, product)
+        self.category_index.add(product)
+        self.name_index.add(product)
+        self.low_stock.update(product)
+        if self.analytics is not None:
+            self.analytics.update(product)
+
+    def remove_product(self, product_id: str) -> Optional[Product]:
+        """Delete a product and its index entries, returning it if it existed"""
+        with self._lock:
+            self._mark_changed((product_id,))
+            return self._remove_product(product_id)
+
+    def _remove_product(self, product_id: str) -> Optional[Product]:
+        existing = self.inventory_data_bst.search(product_id)
+        if existing is None:
+            return None
+        product = existing.value
+        self.inventory_data_bst.delete(product_id)
+        self.category_index.remove(product)
+        self.name_index.remove(product)
+        self.low_stock.remove(product_id)
+        if self.analytics is not None:
+            self.analytics.remove(product_id)
+        return product
+
+    def adjust_stock(self, product_id: str, delta: int) -> Optional[Product]:
+        """Add delta (negative for sales) to a product's quantity, returning the product"""
+        with self._lock:
+            node = self.inventory_data_bst.search(product_id)
+            if node is None:
+                return None
+            node.value.quantity += delta
+            self._stock_changed(node.value)
+            return node.value
+
+    def reserve_stock(self, basket: Basket) -> StockReservation:
+        """Decrement every basket line or none of them.
+
+        Returns a StockReservation to commit() once the sale completes or
+        rollback() if it is abandoned. Raises InsufficientStockError (with
+        the short lines) without changing any stock.
+        """
+        with self._lock:
+            return reserve(self.inventory_data_bst, basket, on_change=self._stock_changed, lock=self._lock)
+
+    def _stock_changed(self, product: Product) -> None:
+        with self._lock:
+            self._mark_changed((product.product_id,))
+            self.low_stock.update(product)
+            if self.analytics is not None:
+                self.analytics.update(product)
 
     def _entry(self, message: str, allowed_input: type):
         while True:
@@ -30,13 +224,20 @@ class InventoryModule:
         print("2. Search inventory by id")
         print("3. Delete inventory item by id")
         print("4. Display all inventory items")
-        print("5. Exit")
+        print("5. Display inventory items by page")
+        print("6. Browse inventory by category")
+        print("7. Search inventory by name prefix")
+        print("8. Display items below reorder level")
+        print("9. Stock valuation report")
+        print("10. Exit")
+        if not self.is_ready:
+            print(f"(Catalog loading in background: {len(self.inventory_data_bst)} products so far)")
     
     def operate(self):
         while True:
             self.display_inventory_menu()
-            choice = self._entry("Enter your choice (1-5): ", int)
-            if choice >= 1 and choice <= 5:
+            choice = self._entry("Enter your choice (1-10): ", int)
+            if choice >= 1 and choice <= 10:
                 if choice == 1:
                     self.insert_item()
                 elif choice == 2:
@@ -46,10 +247,20 @@ class InventoryModule:
                 elif choice == 4:
                     self.display_data()
                 elif choice == 5:
+                    self.display_page()
+                elif choice == 6:
+                    self.browse_category()
+                elif choice == 7:
+                    self.complete_name()
+                elif choice == 8:
+                    self.display_low_stock()
+                elif choice == 9:
+                    self.display_valuation()
+                elif choice == 10:
                     print("Exiting Inventory Module...")
                     break
             else:
-                print("Invalid choice. Please enter a number between 1 and 5.")
+                print("Invalid choice. Please enter a number between 1 and 10.")
 
     def insert_item(self):
         print("Please provide:")
@@ -59,22 +270,22 @@ class InventoryModule:
         price = self._entry("Price (eg. 10.59):", float)
         quantity = self._entry("Quantity (eg. 15):", int)
         product = Product(product_id, name, category, price, quantity)
-        node = BinarySearchNode(key=product.product_id, value=product)
         start_bst = time.perf_counter()
-        self.inventory_data_bst.insert(node.key, node.value)
+        self.add_product(product)
         end_bst = time.perf_counter()
         total_bst_duration = end_bst - start_bst
-        print(f"Item inserted in {total_bst_duration*1000*1000:.3f}ns")
+        print(f"Item inserted in {total_bst_duration*1000*1000:.3f}us")
     
     def search_item(self):
         product_id = self._entry("Provide Product ID (eg. 29-205-1132) to search:", str)
         start_bst = time.perf_counter()
-        node = self.inventory_data_bst.search(product_id)
+        item = self.find_product(product_id)
         end_bst = time.perf_counter()
         total_bst_duration = end_bst - start_bst
-        print(f"Item {'found' if node else 'not found'} in {total_bst_duration*1000*1000:.3f}ns")
-        if node:
-            item = node.value
+        print(f"Item {'found' if item else 'not found'} in {total_bst_duration*1000*1000:.3f}us")
+        if item is None and not self.is_ready:
+            print("Catalog is still loading, try again shortly.")
+        if item:
             print(f"\n{'Product ID':<20} | {'Name':<20} | {'Category':<25} | {'Price':<10} | {'Quantity':<10}")
             print("-" * 80)
             print(f"{item.product_id:<20} | {item.name:<20} | {item.category:<25} | ${item.price:<9.2f} | {item.quantity:<10}")
@@ -82,23 +293,110 @@ class InventoryModule:
     def delete_item(self):
         product_id = self._entry("Provide Product ID (eg. 29-205-1132) to delete:", str)
         start_bst = time.perf_counter()
-        item = self.inventory_data_bst.delete(product_id)
+        item = self.remove_product(product_id)
         end_bst = time.perf_counter()
         total_bst_duration = end_bst - start_bst
-        print(f"Item deleted in {total_bst_duration*1000*1000:.3f}ns")
-    
-    def display_data(self):
-        if not self.inventory_data_bst.root:
-            print("No product data...")
+        print(f"Item {'deleted' if item else 'not found'} in {total_bst_duration*1000*1000:.3f}us")
+
+    def display_low_stock(self):
+        with self._lock:
+            items = self.low_stock.below_reorder_level()
+        if not items:
+            print("No items below reorder level.")
+            return
+        print(f"\n{'Product ID':<20} | {'Name':<20} | {'Quantity':<10} | {'Reorder Level':<14} | {'Reorder Qty':<10}")
+        print("-" * 84)
+        for item in items:
+            print(f"{item.product_id:<20} | {item.name:<20} | {item.quantity:<10} | {item.reorder_level:<14} | {item.reorder_quantity:<10}")
+        print(f"Total {len(items)} products below reorder level.")
+
+    def display_valuation(self):
+        if self.analytics is None:
+            print("Stock valuation needs NumPy (pip install numpy).")
+            return
+        start = time.perf_counter()
+        with self._lock:
+            values = self.analytics.value_by_category()
+            quantities = self.analytics.quantity_by_category()
+            total = self.analytics.total_value()
+            count = len(self.analytics)
+            quartiles = self.analytics.price_percentiles([25, 50, 75]) if count else []
+        end = time.perf_counter()
+        print(f"\n{'Category':<25} | {'Units':>8} | {'Stock Value':>14}")
+        print("-" * 53)
+        for category in sorted(values):
+            print(f"{category:<25} | {quantities[category]:>8} | ${values[category]:>13,.2f}")
+        print(f"Total stock value ${total:,.2f} over {count} products (report in {(end - start)*1000*1000:.3f}us)")
+        if quartiles:
+            print(f"Unit price quartiles: ${quartiles[0]:.2f} / ${quartiles[1]:.2f} / ${quartiles[2]:.2f}")
+
+    def complete_name(self):
+        prefix = self._entry("Name prefix (eg. ric):", str)
+        start = time.perf_counter()
+        with self._lock:
+            items = self.name_index.complete(prefix, limit=10)
+        end = time.perf_counter()
+        print(f"{len(items)} matches in {(end - start)*1000*1000:.3f}us")
+        if items:
+            print(f"\n{'Product ID':<20} | {'Name':<20} | {'Category':<25} | {'Price':<10} | {'Quantity':<10}")
+            print("-" * 80)
+            for item in items:
+                print(f"{item.product_id:<20} | {item.name:<20} | {item.category:<25} | ${item.price:<9.2f} | {item.quantity:<10}")
+
+    def browse_category(self):
+        with self._lock:
+            counts = [(category, self.category_index.count(category)) for category in self.category_index.categories()]
+        for category, count in counts:
+            print(f"{category:<25} | {count:>5} products")
+        category = self._entry("Category to list (eg. Dairy):", str)
+        with self._lock:
+            items = list(self.category_index.products(category))
+        count = len(items)
+        if count == 0:
+            print(f"No products in category {category}.")
             return
         print(f"\n{'Product ID':<20} | {'Name':<20} | {'Category':<25} | {'Price':<10} | {'Quantity':<10}")
         print("-" * 80)
-        number_of_items = 0
-        for node in self.inventory_data_bst.traverse():
-            number_of_items+=1
-            item = node.value
+        for item in items:
             print(f"{item.product_id:<20} | {item.name:<20} | {item.category:<25} | ${item.price:<9.2f} | {item.quantity:<10}")
-        print(f"Total {number_of_items} products in inventory.")
-        
+        print(f"Total {count} products in {category}.")
+    
+    def display_page(self):
+        page = self._entry("Page number (eg. 1):", int)
+        page_size = self._entry("Items per page (eg. 20):", int)
+        self.display_data(page=page, page_size=page_size)
+
+    def display_data(self, page: Optional[int] = None, page_size: int = 20):
+        """Print all products, or only the given 1-based page.
+
+        A page starts at select((page - 1) * page_size), so earlier pages are
+        never walked.
+        """
+        with self._lock:    # The background loader may be inserting
+            if not self.inventory_data_bst.root:
+                print("No product data...")
+                return
+            total = len(self.inventory_data_bst)
+            if page is None:
+                nodes = self.inventory_data_bst.traverse()
+            else:
+                offset = (page - 1) * page_size
+                if page < 1 or page_size < 1 or offset >= total:
+                    print(f"No products on page {page}.")
+                    return
+                first = self.inventory_data_bst.select(offset) # Jump straight to the page
+                nodes = islice(self.inventory_data_bst.iter_range(first.key), page_size)
+            print(f"\n{'Product ID':<20} | {'Name':<20} | {'Category':<25} | {'Price':<10} | {'Quantity':<10}")
+            print("-" * 80)
+            number_of_items = 0
+            for node in nodes:
+                number_of_items+=1
+                item = node.value
+                print(f"{item.product_id:<20} | {item.name:<20} | {item.category:<25} | ${item.price:<9.2f} | {item.quantity:<10}")
+            if page is None:
+                print(f"Total {number_of_items} products in inventory.")
+            else:
+                print(f"Page {page} of {(total + page_size - 1) // page_size}: {number_of_items} of {total} products.")
+
 if __name__ == "__main__":
     InventoryModule().operate()
\ No newline at end of file
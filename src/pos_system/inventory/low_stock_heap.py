@@ -0,0 +1,109 @@
+"""
+Low-stock reorder heap for the inventory module.
+
+Indexed binary min-heap keyed on ``quantity - reorder_level``. A position map
+lets a stock change re-sift a single entry in O(log n), and the products
+below their reorder level are always the heap entries with a negative key.
+"""
+import heapq
+from typing import Dict, List, Tuple
+from src.pos_system.common.Product import Product
+
+
+class LowStockHeap:
+    """Indexed min-heap of products ordered by quantity minus reorder level"""
+
+    def __init__(self):
+        self._heap: List[Tuple[int, str]] = [] # (quantity - reorder_level, product_id)
+        self._positions: Dict[str, int] = {} # product_id -> index in _heap
+        self._products: Dict[str, Product] = {}
+
+    @classmethod
+    def from_products(cls, products) -> "LowStockHeap":
+        """Build the heap in O(n) with heapify"""
+        heap = cls()
+        for product in products:
+            heap._products[product.product_id] = product
+        heap._heap = [(p.quantity - p.reorder_level, pid) for pid, p in heap._products.items()]
+        heapq.heapify(heap._heap)
+        heap._positions = {pid: i for i, (_, pid) in enumerate(heap._heap)}
+        return heap
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _swap(self, i: int, j: int) -> None:
+        heap = self._heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self._positions[heap[i][1]] = i
+        self._positions[heap[j][1]] = j
+
+    def _sift_up(self, i: int) -> None:
+        while i > 0:
+            parent = (i - 1) // 2
+            if self._heap[i] >= self._heap[parent]:
+                return
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i: int) -> None:
+        size = len(self._heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < size and self._heap[child] < self._heap[smallest]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+    def update(self, product: Product) -> None:
+        """Add a product or re-key it after its quantity/reorder level changed"""
+        pid = product.product_id
+        self._products[pid] = product
+        entry = (product.quantity - product.reorder_level, pid)
+        i = self._positions.get(pid)
+        if i is None:   # New product goes at the end and sifts up
+            self._heap.append(entry)
+            self._positions[pid] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+        old = self._heap[i]
+        self._heap[i] = entry
+        if entry < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def remove(self, product_id: str) -> None:
+        i = self._positions.pop(product_id, None)
+        if i is None:
+            return
+        del self._products[product_id]
+        last = self._heap.pop()
+        if i == len(self._heap):    # Removed the last entry
+            return
+        old = self._heap[i]
+        self._heap[i] = last # Move the last entry into the hole and restore order
+        self._positions[last[1]] = i
+        if last < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def below_reorder_level(self) -> List[Product]:
+        """Products with quantity < reorder_level, lowest margin first.
+
+        Walks only the heap entries with a negative key, visiting them
+        best-first, so k results cost O(k log k) regardless of heap size.
+        """
+        results = []
+        frontier = [(self._heap[0], 0)] if self._heap and self._heap[0][0] < 0 else []
+        while frontier:
+            (_, pid), i = heapq.heappop(frontier)
+            results.append(self._products[pid])
+            for child in (2 * i + 1, 2 * i + 2): # Children are >= parent, explore only negative ones
+                if child < len(self._heap) and self._heap[child][0] < 0:
+                    heapq.heappush(frontier, (self._heap[child], child))
+        return results
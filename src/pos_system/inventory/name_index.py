@@ -0,0 +1,57 @@
+"""
+Product name autocomplete index for the inventory module.
+
+Keeps (case-folded name, product_id) pairs in a sorted list so every name
+starting with a prefix sits in one contiguous block found with bisect.
+"""
+from bisect import bisect_left
+from typing import Iterable, List, Tuple
+from src.pos_system.common.Product import Product
+
+
+class NameIndex:
+    """Case-insensitive prefix completion over Product.name"""
+
+    def __init__(self):
+        self._keys: List[Tuple[str, str]] = [] # Sorted (folded name, product_id)
+        self._products: List[Product] = [] # Product for the key at the same position
+
+    @classmethod
+    def from_products(cls, products: Iterable[Product]) -> "NameIndex":
+        """Build the index with a single sort"""
+        entries = sorted(((p.name.casefold(), p.product_id), p) for p in products)
+        index = cls()
+        index._keys = [key for key, _ in entries]
+        index._products = [product for _, product in entries]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, product: Product) -> None:
+        key = (product.name.casefold(), product.product_id)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key: # Same product, replace it
+            self._products[position] = product
+            return
+        self._keys.insert(position, key)
+        self._products.insert(position, product)
+
+    def remove(self, product: Product) -> None:
+        key = (product.name.casefold(), product.product_id)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+            del self._products[position]
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Product]:
+        """Up to limit products whose name starts with prefix (ignoring case), in name order"""
+        prefix = prefix.casefold()
+        results = []
+        position = bisect_left(self._keys, (prefix,)) # First key >= prefix
+        while position < len(self._keys) and len(results) < limit:
+            if not self._keys[position][0].startswith(prefix): # End of the prefix block
+                break
+            results.append(self._products[position])
+            position += 1
+        return results
@@ -0,0 +1,169 @@
+"""
+Thread-safe sharded inventory store for concurrent POS terminals.
+
+Products are partitioned across N independent inventory trees, each behind
+its own lock, so terminals working on different shards never wait for each
+other. BinarySearchTree shards use a reader/writer lock (searches do not
+modify the tree); SplayTree shards use an exclusive lock because every
+search splays and therefore writes.
+"""
+import heapq
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Generic, Iterable, Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
+from src.pos_system.common.Product import Product
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.splay_tree import SplayTree
+
+T = TypeVar("T")
+
+
+class ReadWriteLock:
+    """Many concurrent readers or one writer; waiting writers block new readers"""
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read_locked(self):
+        with self._condition:
+            while self._writer or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write_locked(self):
+        with self._condition:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._condition.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+class ExclusiveLock:
+    """Same interface as ReadWriteLock, but readers are exclusive too"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def read_locked(self):
+        with self._lock:
+            yield
+
+    write_locked = read_locked
+
+
+class ShardedInventoryStore(Generic[T]):
+    """Concurrent facade over N inventory trees.
+
+    Keys are hash-partitioned by default. Passing ``boundaries`` (N-1 sorted
+    keys) switches to range partitioning: shard i holds keys in
+    (boundaries[i-1], boundaries[i]], which keeps each shard's keys
+    contiguous and makes ordered listing a simple concatenation.
+    """
+
+    def __init__(self, shards: int = 4, tree_class: Type = BinarySearchTree, boundaries: Optional[Sequence[T]] = None):
+        if boundaries is not None:
+            shards = len(boundaries) + 1
+        if shards < 1:
+            raise ValueError(f"Need at least one shard, got {shards}")
+        self.tree_class = tree_class
+        self.boundaries = list(boundaries) if boundaries is not None else None
+        lock_class = ExclusiveLock if issubclass(tree_class, SplayTree) else ReadWriteLock
+        self._trees = [tree_class() for _ in range(shards)]
+        self._locks = [lock_class() for _ in range(shards)]
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[T, Optional[Product]]], shards: int = 4, tree_class: Type = BinarySearchTree, partition: str = "hash") -> "ShardedInventoryStore[T]":
+        """Bulk-load every shard with from_sorted.
+
+        Args:
+            items: (key, Product) pairs sorted by strictly increasing key
+            partition: "hash", or "range" for equal-sized contiguous key ranges
+        """
+        items = list(items)
+        if partition == "range":
+            step = max(1, -(-len(items) // shards)) # Ceiling division
+            boundaries = [items[i - 1][0] for i in range(step, len(items), step)][:shards - 1]
+            store = cls(tree_class=tree_class, boundaries=boundaries)
+        elif partition == "hash":
+            store = cls(shards=shards, tree_class=tree_class)
+        else:
+            raise ValueError(f"Unknown partition {partition!r}, expected 'hash' or 'range'")
+        groups: List[list] = [[] for _ in store._trees]
+        for key, value in items:    # Each group stays sorted
+            groups[store._shard_of(key)].append((key, value))
+        store._trees = [tree_class.from_sorted(group) for group in groups]
+        return store
+
+    @property
+    def shard_count(self) -> int:
+        return len(self._trees)
+
+    def _shard_of(self, key: T) -> int:
+        if self.boundaries is not None:
+            return bisect_left(self.boundaries, key) # First boundary >= key
+        return hash(key) % len(self._trees)
+
+    def insert(self, key: T, value: Optional[Product] = None) -> None:
+        shard = self._shard_of(key)
+        with self._locks[shard].write_locked():
+            self._trees[shard].insert(key, value)
+
+    def delete(self, key: T) -> None:
+        shard = self._shard_of(key)
+        with self._locks[shard].write_locked():
+            self._trees[shard].delete(key)
+
+    def search(self, key: T) -> Optional[Product]:
+        """Product stored under key, or None.
+
+        Returns the value rather than the node: a node may be moved or
+        rewritten by another thread once the shard lock is released.
+        """
+        shard = self._shard_of(key)
+        with self._locks[shard].read_locked():
+            node = self._trees[shard].search(key)
+            return node.value if node else None
+
+    def __len__(self) -> int:
+        total = 0
+        for tree, lock in zip(self._trees, self._locks):
+            with lock.read_locked():
+                total += len(tree)
+        return total
+
+    def items(self) -> Iterator[Tuple[T, Optional[Product]]]:
+        """All (key, Product) pairs in key order.
+
+        Each shard is snapshotted under its own lock, so the result is
+        consistent per shard but not across shards.
+        """
+        snapshots = []
+        for tree, lock in zip(self._trees, self._locks):
+            with lock.read_locked():
+                snapshots.append([(node.key, node.value) for node in tree.traverse()])
+        if self.boundaries is not None: # Range shards are already in key order
+            for snapshot in snapshots:
+                yield from snapshot
+        else:
+            yield from heapq.merge(*snapshots, key=lambda item: item[0])
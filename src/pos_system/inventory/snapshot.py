@@ -0,0 +1,216 @@
+"""
+Binary snapshot/restore of built inventory trees.
+
+A snapshot stores the tree in pre-order: per node a shape flag byte, its
+subtree size, the key and the Product fields. Restoring replays the nodes
+with a stack of pending right slots, so the tree (and its subtree sizes)
+is rebuilt in one linear pass without comparing any keys.
+
+The body is columnar so restore decodes each field with one C-level call
+instead of unpacking node by node.
+
+File layout (little-endian):
+    header:  magic b"POSINV", version (H), node count (I), CRC32 of body (I)
+    body:    flags (B per node), sizes (I), int keys (q, 0 for string keys),
+             price (d), quantity, reorder_level, reorder_quantity (q each),
+             then the UTF-8 string block length (I) and the block itself:
+             NUL-separated string keys and product_id/name/category, in
+             pre-order (product strings only for nodes with a value)
+"""
+import gc
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Type, Union
+from src.pos_system.common.Product import Product
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree, BinarySearchNode
+from src.pos_system.inventory.splay_tree import SplayTree, SplayNode
+
+MAGIC = b"POSINV"
+VERSION = 1
+
+HAS_LEFT = 1
+HAS_RIGHT = 2
+HAS_VALUE = 4
+INT_KEY = 8
+
+_HEADER = struct.Struct("<6sHII")
+_LENGTH = struct.Struct("<I")
+_COLUMNS = (("B", "flags"), ("I", "sizes"), ("q", "int_keys"), ("d", "prices"),
+            ("q", "quantities"), ("q", "reorder_levels"), ("q", "reorder_quantities"))
+SEPARATOR = "\0"
+
+_NODE_CLASSES = {BinarySearchTree: BinarySearchNode, SplayTree: SplayNode}
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is truncated, corrupt or of another version"""
+
+
+def _node_class(tree_class: Type) -> Type:
+    for base, node_class in _NODE_CLASSES.items():
+        if issubclass(tree_class, base):
+            return node_class
+    raise TypeError(f"Snapshots are not supported for {tree_class.__name__}")
+
+
+def _column_bytes(column: array) -> bytes:
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def save_snapshot(tree: Union[BinarySearchTree, SplayTree], path: Union[str, Path]) -> int:
+    """Write tree to path and return the number of nodes written
+
+    The file is written to a temp file beside path, fsynced and renamed
+    over path, so a crash or full disk leaves the previous snapshot intact.
+
+    Raises:
+        ValueError: If a key or product string contains a NUL character
+    """
+    columns = {name: array(typecode) for typecode, name in _COLUMNS}
+    flags_col, sizes, int_keys = columns["flags"], columns["sizes"], columns["int_keys"]
+    prices, quantities = columns["prices"], columns["quantities"]
+    reorder_levels, reorder_quantities = columns["reorder_levels"], columns["reorder_quantities"]
+    strings = []
+
+    stack = [tree.root] if tree.root else []
+    while stack:    # Pre-order: node, then left subtree, then right subtree
+        node = stack.pop()
+        product = node.value
+        flags = (HAS_LEFT if node.left else 0) | (HAS_RIGHT if node.right else 0)
+        if isinstance(node.key, int):
+            flags |= INT_KEY
+            int_keys.append(node.key)
+        else:
+            int_keys.append(0)
+            strings.append(node.key)
+        if product is not None:
+            flags |= HAS_VALUE
+            prices.append(product.price)
+            quantities.append(product.quantity)
+            reorder_levels.append(product.reorder_level)
+            reorder_quantities.append(product.reorder_quantity)
+            strings.extend((str(product.product_id), product.name, product.category))
+        else:
+            prices.append(0.0)
+            quantities.append(0)
+            reorder_levels.append(0)
+            reorder_quantities.append(0)
+        flags_col.append(flags)
+        sizes.append(node.size)
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+    text = SEPARATOR.join(strings)
+    if text.count(SEPARATOR) != max(len(strings) - 1, 0):
+        raise ValueError("Keys and product strings must not contain NUL characters")
+    blob = text.encode("utf-8")
+    body = b"".join([_column_bytes(columns[name]) for _, name in _COLUMNS] + [_LENGTH.pack(len(blob)), blob])
+    path = Path(path)
+    temp_file = path.with_suffix(".tmp")
+    try:    # Write to a temp file and rename, so a failed write keeps the previous snapshot
+        with open(temp_file, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(sizes), zlib.crc32(body)))
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+    return len(sizes)
+
+
+def load_snapshot(path: Union[str, Path], tree_class: Type = BinarySearchTree):
+    """Rebuild a tree of tree_class (BinarySearchTree or SplayTree) from path
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        SnapshotError: If the header, version or checksum does not match
+    """
+    node_class = _node_class(tree_class)
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise SnapshotError(f"Snapshot too short: {path}")
+    magic, version, count, checksum = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SnapshotError(f"Not an inventory snapshot: {path}")
+    if version != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version} (expected {VERSION}): {path}")
+    body = memoryview(data)[_HEADER.size:]
+    if zlib.crc32(body) != checksum:
+        raise SnapshotError(f"Snapshot checksum mismatch: {path}")
+
+    # Decode every column with a single call each
+    columns = {}
+    offset = 0
+    try:
+        for typecode, name in _COLUMNS:
+            column = array(typecode)
+            end = offset + column.itemsize * count
+            if end > len(body):
+                raise SnapshotError(f"Snapshot truncated: {path}")
+            column.frombytes(body[offset:end])
+            if sys.byteorder != "little":
+                column.byteswap()
+            columns[name] = column
+            offset = end
+        length = _LENGTH.unpack_from(body, offset)[0]
+        offset += _LENGTH.size
+        if offset + length != len(body):
+            raise SnapshotError(f"Snapshot truncated: {path}")
+        strings = str(body[offset:], "utf-8").split(SEPARATOR)
+    except (struct.error, UnicodeDecodeError) as exc:
+        raise SnapshotError(f"Snapshot corrupt: {path}") from exc
+
+    flags_col, sizes, int_keys = columns["flags"], columns["sizes"], columns["int_keys"]
+    prices, quantities = columns["prices"], columns["quantities"]
+    reorder_levels, reorder_quantities = columns["reorder_levels"], columns["reorder_quantities"]
+    tree = tree_class()
+    pending_right = [] # Nodes whose right child comes after their left subtree
+    parent, as_left = None, False # Where the next node attaches
+    next_string = iter(strings).__next__
+    gc_was_enabled = gc.isenabled()
+    gc.disable() # Only new acyclic objects are created, collector passes are pure overhead
+    try:
+        for i in range(count):
+            flags = flags_col[i]
+            key = int_keys[i] if flags & INT_KEY else next_string()
+            product = None
+            if flags & HAS_VALUE:
+                product = Product(next_string(), next_string(), next_string(), prices[i],
+                                  quantities[i], reorder_levels[i], reorder_quantities[i])
+            node = node_class(key, product)
+            node.size = sizes[i]
+            if parent is None:
+                tree.root = node
+            elif as_left:
+                parent.left = node
+            else:
+                parent.right = node
+
+            # Pre-order: descend left first, remember nodes that still need a right child
+            if flags & HAS_LEFT:
+                if flags & HAS_RIGHT:
+                    pending_right.append(node)
+                parent, as_left = node, True
+            elif flags & HAS_RIGHT:
+                parent, as_left = node, False
+            elif pending_right:
+                parent, as_left = pending_right.pop(), False
+            else:
+                parent = None
+    except StopIteration as exc:
+        raise SnapshotError(f"Snapshot corrupt: {path}") from exc
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return tree
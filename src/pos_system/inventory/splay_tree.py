@@ -2,8 +2,10 @@
 Tan Seng Hooi's Splay Tree implementation for the inventory module.
 """
 from dataclasses import dataclass
-from typing import Generic, Optional, TypeVar, Generator
+from itertools import chain
+from typing import Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar, Generator
 from src.pos_system.common.interfaces import TreeInterface
+from src.pos_system.common.tree_utils import build_balanced, check_strictly_increasing, in_order, search_sorted
 from src.pos_system.common.Product import Product
 
 T = TypeVar("T")
@@ -16,6 +18,7 @@ class SplayNode(Generic[T]):
         self.value = value # The Product object (contains other data)
         self.left = None
         self.right = None
+        self.size = 1 # Number of nodes in this subtree (order statistics)
     
     def __repr__(self): # Helpful representation for debugging
         left = self.left.key if self.left else None
@@ -23,16 +26,52 @@ class SplayNode(Generic[T]):
         return f"SplayNode(key={self.key}, value={str(self.value)}, left={left}, right={right})"
 
 class SplayTree(TreeInterface[T]):
-    """Splay Tree for Product nodes"""
+    """Splay Tree for Product nodes
 
-    def __init__(self):
+    By default insert, search and delete use top-down splaying, which splits
+    the tree into left/right trees while descending and reassembles them in
+    a single pass. Pass ``top_down=False`` for the recursive bottom-up
+    splaying (kept for comparison benchmarks).
+    """
+
+    def __init__(self, top_down: bool = True):
         self.root: Optional[SplayNode[T]] = None
+        self.top_down = top_down
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[T, Optional[Product]]], top_down: bool = True) -> "SplayTree[T]":
+        """Bulk-load a perfectly balanced tree in O(n).
+
+        Args:
+            items: (key, Product) pairs sorted by strictly increasing key
+
+        Raises:
+            ValueError: If the keys are not strictly increasing
+        """
+        items = list(items)
+        check_strictly_increasing([key for key, _ in items])
+
+        def _node(index: int, left, right, size: int) -> SplayNode[T]:
+            node = SplayNode(*items[index])
+            node.left, node.right, node.size = left, right, size
+            return node
+
+        tree = cls(top_down=top_down)
+        tree.root = build_balanced(len(items), _node)
+        return tree
+
+    @staticmethod
+    def _update_size(node: SplayNode[T]) -> None:
+        """Recompute subtree size from the children"""
+        node.size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
 
     def _zig(self, node: SplayNode[T]) -> SplayNode[T]:
         """Rotate right"""
         new_root = node.left
         node.left = new_root.right
         new_root.right = node
+        new_root.size = node.size # Same set of nodes as before the rotation
+        self._update_size(node)
         return new_root
     
     def _zag(self, node: SplayNode[T]) -> SplayNode[T]:
@@ -40,6 +79,8 @@ class SplayTree(TreeInterface[T]):
         new_root = node.right
         node.right = new_root.left
         new_root.left = node
+        new_root.size = node.size # Same set of nodes as before the rotation
+        self._update_size(node)
         return new_root
     
     def _splay(self, node: Optional[SplayNode[T]], key: T) -> Optional[SplayNode[T]]:
@@ -76,7 +117,84 @@ class SplayTree(TreeInterface[T]):
                     node.right = self._zig(node.right) # must zig parent first
             return self._zag(node) if node.right else node # zag once (found)
 
+    def _splay_top_down(self, node: Optional[SplayNode[T]], key: T) -> Optional[SplayNode[T]]:
+        """Top-down splay: one root-to-leaf pass, no recursion"""
+        if node is None:
+            return node
+        header = SplayNode(None) # header.right / header.left collect the left / right trees
+        left_max = right_min = header # Largest node of left tree, smallest node of right tree
+        left_links = [] # Nodes linked into the left/right trees, their sizes are fixed up at the end
+        right_links = []
+        while True:
+            if key < node.key:
+                if node.left is None: # End of path
+                    break
+                if key < node.left.key: # zig-zig: rotate right before linking
+                    node = self._zig(node)
+                    if node.left is None:
+                        break
+                right_min.left = node # Link right: node and its right subtree are > key
+                right_min = node
+                right_links.append(node)
+                node = node.left
+            elif key > node.key:
+                if node.right is None: # End of path
+                    break
+                if key > node.right.key: # zag-zag: rotate left before linking
+                    node = self._zag(node)
+                    if node.right is None:
+                        break
+                left_max.right = node # Link left: node and its left subtree are < key
+                left_max = node
+                left_links.append(node)
+                node = node.right
+            else: # Found key
+                break
+        # Reassemble: hang node's subtrees off the left/right trees
+        left_max.right = node.left
+        right_min.left = node.right
+        # Each linked node now hangs off the previous one, so fix sizes bottom-up
+        for linked in reversed(left_links):
+            self._update_size(linked)
+        for linked in reversed(right_links):
+            self._update_size(linked)
+        node.left = header.right
+        node.right = header.left
+        self._update_size(node)
+        return node
+
+    def _splay_root(self, key: T) -> None:
+        """Splay key (or the last node on its search path) to the root"""
+        if self.top_down:
+            self.root = self._splay_top_down(self.root, key)
+        else:
+            self.root = self._splay(self.root, key)
+
     def insert(self, key: T, value: Optional[SplayNode[T]] = None) -> None:
+        if not self.top_down:
+            self._insert_bottom_up(key, value)
+            return
+        if self.root is None:   # Empty tree
+            self.root = SplayNode(key, value)
+            return
+        self.root = self._splay_top_down(self.root, key) # Closest node is now root
+        if key == self.root.key:    # Key already exists, update value
+            self.root.value = value
+            return
+        node = SplayNode(key, value)
+        if key < self.root.key: # Old root and its right subtree go right of new node
+            node.left = self.root.left
+            node.right = self.root
+            self.root.left = None
+        else:   # Old root and its left subtree go left of new node
+            node.right = self.root.right
+            node.left = self.root
+            self.root.right = None
+        self._update_size(self.root)
+        self._update_size(node)
+        self.root = node
+
+    def _insert_bottom_up(self, key: T, value: Optional[SplayNode[T]] = None) -> None:
         # Helper insertion function for recursion
         def _insert(node: Optional[SplayNode[T]], key: T, value: Optional[SplayNode[T]]) -> SplayNode[T]:
             if node is None:    # Base case: Found empty slot to insert
@@ -87,36 +205,149 @@ class SplayTree(TreeInterface[T]):
                 node.right = _insert(node.right, key, value)
             else:   # Key already exists, update value
                 node.value = value
+            self._update_size(node)
             return node
         
         self.root = _insert(self.root, key, value) # Start from root of tree
         self.root = self._splay(self.root, key)  # Splay the inserted node to root
 
     def search(self, key: T) -> Optional[SplayNode[T]]:
-        self.root = self._splay(self.root, key) # Splay the searched node to root
+        self._splay_root(key) # Splay the searched node to root
         if self.root and self.root.key == key:
             return self.root
         return None
     
+    def search_many(self, keys: Sequence[T], splay_each: bool = False) -> List[Optional[SplayNode[T]]]:
+        """Look up a batch of keys (eg. a checkout basket).
+
+        Returns the node (or None) for each key, in input order. By default
+        the keys are answered in one walk that shares path prefixes and only
+        the last key is splayed afterwards, so one basket does not reshape
+        the whole tree. ``splay_each=True`` searches (and splays) key by key.
+        """
+        if splay_each:
+            return [self.search(key) for key in keys]
+        found = search_sorted(self.root, keys)
+        if keys:
+            self._splay_root(keys[-1]) # Single splay for the whole basket
+        return [found.get(key) for key in keys]
+
     def delete(self, key: T) -> None:
         if self.root is None:   # Empty tree
             return
-        self.root = self._splay(self.root, key) # Splay the searched node to root
+        self._splay_root(key) # Splay the searched node to root
         if self.root.key != key:    # Key not found
             return
         if self.root.left is None:  # Key found, but no left subtree
             self.root = self.root.right
         else:   # Key found, has left subtree
             right_subtree = self.root.right
-            self.root = self._splay(self.root.left, key) # Splay the largest of left subtree
+            if self.top_down:   # Splay the largest of left subtree
+                self.root = self._splay_top_down(self.root.left, key)
+            else:
+                self.root = self._splay(self.root.left, key)
             self.root.right = right_subtree
+            self._update_size(self.root)
         return self.root
 
-    def traverse(self) -> Generator[SplayNode[T], None, None]:
-        """Inorder Traversal (Good for printing sorted order)"""
-        def _inorder_traversal(node: Optional[SplayNode[T]]) -> Generator[SplayNode[T], None, None]:
-            if node:
-                yield from _inorder_traversal(node.left) # Go down left subtree
-                yield node # Current node (root if first invocation)
-                yield from _inorder_traversal(node.right) # Go down right subtree
-        yield from _inorder_traversal(self.root)
\ No newline at end of file
+    def __len__(self) -> int:
+        return self.root.size if self.root else 0
+
+    def select(self, index: int) -> SplayNode[T]:
+        """Node with the index-th smallest key (0-based), splayed to root
+
+        Raises:
+            IndexError: If index is outside 0..len(tree)-1
+        """
+        if not 0 <= index < len(self):
+            raise IndexError(f"Index {index} out of range for tree of size {len(self)}")
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if index < left_size:   # Target is in left subtree
+                node = node.left
+            elif index > left_size: # Skip left subtree and this node
+                index -= left_size + 1
+                node = node.right
+            else:
+                break
+        self._splay_root(node.key) # Pay for the descent with a splay
+        return self.root
+
+    def rank(self, key: T) -> int:
+        """Number of keys smaller than key (the index key has or would have)"""
+        if self.root is None:
+            return 0
+        self._splay_root(key) # Root is now key or its predecessor/successor
+        smaller = self.root.left.size if self.root.left else 0
+        return smaller + 1 if self.root.key < key else smaller
+
+    def traverse(self, reverse: bool = False, start: Optional[T] = None) -> Generator[SplayNode[T], None, None]:
+        """Inorder Traversal (Good for printing sorted order)
+
+        Uses an explicit stack, so each node is yielded in O(1) amortized
+        time and degenerate trees cannot overflow the call stack.
+
+        Args:
+            reverse: Yield keys in descending order instead
+            start: Resume from the first key >= start (<= start when reversed)
+
+        Traversal is read-only: it does not splay.
+        """
+        return in_order(self.root, reverse, start)
+
+    def floor(self, key: T) -> Optional[SplayNode[T]]:
+        """Node with the largest key <= key, or None. The result is splayed to root"""
+        if self.root is None:
+            return None
+        self._splay_root(key) # Root is now key or its predecessor/successor
+        if not key < self.root.key:
+            return self.root
+        node = self.root.left   # Predecessor is the largest of left subtree
+        if node is None:
+            return None
+        while node.right:
+            node = node.right
+        self._splay_root(node.key)
+        return self.root
+
+    def ceiling(self, key: T) -> Optional[SplayNode[T]]:
+        """Node with the smallest key >= key, or None. The result is splayed to root"""
+        if self.root is None:
+            return None
+        self._splay_root(key) # Root is now key or its predecessor/successor
+        if not self.root.key < key:
+            return self.root
+        node = self.root.right  # Successor is the smallest of right subtree
+        if node is None:
+            return None
+        while node.left:
+            node = node.left
+        self._splay_root(node.key)
+        return self.root
+
+    def iter_range(self, low: Optional[T] = None, high: Optional[T] = None) -> Generator[SplayNode[T], None, None]:
+        """Inorder nodes with low <= key <= high (None means unbounded).
+
+        The first key of the range is splayed to the root once, then the
+        walk only visits the range itself, so a scan of k keys costs one
+        splay plus O(k) and keeps the amortized bounds.
+        """
+        if low is None:
+            nodes = in_order(self.root)
+        else:
+            start = self.ceiling(low)
+            if start is None:   # Every key is below low
+                return
+            nodes = chain((start,), in_order(start.right))  # Its left subtree is entirely below low
+        for node in nodes:
+            if high is not None and node.key > high:    # Past the range, nothing larger can match
+                return
+            yield node
+
+    def iter_prefix(self, prefix: str) -> Generator[SplayNode[T], None, None]:
+        """Inorder nodes whose string key starts with prefix (eg. "29-205-")"""
+        for node in self.iter_range(prefix):
+            if not node.key.startswith(prefix): # Sorted order: first mismatch ends the prefix block
+                return
+            yield node
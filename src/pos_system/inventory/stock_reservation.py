@@ -0,0 +1,95 @@
+"""
+Atomic multi-item stock reservations for the inventory module.
+
+A reservation decrements every basket line in one pass and keeps an
+in-memory undo log of (product, amount taken), so a basket either takes
+effect as a whole or is reverted in O(k). Rollback adds the amounts back
+rather than restoring old quantities, so stock changes made since the
+reservation (other baskets, restocks) are kept.
+"""
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from src.pos_system.common.Product import Product
+
+Basket = Union[Mapping[str, int], Iterable[Tuple[str, int]]]
+
+
+class InsufficientStockError(ValueError):
+    """Raised when a basket cannot be reserved; no stock was changed"""
+
+    def __init__(self, shortages: Dict[str, Tuple[int, int]]):
+        self.shortages = shortages # product_id -> (requested, available), available -1 if unknown
+        details = ", ".join(
+            f"{pid} (unknown product)" if available < 0 else f"{pid} (requested {requested}, available {available})"
+            for pid, (requested, available) in shortages.items()
+        )
+        super().__init__(f"Insufficient stock for {details}")
+
+
+class StockReservation:
+    """Decrements applied for one basket, pending commit or rollback"""
+
+    def __init__(self, on_change: Optional[Callable[[Product], None]] = None, lock: Optional[ContextManager] = None):
+        self._undo_log: List[Tuple[Product, int]] = [] # (product, amount decremented)
+        self._on_change = on_change # Keeps secondary structures (eg. low-stock heap) in sync
+        self._lock = lock if lock is not None else nullcontext() # Held while rollback changes stock
+        self.active = True
+
+    def _apply(self, product: Product, quantity: int) -> None:
+        self._undo_log.append((product, quantity))
+        product.quantity -= quantity
+        if self._on_change:
+            self._on_change(product)
+
+    def commit(self) -> None:
+        """Keep the decrements and drop the undo log"""
+        if not self.active:
+            raise RuntimeError("Reservation already committed or rolled back")
+        self._undo_log.clear()
+        self.active = False
+
+    def rollback(self) -> None:
+        """Give back every decremented amount, newest first"""
+        with self._lock:
+            if not self.active:
+                raise RuntimeError("Reservation already committed or rolled back")
+            while self._undo_log:
+                product, amount = self._undo_log.pop()
+                product.quantity += amount
+                if self._on_change:
+                    self._on_change(product)
+            self.active = False
+
+
+def reserve(tree, basket: Basket, on_change: Optional[Callable[[Product], None]] = None,
+            lock: Optional[ContextManager] = None) -> StockReservation:
+    """Reserve a basket of (product_id, quantity) lines against an inventory tree.
+
+    Duplicate product ids are summed. All products are fetched with one
+    search_many call (per-key search on BinarySearchTree, one shared walk
+    on SplayTree), then decremented in a single pass; if any line is
+    short or unknown the decrements made so far are undone and
+    InsufficientStockError is raised. A lock, if given, is held by the
+    returned reservation's rollback().
+    """
+    lines: Dict[str, int] = {}
+    for product_id, quantity in (basket.items() if isinstance(basket, Mapping) else basket):
+        if quantity <= 0:
+            raise ValueError(f"Quantity for {product_id} must be positive, got {quantity}")
+        lines[product_id] = lines.get(product_id, 0) + quantity
+
+    product_ids = list(lines)
+    reservation = StockReservation(on_change, lock)
+    shortages: Dict[str, Tuple[int, int]] = {}
+    for product_id, node in zip(product_ids, tree.search_many(product_ids)):
+        requested = lines[product_id]
+        if node is None:
+            shortages[product_id] = (requested, -1)
+        elif node.value.quantity < requested:
+            shortages[product_id] = (requested, node.value.quantity)
+        elif not shortages: # Stop applying once the basket is known to fail
+            reservation._apply(node.value, requested)
+    if shortages:
+        reservation.rollback()
+        raise InsufficientStockError(shortages)
+    return reservation
@@ -1,8 +1,18 @@
 """Loyalty module: customer loyalty and discount implementations."""
 
 from src.pos_system.common.logger import log_operation
+from src.pos_system.loyalty.points_index import PointsIndex
 
-__all__ = ["BinaryTree", "AVLTree"]
+__all__ = ["BinaryTree", "AVLTree", "PointsIndex"]
+
+def enable_points_index(tree):
+    """Attach a PointsIndex to a customer tree, built from its current customers.
+
+    The tree's insert/delete and update_points keep it in sync afterwards,
+    and top_n_customers/range_query use it instead of a full traversal.
+    """
+    tree.points_index = PointsIndex.from_customers(tree.inorder_traversal() if tree.root else [])
+    return tree.points_index
 
 def update_points(tree, customer_id, earned_points):
     updated = False
@@ -21,6 +31,9 @@ def update_points(tree, customer_id, earned_points):
     else:
         customer.tier = "Bronze"
 
+    if getattr(tree, "points_index", None) is not None:
+        tree.points_index.refresh(customer)
+
     log_operation(f"Updated Points: {customer_id}, {old_points} -> {customer.loyalty_points}, Tier: {old_tier} -> {customer.tier}")
     return True
 
@@ -32,6 +45,11 @@ def calculate_discount(customer):
     return 5  # Bronze tier
 
 def top_n_customers(tree, n):
+    """The n customers with the most points, highest first (ties by customer_id)"""
+    if getattr(tree, "points_index", None) is not None:   # Reverse walk of the points index
+        customers = tree.points_index.top(n)
+        log_operation(f"Top {n} customers by points generated")
+        return customers
     # Get all customers in-order
     customers = tree.inorder_traversal()
     # Sort descending by loyalty points
@@ -41,7 +59,12 @@ def top_n_customers(tree, n):
 
 # ----------------- Range Query by Points -----------------
 def range_query(tree, min_points, max_points):
-    customers = tree.inorder_traversal()
-    filtered = [c for c in customers if min_points <= c.loyalty_points <= max_points]
+    """Customers with min_points <= loyalty_points <= max_points, by points then customer_id"""
+    if getattr(tree, "points_index", None) is not None:   # Ordered by points instead of customer_id
+        filtered = tree.points_index.range(min_points, max_points)
+    else:
+        customers = tree.inorder_traversal()
+        filtered = [c for c in customers if min_points <= c.loyalty_points <= max_points]
+        filtered.sort(key=lambda c: c.loyalty_points)   # Stable: ties stay in customer_id order, as in the index
     log_operation(f"Range query for points {min_points} to {max_points} generated ({len(filtered)} customers)")
     return filtered
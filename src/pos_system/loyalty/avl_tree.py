@@ -1,7 +1,8 @@
 """AVL Tree skeleton for loyalty module."""
 from typing import Optional, TypeVar
 from ..common.interfaces import Node, TreeInterface
-from ..common.logger import log_operation
+from ..common.logger import DEBUG, log_operation
+from ..common.tree_utils import build_balanced, check_strictly_increasing
 
 T = TypeVar("T")
 
@@ -15,45 +16,59 @@ class AVLNode:
 class AVLTree(TreeInterface[T]):
     def __init__(self):
         self.root = None
+        self.points_index = None # Optional PointsIndex kept in sync (see loyalty.enable_points_index)
 
-    def insert(self, customer):
-        inserted = False
-        def _insert(node, customer):
-            nonlocal inserted
-            if not node:
-                inserted = True
-                log_operation(f"Inserted: {customer}")
-                return AVLNode(customer)
-
-            if customer.customer_id < node.customer.customer_id:
-                node.left = _insert(node.left, customer)
-            elif customer.customer_id > node.customer.customer_id:
-                node.right = _insert(node.right, customer)
-            else:
-                log_operation(f"Customer {customer.customer_id} already exists.")
-                return node
+    @classmethod
+    def from_sorted(cls, customers):
+        """Build a height-balanced tree in O(n) without per-customer logging
 
-            # Update height
-            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
+        Args:
+            customers: Customers sorted by strictly increasing customer_id
 
-            # Balance factor
-            balance = self.get_balance(node)
+        Raises:
+            ValueError: If the customer_ids are not strictly increasing
+        """
+        customers = list(customers)
+        check_strictly_increasing([customer.customer_id for customer in customers], "Customer ids")
 
-            # Left heavy
-            if balance > 1 and customer.customer_id < node.left.customer.customer_id:
-                return self.right_rotate(node)
-            if balance < -1 and customer.customer_id > node.right.customer.customer_id:
-                return self.left_rotate(node)
-            if balance > 1 and customer.customer_id > node.left.customer.customer_id:
-                node.left = self.left_rotate(node.left)
-                return self.right_rotate(node)
-            if balance < -1 and customer.customer_id < node.right.customer.customer_id:
-                node.right = self.right_rotate(node.right)
-                return self.left_rotate(node)
+        def _node(index, left, right, size):
+            node = AVLNode(customers[index])
+            node.left, node.right = left, right
+            node.height = 1 + max(left.height if left else 0, right.height if right else 0)
             return node
 
-        self.root = _insert(self.root, customer)
-        return inserted
+        tree = cls()
+        tree.root = build_balanced(len(customers), _node)
+        return tree
+
+    def insert(self, customer):
+        key = customer.customer_id
+        path = [] # Nodes from the root down to the new node's parent
+        node = self.root
+        while node:
+            node_key = node.customer.customer_id
+            if key < node_key:
+                path.append(node)
+                node = node.left
+            elif key > node_key:
+                path.append(node)
+                node = node.right
+            else:
+                log_operation("Customer %s already exists.", key)
+                return False
+
+        new_node = AVLNode(customer)
+        if not path:
+            self.root = new_node
+        elif key < path[-1].customer.customer_id:
+            path[-1].left = new_node
+        else:
+            path[-1].right = new_node
+        log_operation("Inserted: %s", customer)
+        self._retrace(path)
+        if self.points_index is not None:
+            self.points_index.add(customer)
+        return True
 
     def search(self, customer_id):
         node = self.root
@@ -63,9 +78,9 @@ class AVLTree(TreeInterface[T]):
             elif customer_id > node.customer.customer_id:
                 node = node.right
             else:
-                log_operation(f"Found customer: {node.customer}")
+                log_operation("Found customer: %s", node.customer, level=DEBUG)
                 return node.customer
-        log_operation(f"Customer {customer_id} not found")
+        log_operation("Customer %s not found", customer_id, level=DEBUG)
         return None
 
     def get_height(self, node):
@@ -79,8 +94,11 @@ class AVLTree(TreeInterface[T]):
         T2 = y.left
         y.left = z
         z.right = T2
-        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        left_height = z.left.height if z.left else 0
+        right_height = T2.height if T2 else 0
+        z.height = 1 + (left_height if left_height > right_height else right_height)
+        right_height = y.right.height if y.right else 0
+        y.height = 1 + (z.height if z.height > right_height else right_height)
         return y
 
     def right_rotate(self, z):
@@ -88,10 +106,50 @@ class AVLTree(TreeInterface[T]):
         T3 = y.right
         y.right = z
         z.left = T3
-        z.height = 1 + max(self.get_height(z.left), self.get_height(z.right))
-        y.height = 1 + max(self.get_height(y.left), self.get_height(y.right))
+        left_height = T3.height if T3 else 0
+        right_height = z.right.height if z.right else 0
+        z.height = 1 + (left_height if left_height > right_height else right_height)
+        left_height = y.left.height if y.left else 0
+        y.height = 1 + (left_height if left_height > z.height else z.height)
         return y
-    
+
+    def _rebalance(self, node):
+        """Rotate an unbalanced node and return the new root of its subtree"""
+        if self.get_balance(node) > 1:  # Left heavy
+            if self.get_balance(node.left) < 0:
+                node.left = self.left_rotate(node.left)
+            return self.right_rotate(node)
+        if self.get_balance(node.right) > 0:    # Right heavy
+            node.right = self.right_rotate(node.right)
+        return self.left_rotate(node)
+
+    def _retrace(self, path):
+        """Fix heights and balance bottom-up along path after an insert or delete
+
+        Nodes still hold their heights from before the change, so the walk
+        stops at the first subtree whose height comes out unchanged: nothing
+        above it can have changed either.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            left_height = node.left.height if node.left else 0
+            right_height = node.right.height if node.right else 0
+            balance = left_height - right_height
+            if balance > 1 or balance < -1:
+                subtree = self._rebalance(node)
+                if i == 0:
+                    self.root = subtree
+                elif path[i - 1].left is node:
+                    path[i - 1].left = subtree
+                else:
+                    path[i - 1].right = subtree
+            else:
+                node.height = 1 + (left_height if left_height > right_height else right_height)
+                subtree = node
+            if subtree.height == old_height:
+                return
+
     def inorder_traversal(self, node=None, result=None):
         if result is None:
             result = []
@@ -109,37 +167,32 @@ class AVLTree(TreeInterface[T]):
         return self.inorder_traversal()
     
     def delete(self, customer_id):
-        def _delete(node, customer_id):
-            if not node:
-                return None
-            if customer_id < node.customer.customer_id:
-                node.left = _delete(node.left, customer_id)
-            elif customer_id > node.customer.customer_id:
-                node.right = _delete(node.right, customer_id)
-            else:
-                log_operation(f"Deleted: {node.customer}")
-                if not node.left:
-                    return node.right
-                if not node.right:
-                    return node.left
+        path = [] # Nodes from the root down to the parent of the node being unlinked
+        node = self.root
+        while node:
+            node_key = node.customer.customer_id
+            if customer_id == node_key:
+                break
+            path.append(node)
+            node = node.left if customer_id < node_key else node.right
+
+        if node:
+            log_operation("Deleted: %s", node.customer)
+            if node.left and node.right:    # Take the in-order successor's customer, unlink the successor instead
+                path.append(node)
                 succ = node.right
                 while succ.left:
+                    path.append(succ)
                     succ = succ.left
                 node.customer = succ.customer
-                node.right = _delete(node.right, succ.customer.customer_id)
-
-            # Update height and balance
-            node.height = 1 + max(self.get_height(node.left), self.get_height(node.right))
-            balance = self.get_balance(node)
-            if balance > 1 and self.get_balance(node.left) >= 0:
-                return self.right_rotate(node)
-            if balance < -1 and self.get_balance(node.right) <= 0:
-                return self.left_rotate(node)
-            if balance > 1 and self.get_balance(node.left) < 0:
-                node.left = self.left_rotate(node.left)
-                return self.right_rotate(node)
-            if balance < -1 and self.get_balance(node.right) > 0:
-                node.right = self.right_rotate(node.right)
-                return self.left_rotate(node)
-            return node
-        self.root = _delete(self.root, customer_id)
\ No newline at end of file
+                node = succ
+            child = node.left or node.right
+            if not path:
+                self.root = child
+            elif path[-1].left is node:
+                path[-1].left = child
+            else:
+                path[-1].right = child
+            self._retrace(path)
+        if self.points_index is not None:
+            self.points_index.remove(customer_id)
@@ -1,7 +1,8 @@
 """Binary tree skeleton for loyalty module."""
 from typing import Optional, TypeVar
 from src.pos_system.common.interfaces import Node, TreeInterface
-from src.pos_system.common.logger import log_operation
+from src.pos_system.common.logger import DEBUG, log_operation
+from src.pos_system.common.tree_utils import build_balanced, check_strictly_increasing
 T = TypeVar("T")
 
 class BSTNode:
@@ -13,6 +14,29 @@ class BSTNode:
 class BSTTree(TreeInterface[T]):
     def __init__(self):
         self.root = None
+        self.points_index = None # Optional PointsIndex kept in sync (see loyalty.enable_points_index)
+
+    @classmethod
+    def from_sorted(cls, customers):
+        """Build a balanced tree in O(n) without per-customer logging
+
+        Args:
+            customers: Customers sorted by strictly increasing customer_id
+
+        Raises:
+            ValueError: If the customer_ids are not strictly increasing
+        """
+        customers = list(customers)
+        check_strictly_increasing([customer.customer_id for customer in customers], "Customer ids")
+
+        def _node(index, left, right, size):
+            node = BSTNode(customers[index])
+            node.left, node.right = left, right
+            return node
+
+        tree = cls()
+        tree.root = build_balanced(len(customers), _node)
+        return tree
 
     def insert(self, customer):
         inserted = False
@@ -20,16 +44,18 @@ class BSTTree(TreeInterface[T]):
             nonlocal inserted
             if not node:
                 inserted = True
-                log_operation(f"Inserted: {customer}")
+                log_operation("Inserted: %s", customer)
                 return BSTNode(customer)
             if customer.customer_id < node.customer.customer_id:
                 node.left = _insert(node.left, customer)
             elif customer.customer_id > node.customer.customer_id:
                 node.right = _insert(node.right, customer)
             else:
-                log_operation(f"Customer {customer.customer_id} already exists.")
+                log_operation("Customer %s already exists.", customer.customer_id)
             return node
         self.root = _insert(self.root, customer)
+        if inserted and self.points_index is not None:
+            self.points_index.add(customer)
         return inserted
 
     def search(self, customer_id):
@@ -40,9 +66,9 @@ class BSTTree(TreeInterface[T]):
             elif customer_id > node.customer.customer_id:
                 node = node.right
             else:
-                log_operation(f"Found customer: {node.customer}")
+                log_operation("Found customer: %s", node.customer, level=DEBUG)
                 return node.customer
-        log_operation(f"Customer {customer_id} not found")
+        log_operation("Customer %s not found", customer_id, level=DEBUG)
         return None
     
     def inorder_traversal(self, node=None, result=None):
@@ -70,7 +96,7 @@ class BSTTree(TreeInterface[T]):
             elif customer_id > node.customer.customer_id:
                 node.right = _delete(node.right, customer_id)
             else:
-                log_operation(f"Deleted: {node.customer}")
+                log_operation("Deleted: %s", node.customer)
                 if not node.left:
                     return node.right
                 if not node.right:
@@ -83,4 +109,6 @@ class BSTTree(TreeInterface[T]):
                 node.right = _delete(node.right, succ.customer.customer_id)
             return node
         self.root = _delete(self.root, customer_id)
+        if self.points_index is not None:
+            self.points_index.remove(customer_id)
 
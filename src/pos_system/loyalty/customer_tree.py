@@ -0,0 +1,58 @@
+"""Customer trees on any registered tree backend."""
+from typing import Iterable, List, Optional
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.interfaces import TreeInterface
+from src.pos_system.common.tree_adapters import CustomerTreeAdapter
+from src.pos_system.common.tree_registry import create_tree
+
+
+class CustomerTree:
+    """Loyalty tree API (insert(customer), search(customer_id), inorder_traversal)
+    over a key/value TreeInterface backend"""
+
+    def __init__(self, tree: TreeInterface):
+        self.tree = tree
+        self.points_index = None # Optional PointsIndex kept in sync (see loyalty.enable_points_index)
+
+    @property
+    def root(self):
+        return getattr(self.tree, "root", None)
+
+    def insert(self, customer: Customer) -> bool:
+        """Insert a customer; returns False if the customer_id already exists"""
+        if self.tree.search(customer.customer_id) is not None:
+            return False
+        self.tree.insert(customer.customer_id, customer)
+        if self.points_index is not None:
+            self.points_index.add(customer)
+        return True
+
+    def search(self, customer_id) -> Optional[Customer]:
+        node = self.tree.search(customer_id)
+        return node.value if node is not None else None
+
+    def delete(self, customer_id) -> None:
+        self.tree.delete(customer_id)
+        if self.points_index is not None:
+            self.points_index.remove(customer_id)
+
+    def inorder_traversal(self) -> List[Customer]:
+        return [node.value for node in self.tree.traverse()]
+
+    def traverse(self) -> List[Customer]:
+        return self.inorder_traversal()
+
+
+def build_customer_tree(backend: str = "avl", customers: Iterable[Customer] = (), **options):
+    """Build a customer tree of any registered backend (see common.tree_registry).
+
+    "avl" and "loyalty_bst" return the native AVLTree/BSTTree; any other
+    backend is wrapped in CustomerTree. Both offer insert(customer),
+    search(customer_id), delete and inorder_traversal, so the loyalty
+    functions (update_points, top_n_customers, ...) work with either.
+    """
+    tree = create_tree(backend, **options)
+    tree = tree.tree if isinstance(tree, CustomerTreeAdapter) else CustomerTree(tree)
+    for customer in customers:
+        tree.insert(customer)
+    return tree
@@ -0,0 +1,155 @@
+"""Secondary loyalty index ordered by points.
+
+An AVL tree keyed on ``(loyalty_points, customer_id)`` next to the primary
+customer_id tree, so points reports walk only the customers they return:
+a range query is O(log n + k) and top-N is a reverse walk, O(log n + N)
+(plus the rest of a tie at the cut-off, which is read in full so ties come
+out in customer_id order).
+The key each customer is currently filed under is remembered, so an entry
+can be moved even after the Customer's points were changed elsewhere.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.pos_system.common.tree_utils import build_balanced, in_order
+
+PointsKey = Tuple[int, str]
+
+
+class PointsNode:
+    def __init__(self, key: PointsKey, customer):
+        self.key = key
+        self.customer = customer
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+class PointsIndex:
+    """AVL tree of customers ordered by (loyalty_points, customer_id)"""
+
+    def __init__(self):
+        self.root: Optional[PointsNode] = None
+        self._keys: Dict[str, PointsKey] = {} # customer_id -> key it is filed under
+
+    @classmethod
+    def from_customers(cls, customers: Iterable) -> "PointsIndex":
+        """Build a perfectly balanced index with one sort and an O(n) build"""
+        index = cls()
+        by_id = {customer.customer_id: customer for customer in customers}
+        entries = sorted(((c.loyalty_points, cid), c) for cid, c in by_id.items())
+
+        def _node(position: int, left, right, size: int) -> PointsNode:
+            node = PointsNode(*entries[position])
+            node.left, node.right = left, right
+            node.height = 1 + max(_height(left), _height(right))
+            return node
+
+        index.root = build_balanced(len(entries), _node)
+        index._keys = {key[1]: key for key, _ in entries}
+        return index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, customer) -> None:
+        """File a customer under its current points, moving it if it was already filed"""
+        self.remove(customer.customer_id)
+        key = (customer.loyalty_points, customer.customer_id)
+        self.root = self._insert(self.root, key, customer)
+        self._keys[customer.customer_id] = key
+
+    refresh = add # Call after a customer's loyalty_points changed
+
+    def remove(self, customer_id: str) -> None:
+        key = self._keys.pop(customer_id, None)
+        if key is not None:
+            self.root = self._delete(self.root, key)
+
+    def range(self, min_points: int, max_points: int) -> List:
+        """Customers with min_points <= loyalty_points <= max_points, by points then customer_id"""
+        result = []
+        for node in in_order(self.root, start=(min_points,)): # (min_points,) sorts before every (min_points, customer_id)
+            if node.key[0] > max_points:    # Everything after is above the range
+                break
+            result.append(node.customer)
+        return result
+
+    def top(self, n: int) -> List:
+        """The n customers with the most points, highest first (ties by customer_id)"""
+        if n <= 0:
+            return []
+        result = []
+        run = [] # Nodes with equal points, met in descending customer_id order
+        for node in in_order(self.root, reverse=True):
+            if run and node.key[0] != run[-1].key[0]:   # Run complete, emit it in ascending customer_id
+                result.extend(reversed(run))
+                run = []
+                if len(result) >= n:
+                    break
+            run.append(node)
+        if len(result) < n:
+            result.extend(reversed(run))
+        return [node.customer for node in result[:n]]
+
+    def _insert(self, node: Optional[PointsNode], key: PointsKey, customer) -> PointsNode:
+        if not node:
+            return PointsNode(key, customer)
+        if key < node.key:
+            node.left = self._insert(node.left, key, customer)
+        else:
+            node.right = self._insert(node.right, key, customer)
+        return _rebalance(node)
+
+    def _delete(self, node: Optional[PointsNode], key: PointsKey) -> Optional[PointsNode]:
+        if not node:
+            return None
+        if key < node.key:
+            node.left = self._delete(node.left, key)
+        elif key > node.key:
+            node.right = self._delete(node.right, key)
+        else:
+            if not node.left:
+                return node.right
+            if not node.right:
+                return node.left
+            succ = node.right
+            while succ.left:
+                succ = succ.left
+            node.key, node.customer = succ.key, succ.customer
+            node.right = self._delete(node.right, succ.key)
+        return _rebalance(node)
+
+
+def _height(node: Optional[PointsNode]) -> int:
+    return node.height if node else 0
+
+
+def _rotate_left(z: PointsNode) -> PointsNode:
+    y = z.right
+    z.right = y.left
+    y.left = z
+    z.height = 1 + max(_height(z.left), _height(z.right))
+    y.height = 1 + max(_height(y.left), _height(y.right))
+    return y
+
+
+def _rotate_right(z: PointsNode) -> PointsNode:
+    y = z.left
+    z.left = y.right
+    y.right = z
+    z.height = 1 + max(_height(z.left), _height(z.right))
+    y.height = 1 + max(_height(y.left), _height(y.right))
+    return y
+
+
+def _rebalance(node: PointsNode) -> PointsNode:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1: # Left heavy
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:    # Right heavy
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
@@ -10,131 +10,26 @@ import sys
 from typing import Any, List, Optional, Tuple
 import os
 import pathlib
+import argparse
 
 
-##################################
-###      B-Tree Node class     ###
-### Abstract Data Type: B-Tree ###
-##################################
-class BTreeNode:
-    def __init__(self, leaf=False):
-        self.leaf = leaf
-        self.keys = []  # List of (key, value) tuples
-        self.children = []
-
-##################################
-###        B-Tree class        ###
-##################################
-class BTree:
-    def __init__(self, t):
-        self.root = BTreeNode(True)
-        self.t = t  # Minimum degree
-
-    def insert(self, k, v):
-        root = self.root
-        if len(root.keys) == (2 * self.t - 1):
-            temp = BTreeNode()
-            self.root = temp
-            temp.children.insert(0, root)
-            self._split_child(temp, 0)
-            self._insert_non_full(temp, k, v)
-        else:
-            self._insert_non_full(root, k, v)
-
-    def _insert_non_full(self, x, k, v):
-        i = len(x.keys) - 1
-        if x.leaf:
-            x.keys.append((None, None))
-            while i >= 0 and k < x.keys[i][0]:
-                x.keys[i + 1] = x.keys[i]
-                i -= 1
-            x.keys[i + 1] = (k, v)
-        else:
-            while i >= 0 and k < x.keys[i][0]:
-                i -= 1
-            i += 1
-            if len(x.children[i].keys) == (2 * self.t - 1):
-                self._split_child(x, i)
-                if k > x.keys[i][0]:
-                    i += 1
-            self._insert_non_full(x.children[i], k, v)
-
-    def _split_child(self, x, i):
-        t = self.t
-        y = x.children[i]
-        z = BTreeNode(y.leaf)
-        x.children.insert(i + 1, z)
-        x.keys.insert(i, y.keys[t - 1])
-        z.keys = y.keys[t:(2 * t - 1)]
-        y.keys = y.keys[0:(t - 1)]
-        if not y.leaf:
-            z.children = y.children[t:(2 * t)]
-            y.children = y.children[0:t]
-
-    def search_key(self, k):
-        return self._search(self.root, k)
-
-    def _search(self, x, k):
-        i = 0
-        while i < len(x.keys) and k > x.keys[i][0]:
-            i += 1
-        if i < len(x.keys) and k == x.keys[i][0]:
-            return x.keys[i][1]
-        if x.leaf:
-            return None
-        return self._search(x.children[i], k)
-################# END B-TREE ######################
+try:
+    from src.pos_system.sales.transaction_trees import build_transaction_tree
+except ImportError:  # Run as a script from this directory: make the src package importable
+    sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[3]))
+    from src.pos_system.sales.transaction_trees import build_transaction_tree
+
+# Tree backends to compare (any name from common.tree_registry)
+parser = argparse.ArgumentParser(description="Sales transaction module")
+parser.add_argument("--btree-backend", default="btree", help="Backend for the B-Tree column (default: btree)")
+parser.add_argument("--bst-backend", default="sales_bst", help="Backend for the BST column (default: sales_bst)")
+args, _ = parser.parse_known_args()
 
-###################################################
-# Abstract Data Type: Binary Search Tree (BST) #
-class Node:
-    def __init__(self, key, data):
-        self.key = key
-        self.data = data
-        self.left = None
-        self.right = None
-
-class BST:
-    def __init__(self):
-        self.root = None
-
-    def insert(self, key, data):
-        if self.root is None:
-            self.root = Node(key, data)
-        else:
-            self._insert(self.root, key, data)
-
-    def _insert(self, node, key, data):
-        if key < node.key:
-            if node.left is None:
-                node.left = Node(key, data)
-            else:
-                self._insert(node.left, key, data)
-        elif key > node.key:
-            if node.right is None:
-                node.right = Node(key, data)
-            else:
-                self._insert(node.right, key, data)
-        else:
-            # Update data if key exists
-            node.data = data
-
-    def search(self, key):
-        return self._search(self.root, key)
-
-    def search_key(self, key):
-        return self.search(key)          # delegate to the real method
-
-    def _search(self, node, key):
-        if node is None:
-            return None
-        if key == node.key:
-            return node.data
-        elif key < node.key:
-            return self._search(node.left, key)
-        else:
-            return self._search(node.right, key)
-################## END BST #########################
+
+def search_key(tree, receipt_id):
+    """Transaction record stored under receipt_id, or None"""
+    node = tree.search(receipt_id)
+    return node.value if node else None
 
 ###################################################
 ###    Connect to source (MS Access database)   ###
@@ -150,10 +45,6 @@ conn = pyodbc.connect(r"Driver={Microsoft Access Driver (*.mdb, *.accdb)};DBQ="
 cursor = conn.cursor()
 
 ##### Data Upload to B-Tree & BST ##### 
-# Initialize B-Tree (order 3 for example)
-btree = BTree(3)
-#Initialize Binary Search Tree (BST)
-bst = BST()
 # Load existing transactions from Sample_Transaction into B-Tree
 transactions = defaultdict(list)
 
@@ -178,21 +69,18 @@ for row in cursor.fetchall():
     #trans_groups = row.groupby('Transaction_Id')
     #transaction__all_ids = list(trans_groups.groups.keys())
 
-for receipt_id in transactions:
-    btree.insert(receipt_id, {
-        'date_time': date_times[receipt_id],
-        'items': transactions[receipt_id]
-    })
-
-    bst.insert(receipt_id, {
-        'date_time': date_times[receipt_id],
-        'items': transactions[receipt_id]
-    })
-
-    # Get all the receipt id using group by 
-    #trans_groups = transactions[receipt_id].groupby
-    #trans_groups = transactions.groupby('Transaction_Id')
-    #transaction__all_ids = list(trans_groups.groups.keys())
+records = {receipt_id: {
+    'date_time': date_times[receipt_id],
+    'items': transactions[receipt_id]
+} for receipt_id in transactions}
+# Initialize B-Tree (order 3 by default) and Binary Search Tree (BST)
+btree = build_transaction_tree(records, backend=args.btree_backend)
+bst = build_transaction_tree(records, backend=args.bst_backend)
+
+# Get all the receipt id using group by 
+#trans_groups = transactions[receipt_id].groupby
+#trans_groups = transactions.groupby('Transaction_Id')
+#transaction__all_ids = list(trans_groups.groups.keys())
 ###################################################
 
 
@@ -317,7 +205,7 @@ while True:
             ###        B-Tree Start Searching        ###
             ############################################
             start_time = time.perf_counter_ns()
-            transaction_btree = btree.search_key(receipt_id)
+            transaction_btree = search_key(btree, receipt_id)
             end_time = time.perf_counter_ns()
             search_time = (end_time - start_time) / 1000
             ############################################
@@ -378,8 +266,8 @@ while True:
             num = int(frequency_num)
             num_attempt_btree = 0
             num_attempt_bst = 0
-            transaction_btree = btree.search_key(receipt_id)
-            transaction_bst = bst.search_key(receipt_id)
+            transaction_btree = search_key(btree, receipt_id)
+            transaction_bst = search_key(bst, receipt_id)
             #Validate the receipt id availability before start the frequency test
             try:
                 if transaction_btree:
@@ -387,7 +275,7 @@ while True:
                     start_time_btree = time.perf_counter_ns()
                     while num_attempt_btree < num:
                         num_attempt_btree += 1
-                        transaction_btree = btree.search_key(receipt_id)
+                        transaction_btree = search_key(btree, receipt_id)
 
                     end_time_btree = time.perf_counter_ns()                   
                     search_time_btree = (end_time_btree - start_time_btree)/1000   
@@ -396,7 +284,7 @@ while True:
                     start_time_bst = time.perf_counter_ns()
                     while num_attempt_bst < num:
                         num_attempt_bst += 1
-                        transaction_bst = bst.search_key(receipt_id)
+                        transaction_bst = search_key(bst, receipt_id)
             
                     end_time_bst = time.perf_counter_ns()                   
                     search_time_bst = (end_time_bst - start_time_bst)/1000   
@@ -466,7 +354,7 @@ while True:
                 ##### Clocking the search for B-tree ##### 
                 btree_start = time.perf_counter()
                 for _ in range(num_all):
-                    btree.search_key(receipt_all_id.Transaction_Id)
+                    search_key(btree, receipt_all_id.Transaction_Id)
                 btree_end = time.perf_counter()   
                 btree_times.append((btree_end - btree_start) / 1000)
                 #print("Btree Receipt ID: ", receipt_all_id)
@@ -474,7 +362,7 @@ while True:
                 ##### Clocking the search for BST ##### 
                 bst_start = time.perf_counter()
                 for _ in range(num_all):
-                    bst.search_key(receipt_all_id.Transaction_Id)
+                    search_key(bst, receipt_all_id.Transaction_Id)
                 bst_end = time.perf_counter()   
                 bst_times.append((bst_end - bst_start) / 1000)
                 #print("\n")
@@ -0,0 +1,150 @@
+"""B-Tree and Binary Search Tree of sales transactions keyed by receipt id.
+
+Side-effect free (no database connection), so the trees can be used and
+benchmarked outside the btree.py script.
+"""
+from typing import Any, Mapping
+
+
+##################################
+###      B-Tree Node class     ###
+### Abstract Data Type: B-Tree ###
+##################################
+class BTreeNode:
+    def __init__(self, leaf=False):
+        self.leaf = leaf
+        self.keys = []  # List of (key, value) tuples
+        self.children = []
+
+##################################
+###        B-Tree class        ###
+##################################
+class BTree:
+    def __init__(self, t):
+        self.root = BTreeNode(True)
+        self.t = t  # Minimum degree
+
+    def insert(self, k, v):
+        root = self.root
+        if len(root.keys) == (2 * self.t - 1):
+            temp = BTreeNode()
+            self.root = temp
+            temp.children.insert(0, root)
+            self._split_child(temp, 0)
+            self._insert_non_full(temp, k, v)
+        else:
+            self._insert_non_full(root, k, v)
+
+    def _insert_non_full(self, x, k, v):
+        i = len(x.keys) - 1
+        if x.leaf:
+            x.keys.append((None, None))
+            while i >= 0 and k < x.keys[i][0]:
+                x.keys[i + 1] = x.keys[i]
+                i -= 1
+            x.keys[i + 1] = (k, v)
+        else:
+            while i >= 0 and k < x.keys[i][0]:
+                i -= 1
+            i += 1
+            if len(x.children[i].keys) == (2 * self.t - 1):
+                self._split_child(x, i)
+                if k > x.keys[i][0]:
+                    i += 1
+            self._insert_non_full(x.children[i], k, v)
+
+    def _split_child(self, x, i):
+        t = self.t
+        y = x.children[i]
+        z = BTreeNode(y.leaf)
+        x.children.insert(i + 1, z)
+        x.keys.insert(i, y.keys[t - 1])
+        z.keys = y.keys[t:(2 * t - 1)]
+        y.keys = y.keys[0:(t - 1)]
+        if not y.leaf:
+            z.children = y.children[t:(2 * t)]
+            y.children = y.children[0:t]
+
+    def search_key(self, k):
+        return self._search(self.root, k)
+
+    def _search(self, x, k):
+        i = 0
+        while i < len(x.keys) and k > x.keys[i][0]:
+            i += 1
+        if i < len(x.keys) and k == x.keys[i][0]:
+            return x.keys[i][1]
+        if x.leaf:
+            return None
+        return self._search(x.children[i], k)
+################# END B-TREE ######################
+
+###################################################
+# Abstract Data Type: Binary Search Tree (BST) #
+class Node:
+    def __init__(self, key, data):
+        self.key = key
+        self.data = data
+        self.left = None
+        self.right = None
+
+class BST:
+    def __init__(self):
+        self.root = None
+
+    def insert(self, key, data):
+        if self.root is None:
+            self.root = Node(key, data)
+        else:
+            self._insert(self.root, key, data)
+
+    def _insert(self, node, key, data):
+        if key < node.key:
+            if node.left is None:
+                node.left = Node(key, data)
+            else:
+                self._insert(node.left, key, data)
+        elif key > node.key:
+            if node.right is None:
+                node.right = Node(key, data)
+            else:
+                self._insert(node.right, key, data)
+        else:
+            # Update data if key exists
+            node.data = data
+
+    def search(self, key):
+        return self._search(self.root, key)
+
+    def search_key(self, key):
+        return self.search(key)          # delegate to the real method
+
+    def _search(self, node, key):
+        if node is None:
+            return None
+        if key == node.key:
+            return node.data
+        elif key < node.key:
+            return self._search(node.left, key)
+        else:
+            return self._search(node.right, key)
+################## END BST #########################
+
+
+
+def build_transaction_tree(transactions: Mapping[str, Any], backend: str = "btree", **options):
+    """Build a tree of any registered backend (see common.tree_registry) keyed by receipt id.
+
+    Args:
+        transactions: receipt id -> transaction record
+        backend: Tree backend name, eg. "btree" or "sales_bst"
+        options: Passed to the backend factory (eg. t for "btree")
+
+    Returns:
+        TreeInterface holding one entry per receipt
+    """
+    from src.pos_system.common.tree_registry import create_tree
+    tree = create_tree(backend, **options)
+    for receipt_id, record in transactions.items():
+        tree.insert(receipt_id, record)
+    return tree
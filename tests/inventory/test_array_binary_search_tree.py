@@ -0,0 +1,92 @@
+import random
+from src.pos_system.inventory.array_binary_search_tree import ArrayBinarySearchTree
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.common.Product import Product
+
+def test_array_binary_search_tree_traversal_empty_tree():
+    t = ArrayBinarySearchTree[int]()
+    keys = [n.key for n in t.traverse()]
+    assert keys == []
+    assert t.root is None and len(t) == 0
+
+def test_array_binary_search_tree_basic_operations():
+    t = ArrayBinarySearchTree[int]()
+    t.insert(10)    #        10
+    t.insert(5)     #       /  \
+    t.insert(15)    #      5    15
+    t.insert(12)    #     /    /
+    t.insert(3)     #    3    12
+
+    # search
+    val = t.search(10)
+    assert val is not None and val.key == 10
+    assert val.left.key == 5 and val.right.key == 15
+    assert t.search(99) is None
+
+    # traversal yields sorted keys
+    keys = [n.key for n in t.traverse()]
+    assert keys == [3, 5, 10, 12, 15]
+
+    # delete leaf
+    t.delete(3)
+    keys = [n.key for n in t.traverse()]
+    assert keys == [5, 10, 12, 15]
+
+    # delete node with one child
+    t.delete(12)
+    keys = [n.key for n in t.traverse()]
+    assert keys == [5, 10, 15]
+
+    # delete root
+    t.delete(10)
+    keys = [n.key for n in t.traverse()]
+    assert keys == [5, 15]
+    assert len(t) == 2
+
+def test_array_binary_search_tree_reuses_free_slots():
+    t = ArrayBinarySearchTree[int]()
+    for key in range(10):
+        t.insert(key)
+    for key in range(0, 10, 2):
+        t.delete(key)
+    slots = len(t._keys)
+    for key in range(100, 105):
+        t.insert(key)
+    assert len(t._keys) == slots  # deleted slots were reused
+    assert [n.key for n in t.traverse()] == [1, 3, 5, 7, 9, 100, 101, 102, 103, 104]
+
+def test_array_binary_search_tree_matches_object_tree():
+    rng = random.Random(14)
+    t = ArrayBinarySearchTree[int]()
+    reference = BinarySearchTree[int]()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            t.insert(key, value=str(key))
+            reference.insert(key, value=str(key))
+        else:
+            t.delete(key)
+            reference.delete(key)
+    assert [(n.key, n.value) for n in t.traverse()] == [(n.key, n.value) for n in reference.traverse()]
+    assert len(t) == len(reference)
+
+def test_array_binary_search_tree_product_values():
+    products = [
+        Product(product_id="29-205-1132", name="Sushi Rice", price=4.5, category="Grains & Pulses", quantity=22),
+        Product(product_id="40-681-9981", name="Arabica Coffee", price=20.0, category="Beverages", quantity=45),
+        Product(product_id="06-955-3428", name="Black Rice", price=6.0, category="Grains & Pulses", quantity=30),
+    ]
+    t = ArrayBinarySearchTree.from_sorted(sorted((p.product_id, p) for p in products))
+    assert t.root.key == "29-205-1132"
+    node = t.search("40-681-9981")
+    assert node is not None and node.value is products[1]
+    node.value = products[0]  # views write through to the slot
+    assert t.search("40-681-9981").value is products[0]
+
+def test_array_binary_search_tree_traverse_reverse_and_resume():
+    t = ArrayBinarySearchTree[int]()
+    for key in [7, 3, 9, 1, 5, 8, 10]:
+        t.insert(key)
+    assert [n.key for n in t.traverse(reverse=True)] == [10, 9, 8, 7, 5, 3, 1]
+    assert [n.key for n in t.traverse(start=6)] == [7, 8, 9, 10]
+    assert [n.key for n in t.traverse(reverse=True, start=6)] == [5, 3, 1]
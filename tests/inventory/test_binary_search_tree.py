@@ -140,3 +140,125 @@ def test_build_inventory_binary_search_tree():
         assert node is not None
         assert node.value.product_id == pid
         assert node.value.name == name
+
+def test_binary_search_tree_sorted_load_no_recursion_limit():
+    n = 2000  # deeper than the default recursion limit once degenerate
+    t = BinarySearchTree[int]()
+    for key in range(n):
+        t.insert(key)
+    for key in range(n - 1, -1, -1):
+        t.insert(key, value=key * 2)  # re-inserting updates the value
+    assert t.search(0).value == 0 and t.search(n - 1).value == (n - 1) * 2
+
+    # delete every other key from the bottom of the chain
+    for key in range(n - 1, -1, -2):
+        t.delete(key)
+    assert t.search(n - 1) is None
+    assert t.search(n - 2) is not None
+    t.delete(n + 10)  # deleting a missing key is a no-op
+    assert t.root.key == 0
+
+def test_binary_search_tree_delete_two_children_successor():
+    t = BinarySearchTree[int]()
+    for key in [50, 30, 70, 60, 80, 65]:
+        t.insert(key, value=str(key))
+    t.delete(50)    # successor 60 has a right child (65)
+    keys = [n.key for n in t.traverse()]
+    assert keys == [30, 60, 65, 70, 80]
+    assert t.root.key == 60 and t.root.value == "60"
+    t.delete(60)
+    t.delete(30)
+    keys = [n.key for n in t.traverse()]
+    assert keys == [65, 70, 80]
+
+def test_binary_search_tree_from_sorted():
+    items = [(key, str(key)) for key in range(1, 16)]
+    t = BinarySearchTree.from_sorted(items)
+    assert t.root.key == 8  # middle key becomes the root
+    assert t.root.left.key == 4 and t.root.right.key == 12
+    assert [(n.key, n.value) for n in t.traverse()] == items
+
+    def _height(node):
+        return 0 if node is None else 1 + max(_height(node.left), _height(node.right))
+    assert _height(t.root) == 4  # perfectly balanced
+
+    assert BinarySearchTree.from_sorted([]).root is None
+    try:
+        BinarySearchTree.from_sorted([(1, None), (1, None)])
+        assert False, "duplicate keys must be rejected"
+    except ValueError:
+        pass
+
+def test_binary_search_tree_range_and_prefix():
+    ids = ["29-205-1132", "29-205-0001", "29-206-0001", "40-681-9981", "06-955-3428", "29-205-9999", "29-2050"]
+    t = BinarySearchTree[str]()
+    for pid in ids:
+        t.insert(pid)
+
+    assert [n.key for n in t.iter_prefix("29-205-")] == ["29-205-0001", "29-205-1132", "29-205-9999"]
+    assert [n.key for n in t.iter_prefix("99-")] == []
+    assert [n.key for n in t.iter_range("29-205-1132", "40-681-9981")] == ["29-205-1132", "29-205-9999", "29-2050", "29-206-0001", "40-681-9981"]
+    assert [n.key for n in t.iter_range(high="29-205-0001")] == ["06-955-3428", "29-205-0001"]
+    assert [n.key for n in t.iter_range()] == sorted(ids)
+
+    assert t.floor("29-205-5000").key == "29-205-1132"
+    assert t.floor("29-205-1132").key == "29-205-1132"
+    assert t.floor("00") is None
+    assert t.ceiling("29-205-5000").key == "29-205-9999"
+    assert t.ceiling("99") is None
+
+def test_binary_search_tree_select_rank():
+    keys = [50, 20, 80, 10, 30, 70, 90, 25, 35, 75]
+    t = BinarySearchTree[int]()
+    for key in keys:
+        t.insert(key)
+    t.insert(30, value="dup")  # updating a key must not change sizes
+    ordered = sorted(keys)
+    assert len(t) == len(keys)
+    assert [t.select(i).key for i in range(len(t))] == ordered
+    assert [t.rank(k) for k in ordered] == list(range(len(ordered)))
+    assert t.rank(0) == 0 and t.rank(31) == 4 and t.rank(100) == len(keys)
+
+    for key in [50, 10, 75, 99]:  # root, leaf, leaf, missing
+        t.delete(key)
+        if key in ordered:
+            ordered.remove(key)
+        assert len(t) == len(ordered)
+        assert [t.select(i).key for i in range(len(t))] == ordered
+
+    try:
+        t.select(len(t))
+        assert False, "select past the end must raise"
+    except IndexError:
+        pass
+
+    bulk = BinarySearchTree.from_sorted([(k, None) for k in range(10)])
+    assert len(bulk) == 10 and bulk.select(7).key == 7 and bulk.rank(7) == 7
+
+def test_binary_search_tree_search_many():
+    t = BinarySearchTree[int]()
+    for key in [50, 20, 80, 10, 30, 70, 90]:
+        t.insert(key, value=key * 2)
+    basket = [90, 15, 10, 50, 90, 71]
+    results = t.search_many(basket)
+    assert [n.value if n else None for n in results] == [180, None, 20, 100, 180, None]
+    assert t.search_many([]) == []
+    assert BinarySearchTree[int]().search_many([1, 2]) == [None, None]
+
+def test_binary_search_tree_traverse_reverse_and_resume():
+    t = BinarySearchTree[int]()
+    for key in [7, 3, 9, 1, 5, 8, 10]:
+        t.insert(key)
+    assert [n.key for n in t.traverse(reverse=True)] == [10, 9, 8, 7, 5, 3, 1]
+    assert [n.key for n in t.traverse(start=6)] == [7, 8, 9, 10]
+    assert [n.key for n in t.traverse(start=5)] == [5, 7, 8, 9, 10]
+    assert [n.key for n in t.traverse(reverse=True, start=6)] == [5, 3, 1]
+    assert [n.key for n in t.traverse(start=11)] == []
+
+def test_binary_search_tree_traverse_degenerate_tree():
+    n = 3000  # a recursive generator chain this deep overflows the stack
+    t = BinarySearchTree[int]()
+    for key in range(n):
+        t.insert(key)
+    assert [node.key for node in t.traverse()] == list(range(n))
+    assert [node.key for node in t.traverse(reverse=True)][:3] == [n - 1, n - 2, n - 3]
@@ -0,0 +1,40 @@
+from src.pos_system.inventory.category_index import CategoryIndex
+from src.pos_system.inventory.inventory_module import InventoryModule
+from src.pos_system.common.Product import Product
+
+def test_category_index_add_remove():
+    products = [
+        Product(product_id="01", name="Milk", price=2.0, category="Dairy", quantity=10),
+        Product(product_id="02", name="Apple", price=0.5, category="Fruit", quantity=100),
+        Product(product_id="03", name="Cheese", price=5.0, category="Dairy", quantity=20),
+    ]
+    index = CategoryIndex.from_products(products)
+    assert index.categories() == ["Dairy", "Fruit"]
+    assert index.count("Dairy") == 2 and index.count("Bakery") == 0
+    assert [p.name for p in index.products("Dairy")] == ["Milk", "Cheese"]
+
+    index.add(Product(product_id="00", name="Butter", price=3.0, category="Dairy", quantity=5))
+    assert [p.product_id for p in index.products("Dairy")] == ["00", "01", "03"]
+
+    index.remove(products[1])
+    assert index.categories() == ["Dairy"]  # empty categories are dropped
+    assert list(index.products("Fruit")) == []
+
+def test_inventory_module_keeps_category_index_in_sync():
+    module = InventoryModule()
+    dairy_before = module.category_index.count("Dairy")
+    total = sum(module.category_index.count(c) for c in module.category_index.categories())
+    assert total == len(module.inventory_data_bst)
+
+    module.add_product(Product(product_id="00-000-0001", name="Yogurt", price=1.5, category="Dairy", quantity=12))
+    assert module.category_index.count("Dairy") == dairy_before + 1
+
+    # replacing a product under a new category moves it in the index
+    module.add_product(Product(product_id="00-000-0001", name="Yogurt", price=1.5, category="Snacks", quantity=12))
+    assert module.category_index.count("Dairy") == dairy_before
+    assert "00-000-0001" in [p.product_id for p in module.category_index.products("Snacks")]
+
+    removed = module.remove_product("00-000-0001")
+    assert removed is not None and removed.category == "Snacks"
+    assert "00-000-0001" not in [p.product_id for p in module.category_index.products("Snacks")]
+    assert module.remove_product("00-000-0001") is None
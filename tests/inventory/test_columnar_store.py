@@ -0,0 +1,52 @@
+import pytest
+from src.pos_system.common.Product import Product
+
+pytest.importorskip("numpy")
+from src.pos_system.inventory.columnar_store import ColumnarInventory
+
+def _products():
+    return [
+        Product("A", "Milk", "Dairy", 2.0, 10),
+        Product("B", "Cheese", "Dairy", 6.0, 5),
+        Product("C", "Tea", "Beverages", 3.0, 4),
+        Product("D", "Coffee", "Beverages", 9.0, 2),
+    ]
+
+def test_columnar_aggregates():
+    store = ColumnarInventory.from_products(_products())
+    assert len(store) == 4
+    assert store.total_value() == 20 + 30 + 12 + 18
+    assert store.value_by_category() == {"Dairy": 50.0, "Beverages": 30.0}
+    assert store.quantity_by_category() == {"Dairy": 15, "Beverages": 6}
+    assert store.mean_price("Beverages") == 6.0
+    assert store.price_percentiles([0, 50, 100]) == [2.0, 4.5, 9.0]
+    try:
+        store.mean_price("Bakery")
+        assert False
+    except ValueError:
+        pass
+
+def test_columnar_incremental_updates_reuse_slots():
+    store = ColumnarInventory(capacity=2)
+    for product in _products():  # grows past the initial capacity
+        store.update(product)
+    store.remove("C")
+    store.remove("D")  # Beverages now empty
+    assert store.value_by_category() == {"Dairy": 50.0}
+    store.update(Product("E", "Bread", "Bakery", 1.5, 4))
+    store.update(Product("A", "Milk", "Dairy", 2.0, 1))  # stock change
+    assert len(store) == 3 and store._used == 4  # freed slot was reused
+    assert store.value_by_category() == {"Dairy": 32.0, "Bakery": 6.0}
+    assert store.total_value() == 38.0
+
+def test_inventory_module_keeps_analytics_in_sync():
+    from src.pos_system.inventory.inventory_module import InventoryModule
+    module = InventoryModule(analytics=True)
+    products = [node.value for node in module.inventory_data_bst.traverse()]
+    assert module.analytics.total_value() == pytest.approx(sum(p.price * p.quantity for p in products))
+    before = module.analytics.value_by_category().get("Dairy", 0.0)
+    module.add_product(Product("zz-new", "Yogurt", "Dairy", 2.5, 4))
+    module.adjust_stock("zz-new", -2)
+    assert module.analytics.value_by_category()["Dairy"] == pytest.approx(before + 5.0)
+    module.remove_product("zz-new")
+    assert module.analytics.value_by_category().get("Dairy", 0.0) == pytest.approx(before)
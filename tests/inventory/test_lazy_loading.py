@@ -0,0 +1,93 @@
+import csv
+import threading
+from src.pos_system.inventory import inventory_module
+from src.pos_system.inventory.inventory_module import InventoryModule
+from src.pos_system.common import data_loader
+from src.pos_system.common.Product import Product
+from src.pos_system.common.data_loader import PRODUCT_SCHEMA, get_data_path, iter_records
+
+def _last_csv_product_id():
+    with open(get_data_path("inventory", "products.csv"), newline="") as f:
+        return list(csv.DictReader(f))[-1]["product_id"]
+
+def test_lazy_module_loads_full_catalog():
+    module = InventoryModule(lazy=True, hot_entries=50)
+    assert module.find_product("29-205-1132") is not None  # first CSV row is in the hot set
+    assert module.wait_until_loaded(timeout=30)
+    assert module.is_ready and module.load_error is None
+    assert len(module.inventory_data_bst) == 990
+    assert len(module.low_stock) == 990
+    products = [node.value for node in module.inventory_data_bst.traverse()]
+    assert sum(module.category_index.count(c) for c in module.category_index.categories()) == len(products)
+
+def test_eager_module_is_ready_immediately():
+    module = InventoryModule()
+    assert module.is_ready and module.wait_until_loaded(timeout=0)
+    assert len(module.inventory_data_bst) == 100
+
+def test_changes_during_warmup_win_over_csv_rows(monkeypatch):
+    last_id = _last_csv_product_id()
+    csv_rows, building, resume_build = threading.Event(), threading.Event(), threading.Event()
+    read = []
+    def rows(): # Holds the loader after the hot set until the warmup edits are made
+        for i, product in enumerate(iter_records(get_data_path("inventory", "products.csv"), PRODUCT_SCHEMA)):
+            if i == 10:
+                assert csv_rows.wait(timeout=30)
+            read.append(product.product_id)
+            yield product
+    monkeypatch.setattr(inventory_module, "iter_inventory_products", rows)
+    module = InventoryModule(lazy=True, hot_entries=10)
+    build_indexes = module._build_indexes
+    def held_build(tree):   # Holds the loader again while it builds the full catalog
+        building.set()
+        assert resume_build.wait(timeout=30)
+        return build_indexes(tree)
+    module._build_indexes = held_build
+
+    module.add_product(Product(last_id, "Edited During Warmup", "Dairy", 1.0, 3))
+    module.remove_product("40-681-9981")  # hot set product
+    csv_rows.set()
+    assert building.wait(timeout=30) and not module.is_ready
+    module.add_product(Product("ZZ-000-0001", "Added During Build", "Dairy", 2.0, 4))
+    module.remove_product("29-205-1132")  # first CSV row, already in the tree being built
+    resume_build.set()
+
+    assert module.wait_until_loaded(timeout=30) and module.load_error is None
+    assert last_id in read  # The CSV row was read, and skipped in favour of the edit
+    assert module.find_product(last_id).name == "Edited During Warmup"
+    assert module.find_product("40-681-9981") is None
+    assert module.find_product("ZZ-000-0001").name == "Added During Build"  # Replayed onto the new tree
+    assert module.find_product("29-205-1132") is None
+    assert len(module.inventory_data_bst) == 989
+    assert last_id in [p.product_id for p in module.category_index.products("Dairy")]
+    assert "ZZ-000-0001" in [p.product_id for p in module.category_index.products("Dairy")]
+
+def test_lazy_rejects_snapshot_path(tmp_path):
+    try:
+        InventoryModule(snapshot_path=str(tmp_path / "x.snap"), lazy=True)
+        assert False
+    except ValueError:
+        pass
+
+def _height(node):
+    return 1 + max(_height(node.left), _height(node.right)) if node else 0
+
+def test_lazy_load_streams_rows_once_and_stays_balanced(tmp_path, monkeypatch):
+    path = tmp_path / "products.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["product_id", "name", "category", "price", "quantity", "reorder_level", "reorder_quantity"])
+        for i in range(5000):   # Sorted by product_id, like the real catalog
+            writer.writerow([f"P{i:05d}", f"Item {i}", "Dairy", 1.0, 10, 5, 20])
+    reads = []
+    def rows():
+        for product in iter_records(path, PRODUCT_SCHEMA):
+            reads.append(product.product_id)
+            yield product
+    monkeypatch.setattr(inventory_module, "iter_inventory_products", rows)
+    data_loader.invalidate_parse_cache()
+    module = InventoryModule(lazy=True, hot_entries=20)
+    assert module.wait_until_loaded(timeout=30) and module.load_error is None
+    assert not data_loader._parse_cache  # Streamed once, never parsed whole into the cache
+    assert len(module.inventory_data_bst) == 5000 and reads == [f"P{i:05d}" for i in range(5000)]
+    assert _height(module.inventory_data_bst.root) <= 13
@@ -0,0 +1,54 @@
+import random
+from src.pos_system.inventory.low_stock_heap import LowStockHeap
+from src.pos_system.inventory.inventory_module import InventoryModule
+from src.pos_system.common.Product import Product
+
+def _product(pid, quantity, reorder_level):
+    return Product(product_id=pid, name=pid, category="Test", price=1.0, quantity=quantity, reorder_level=reorder_level)
+
+def test_low_stock_heap_below_reorder_level():
+    products = [_product("a", 5, 10), _product("b", 50, 10), _product("c", 0, 20), _product("d", 10, 10)]
+    heap = LowStockHeap.from_products(products)
+    assert [p.product_id for p in heap.below_reorder_level()] == ["c", "a"]  # lowest margin first
+
+    products[1].quantity = 1    # b drops below its reorder level
+    heap.update(products[1])
+    products[2].quantity = 100  # c is restocked
+    heap.update(products[2])
+    assert [p.product_id for p in heap.below_reorder_level()] == ["b", "a"]
+
+    heap.remove("b")
+    heap.remove("missing")
+    heap.update(_product("e", 2, 3))
+    assert [p.product_id for p in heap.below_reorder_level()] == ["a", "e"]
+    assert len(heap) == 4
+
+def test_low_stock_heap_random_updates():
+    rng = random.Random(9)
+    products = {str(i): _product(str(i), rng.randrange(100), rng.randrange(100)) for i in range(300)}
+    heap = LowStockHeap.from_products(products.values())
+    for _ in range(1000):
+        pid = str(rng.randrange(400))
+        if rng.random() < 0.2:
+            heap.remove(pid)
+            products.pop(pid, None)
+        else:
+            product = products.setdefault(pid, _product(pid, 0, 0))
+            product.quantity = rng.randrange(100)
+            heap.update(product)
+    expected = sorted((p for p in products.values() if p.quantity < p.reorder_level),
+                      key=lambda p: (p.quantity - p.reorder_level, p.product_id))
+    assert heap.below_reorder_level() == expected
+
+def test_inventory_module_tracks_low_stock():
+    module = InventoryModule()
+    low_before = {p.product_id for p in module.low_stock.below_reorder_level()}
+    assert all(p.quantity < p.reorder_level for p in module.low_stock.below_reorder_level())
+
+    module.add_product(Product("00-000-0001", "Yogurt", "Dairy", 1.5, 50, reorder_level=20, reorder_quantity=40))
+    assert "00-000-0001" not in {p.product_id for p in module.low_stock.below_reorder_level()}
+    module.adjust_stock("00-000-0001", -45)
+    assert "00-000-0001" in {p.product_id for p in module.low_stock.below_reorder_level()}
+    module.remove_product("00-000-0001")
+    assert {p.product_id for p in module.low_stock.below_reorder_level()} == low_before
+    assert module.adjust_stock("00-000-0001", 5) is None
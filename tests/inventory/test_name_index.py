@@ -0,0 +1,36 @@
+from src.pos_system.inventory.name_index import NameIndex
+from src.pos_system.inventory.inventory_data_loader import build_inventory_name_index
+from src.pos_system.inventory.inventory_module import InventoryModule
+from src.pos_system.common.Product import Product
+
+def test_name_index_complete():
+    products = [
+        Product(product_id="01", name="Rice Flour", price=2.0, category="Grains & Pulses", quantity=52),
+        Product(product_id="02", name="rice", price=1.0, category="Grains & Pulses", quantity=10),
+        Product(product_id="03", name="Black Rice", price=6.0, category="Grains & Pulses", quantity=30),
+        Product(product_id="04", name="Rice Flour", price=2.5, category="Grains & Pulses", quantity=8),
+    ]
+    index = NameIndex.from_products(products)
+    assert [p.product_id for p in index.complete("RIC")] == ["02", "01", "04"]
+    assert [p.product_id for p in index.complete("rice f", limit=1)] == ["01"]
+    assert index.complete("z") == []
+    assert len(index.complete("")) == 4
+
+    index.remove(products[1])
+    index.add(Product(product_id="05", name="Ricotta", price=4.0, category="Dairy", quantity=3))
+    assert [p.name for p in index.complete("ric")] == ["Rice Flour", "Rice Flour", "Ricotta"]
+
+def test_build_inventory_name_index():
+    index = build_inventory_name_index()
+    assert len(index) == 990  # every product, duplicate names included
+    matches = index.complete("sushi r", limit=100)
+    assert matches and all(p.name.lower().startswith("sushi r") for p in matches)
+
+def test_inventory_module_keeps_name_index_in_sync():
+    module = InventoryModule()
+    module.add_product(Product(product_id="00-000-0001", name="Zzyzx Tea", price=1.5, category="Beverages", quantity=12))
+    assert [p.product_id for p in module.name_index.complete("zzy")] == ["00-000-0001"]
+    module.add_product(Product(product_id="00-000-0001", name="Qwerty Tea", price=1.5, category="Beverages", quantity=12))
+    assert module.name_index.complete("zzy") == []
+    module.remove_product("00-000-0001")
+    assert module.name_index.complete("qwerty") == []
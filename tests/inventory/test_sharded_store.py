@@ -0,0 +1,96 @@
+import random
+import threading
+from src.pos_system.inventory.sharded_store import ShardedInventoryStore, ReadWriteLock
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.splay_tree import SplayTree
+
+def test_sharded_store_basic_operations():
+    for partition in ("hash", "range"):
+        store = ShardedInventoryStore.from_sorted([(k, str(k)) for k in range(100)], shards=4, partition=partition)
+        assert store.shard_count == 4
+        assert len(store) == 100
+        assert store.search(42) == "42" and store.search(1000) is None
+        store.insert(1000, "1000")
+        store.delete(0)
+        keys = [key for key, _ in store.items()]
+        assert keys == list(range(1, 100)) + [1000]
+
+def test_sharded_store_range_boundaries():
+    store = ShardedInventoryStore(tree_class=SplayTree, boundaries=["20", "50"])
+    assert store.shard_count == 3
+    for key in ["10", "20", "30", "50", "60"]:
+        store.insert(key, key)
+    assert [len(tree) for tree in store._trees] == [2, 2, 1]
+    assert [key for key, _ in store.items()] == ["10", "20", "30", "50", "60"]
+
+def test_read_write_lock_excludes_writers():
+    lock = ReadWriteLock()
+    state = {"readers": 0, "writer": False, "violations": 0}
+    guard = threading.Lock()
+
+    def reader():
+        for _ in range(200):
+            with lock.read_locked():
+                with guard:
+                    state["readers"] += 1
+                    state["violations"] += state["writer"]
+                with guard:
+                    state["readers"] -= 1
+
+    def writer():
+        for _ in range(200):
+            with lock.write_locked():
+                with guard:
+                    state["violations"] += state["readers"] > 0 or state["writer"]
+                    state["writer"] = True
+                with guard:
+                    state["writer"] = False
+
+    threads = [threading.Thread(target=reader) for _ in range(4)] + [threading.Thread(target=writer) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert state["violations"] == 0
+
+def test_sharded_store_concurrent_stress():
+    # Each worker owns a disjoint key range and mixes inserts, searches and
+    # deletes; other workers' searches on a splay shard mutate the same trees.
+    for tree_class in (BinarySearchTree, SplayTree):
+        store = ShardedInventoryStore(shards=4, tree_class=tree_class)
+        workers, per_worker = 8, 300
+        expected = [set() for _ in range(workers)]
+        errors = []
+
+        def work(worker):
+            rng = random.Random(worker)
+            own = range(worker * per_worker, (worker + 1) * per_worker)
+            try:
+                for _ in range(1500):
+                    key = rng.choice(own)
+                    action = rng.random()
+                    if action < 0.5:
+                        store.insert(key, key * 10)
+                        expected[worker].add(key)
+                    elif action < 0.7:
+                        store.delete(key)
+                        expected[worker].discard(key)
+                    else:
+                        value = store.search(key)
+                        if (value is not None) != (key in expected[worker]):
+                            errors.append((worker, key))
+                        store.search(rng.randrange(workers * per_worker))   # read someone else's shard
+            except Exception as exc:   # surface thread failures in the main thread
+                errors.append(exc)
+
+        threads = [threading.Thread(target=work, args=(w,)) for w in range(workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        all_keys = sorted(set().union(*expected))
+        assert [key for key, _ in store.items()] == all_keys
+        assert all(store.search(key) == key * 10 for key in all_keys)
+        assert len(store) == len(all_keys)
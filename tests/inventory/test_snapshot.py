@@ -0,0 +1,79 @@
+import random
+from src.pos_system.inventory import snapshot
+from src.pos_system.inventory.snapshot import SnapshotError, load_snapshot, save_snapshot
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.splay_tree import SplayTree
+from src.pos_system.inventory.inventory_data_loader import build_inventory_bst, InventoryKeyType
+
+def _shape(node):
+    return None if node is None else (node.key, node.size, _shape(node.left), _shape(node.right))
+
+def test_snapshot_round_trip_inventory(tmp_path):
+    bst = build_inventory_bst(InventoryKeyType.PRODUCT_ID)
+    bst.insert("zz-unbalanced")  # make the shape irregular
+    bst.delete("29-205-1132")
+    path = tmp_path / "inventory.snap"
+    assert save_snapshot(bst, path) == len(bst)
+
+    for tree_class in (BinarySearchTree, SplayTree):
+        restored = load_snapshot(path, tree_class)
+        assert isinstance(restored, tree_class)
+        assert _shape(restored.root) == _shape(bst.root)  # same shape and subtree sizes
+        node = restored.search("40-681-9981")
+        assert node.value.name == "Arabica Coffee" and node.value.price == 20.0
+        assert node.value.reorder_level == 77 and node.value.reorder_quantity == 2
+        assert restored.search("zz-unbalanced").value is None
+
+def test_snapshot_int_keys_and_empty_tree(tmp_path):
+    t = BinarySearchTree[int]()
+    keys = list(range(200))
+    random.Random(3).shuffle(keys)
+    for key in keys:
+        t.insert(key)
+    path = tmp_path / "ints.snap"
+    save_snapshot(t, path)
+    restored = load_snapshot(path)
+    assert [n.key for n in restored.traverse()] == list(range(200))
+    assert restored.select(150).key == 150
+
+    save_snapshot(BinarySearchTree(), path)
+    assert load_snapshot(path).root is None
+
+def test_snapshot_rejects_corruption(tmp_path):
+    t = BinarySearchTree.from_sorted([(k, None) for k in ["a", "b", "c"]])
+    path = tmp_path / "bad.snap"
+    save_snapshot(t, path)
+    data = bytearray(path.read_bytes())
+
+    for corrupt in (data[:-1], data[:4], b"NOTSNP" + data[6:], data[:-1] + bytes([data[-1] ^ 1])):
+        path.write_bytes(bytes(corrupt))
+        try:
+            load_snapshot(path)
+            assert False, "corrupt snapshot must be rejected"
+        except SnapshotError:
+            pass
+
+def test_failed_save_keeps_previous_snapshot(tmp_path, monkeypatch):
+    path = tmp_path / "inventory.snap"
+    save_snapshot(BinarySearchTree.from_sorted([(k, None) for k in ["a", "b"]]), path)
+    before = path.read_bytes()
+    def disk_full(fd):
+        raise OSError(28, "No space left on device")
+    monkeypatch.setattr(snapshot.os, "fsync", disk_full)
+    try:
+        save_snapshot(BinarySearchTree.from_sorted([(k, None) for k in ["a", "b", "c"]]), path)
+        assert False
+    except OSError:
+        pass
+    assert path.read_bytes() == before
+    assert [n.key for n in load_snapshot(path).traverse()] == ["a", "b"]
+    assert not path.with_suffix(".tmp").exists()
+
+def test_inventory_module_starts_from_snapshot(tmp_path):
+    from src.pos_system.inventory.inventory_module import InventoryModule
+    path = tmp_path / "inventory.snap"
+    first = InventoryModule(snapshot_path=str(path))  # no snapshot yet: CSV build, then save
+    assert path.exists() and len(first.inventory_data_bst) == 990
+    second = InventoryModule(snapshot_path=str(path))
+    assert _shape(second.inventory_data_bst.root) == _shape(first.inventory_data_bst.root)
+    assert second.category_index.count("Dairy") == first.category_index.count("Dairy")
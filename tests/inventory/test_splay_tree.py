@@ -161,3 +161,121 @@ def test_build_inventory_splay_tree():
         assert node is not None
         assert node.value.product_id == pid
         assert node.value.name == name
+
+def test_splay_tree_top_down_matches_bottom_up():
+    keys = [50, 20, 80, 10, 30, 70, 90, 25, 35, 75, 5, 95]
+    top_down = SplayTree[int]()
+    bottom_up = SplayTree[int](top_down=False)
+    for key in keys:
+        top_down.insert(key, value=str(key))
+        bottom_up.insert(key, value=str(key))
+    assert [n.key for n in top_down.traverse()] == [n.key for n in bottom_up.traverse()]
+
+    for key in [30, 99, 5, 75]:
+        found_td, found_bu = top_down.search(key), bottom_up.search(key)
+        assert (found_td is None) == (found_bu is None)
+        assert top_down.root.key == bottom_up.root.key  # same node splayed to root
+
+    top_down.insert(30, value="updated")
+    assert top_down.root.key == 30 and top_down.root.value == "updated"
+
+    for key in [50, 5, 95, 42]:
+        top_down.delete(key)
+        bottom_up.delete(key)
+    assert [n.key for n in top_down.traverse()] == [n.key for n in bottom_up.traverse()]
+
+def test_splay_tree_top_down_sorted_load():
+    n = 5000  # bottom-up splaying would exceed the recursion limit here
+    t = SplayTree[int]()
+    for key in range(n):
+        t.insert(key)
+    assert t.root.key == n - 1
+    node = t.search(0)  # deepest node of the degenerate chain
+    assert node is not None and t.root.key == 0
+    t.delete(0)
+    assert t.search(0) is None and t.search(1) is not None
+
+def test_splay_tree_from_sorted():
+    items = [(key, str(key)) for key in range(1, 8)]
+    t = SplayTree.from_sorted(items)
+    assert t.root.key == 4  # middle key becomes the root
+    assert [(n.key, n.value) for n in t.traverse()] == items
+    assert t.search(7).value == "7" and t.root.key == 7
+
+    assert SplayTree.from_sorted(items, top_down=False).top_down is False
+    try:
+        SplayTree.from_sorted([(2, None), (1, None)])
+        assert False, "unsorted keys must be rejected"
+    except ValueError:
+        pass
+
+def test_splay_tree_range_and_prefix():
+    ids = ["29-205-1132", "29-205-0001", "29-206-0001", "40-681-9981", "06-955-3428", "29-205-9999", "29-2050"]
+    t = SplayTree[str]()
+    for pid in ids:
+        t.insert(pid)
+
+    assert [n.key for n in t.iter_prefix("29-205-")] == ["29-205-0001", "29-205-1132", "29-205-9999"]
+    assert t.root.key == "29-205-0001"  # first key of the range is splayed to root
+    assert [n.key for n in t.iter_prefix("99-")] == []
+    assert [n.key for n in t.iter_range("29-205-1132", "40-681-9981")] == ["29-205-1132", "29-205-9999", "29-2050", "29-206-0001", "40-681-9981"]
+    assert [n.key for n in t.iter_range(high="29-205-0001")] == ["06-955-3428", "29-205-0001"]
+    assert [n.key for n in t.iter_range()] == sorted(ids)
+
+    assert t.floor("29-205-5000").key == "29-205-1132"
+    assert t.root.key == "29-205-1132"
+    assert t.floor("00") is None
+    assert t.ceiling("29-205-5000").key == "29-205-9999"
+    assert t.ceiling("40-681-9981").key == "40-681-9981"
+    assert t.ceiling("99") is None
+    assert [n.key for n in t.traverse()] == sorted(ids)
+
+def test_splay_tree_select_rank():
+    import random
+    keys = list(range(0, 200, 2))
+    random.Random(5).shuffle(keys)
+    for top_down in (True, False):
+        t = SplayTree[int](top_down=top_down)
+        for key in keys:
+            t.insert(key)
+        t.insert(keys[0], value="dup")  # updating a key must not change sizes
+        ordered = sorted(keys)
+        assert len(t) == len(keys)
+        assert [t.select(i).key for i in range(len(t))] == ordered
+        assert t.root.key == ordered[-1]  # selected node is splayed to root
+        assert [t.rank(k) for k in ordered] == list(range(len(ordered)))
+        assert t.rank(-1) == 0 and t.rank(51) == 26 and t.rank(1000) == len(keys)
+
+        # sizes must survive splay rotations on search and delete
+        for key in keys[:50] + [1, 999]:
+            t.search(key)
+            t.delete(key)
+            if key in ordered:
+                ordered.remove(key)
+            assert len(t) == len(ordered)
+        assert [t.select(i).key for i in range(len(t))] == ordered
+
+    bulk = SplayTree.from_sorted([(k, None) for k in range(10)])
+    assert len(bulk) == 10 and bulk.select(7).key == 7 and bulk.rank(3) == 3
+
+def test_splay_tree_search_many():
+    keys = [50, 20, 80, 10, 30, 70, 90]
+    for splay_each in (False, True):
+        t = SplayTree[int]()
+        for key in keys:
+            t.insert(key, value=key * 2)
+        basket = [90, 15, 10, 50, 90, 71, 30]
+        results = t.search_many(basket, splay_each=splay_each)
+        assert [n.value if n else None for n in results] == [180, None, 20, 100, 180, None, 60]
+        assert t.root.key == 30  # last key of the basket ends at the root
+        assert [n.key for n in t.traverse()] == sorted(keys)
+        assert len(t) == len(keys)
+
+def test_splay_tree_traverse_reverse_and_resume():
+    t = SplayTree[int]()
+    for key in range(3000):  # sorted inserts leave a left-leaning chain
+        t.insert(key)
+    assert [n.key for n in t.traverse()] == list(range(3000))
+    assert [n.key for n in t.traverse(reverse=True, start=2)] == [2, 1, 0]
+    assert [n.key for n in t.traverse(start=2997)] == [2997, 2998, 2999]
+    assert t.root.key == 2999  # traversal does not splay
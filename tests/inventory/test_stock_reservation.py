@@ -0,0 +1,74 @@
+from src.pos_system.inventory.stock_reservation import InsufficientStockError, reserve
+from src.pos_system.inventory.binary_search_tree import BinarySearchTree
+from src.pos_system.inventory.splay_tree import SplayTree
+from src.pos_system.inventory.inventory_module import InventoryModule
+from src.pos_system.common.Product import Product
+
+def _tree(tree_class):
+    products = [
+        Product(product_id="01", name="Milk", price=2.0, category="Dairy", quantity=10),
+        Product(product_id="02", name="Apple", price=0.5, category="Fruit", quantity=3),
+        Product(product_id="03", name="Cheese", price=5.0, category="Dairy", quantity=1),
+    ]
+    return tree_class.from_sorted((p.product_id, p) for p in products), products
+
+def test_reserve_commit_and_rollback():
+    for tree_class in (BinarySearchTree, SplayTree):
+        tree, products = _tree(tree_class)
+        reservation = reserve(tree, {"01": 4, "02": 3})
+        assert [p.quantity for p in products] == [6, 0, 1]
+        reservation.rollback()
+        assert [p.quantity for p in products] == [10, 3, 1]
+
+        reservation = reserve(tree, [("01", 2), ("03", 1), ("01", 3)])  # duplicate lines are summed
+        reservation.commit()
+        assert [p.quantity for p in products] == [5, 3, 0]
+        try:
+            reservation.rollback()
+            assert False, "a committed reservation cannot be rolled back"
+        except RuntimeError:
+            pass
+
+def test_reserve_is_all_or_nothing():
+    tree, products = _tree(BinarySearchTree)
+    try:
+        reserve(tree, [("01", 5), ("02", 4), ("99", 1), ("03", 1)])
+        assert False, "short basket must raise"
+    except InsufficientStockError as error:
+        assert error.shortages == {"02": (4, 3), "99": (1, -1)}
+    assert [p.quantity for p in products] == [10, 3, 1]  # nothing changed
+
+    try:
+        reserve(tree, {"01": 0})
+        assert False, "non-positive quantities must raise"
+    except ValueError:
+        pass
+
+def test_inventory_module_reserve_stock_updates_low_stock():
+    module = InventoryModule()
+    module.add_product(Product("00-000-0001", "Yogurt", "Dairy", 1.5, 50, reorder_level=20))
+    reservation = module.reserve_stock({"00-000-0001": 40})
+    assert "00-000-0001" in {p.product_id for p in module.low_stock.below_reorder_level()}
+    reservation.rollback()
+    assert module.inventory_data_bst.search("00-000-0001").value.quantity == 50
+    assert "00-000-0001" not in {p.product_id for p in module.low_stock.below_reorder_level()}
+
+def test_rollback_keeps_later_stock_changes():
+    tree, products = _tree(BinarySearchTree)
+    first = reserve(tree, {"01": 2})
+    reserve(tree, {"01": 3}).commit()
+    products[0].quantity += 4 # Restock after both reservations
+    first.rollback()
+    assert products[0].quantity == 11  # 10 - 2 - 3 + 4 + 2: the other basket and the restock are kept
+
+def test_rollback_runs_under_the_given_lock():
+    tree, products = _tree(BinarySearchTree)
+    events = []
+    class _Lock:
+        def __enter__(self):
+            events.append("acquire")
+        def __exit__(self, *exc):
+            events.append("release")
+    reservation = reserve(tree, {"01": 2}, on_change=lambda product: events.append(product.quantity), lock=_Lock())
+    reservation.rollback()
+    assert events == [8, "acquire", 10, "release"]
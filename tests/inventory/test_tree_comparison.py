@@ -33,9 +33,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     ## Search comparison
     # BST search
@@ -55,9 +55,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST search time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree search time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST search time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree search time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     ## Search 20% comparison
     search_keys = numbers[:int(n*0.2)]
@@ -78,9 +78,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST search time for 20% of {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree search time for 20% of {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST search time for 20% of {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree search time for 20% of {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
 def test_tree_insertion_search_comparison_random_100():
     n = 100
@@ -136,13 +136,13 @@ def test_tree_insertion_search_comparison_random_100():
     total_splayint_duration = end_splayint - start_splayint
 
     print()
-    print(f"BST (STR) insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree (STR) insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree (STR) was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST (STR) by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST (STR) insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree (STR) insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree (STR) was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST (STR) by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
-    print(f"BST (INT) insertion time for {n} nodes: {total_bstint_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree (INT) insertion time for {n} nodes: {total_splayint_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree (INT) was {'faster' if total_splayint_duration < total_bstint_duration else 'slower'} than BST (INT) by {abs(total_splayint_duration - total_bstint_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST (INT) insertion time for {n} nodes: {total_bstint_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree (INT) insertion time for {n} nodes: {total_splayint_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree (INT) was {'faster' if total_splayint_duration < total_bstint_duration else 'slower'} than BST (INT) by {abs(total_splayint_duration - total_bstint_duration)*1000*1000:.6f} microseconds")
 
     ## Search comparison
     # BST STR search
@@ -174,13 +174,13 @@ def test_tree_insertion_search_comparison_random_100():
     total_splayint_duration = end_splayint - start_splayint
 
     print()
-    print(f"BST search time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree search time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST search time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree search time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
-    print(f"BST (INT) search time for {n} nodes: {total_bstint_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree (INT) search time for {n} nodes: {total_splayint_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree (INT) was {'faster' if total_splayint_duration < total_bstint_duration else 'slower'} than BST (INT) by {abs(total_splayint_duration - total_bstint_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST (INT) search time for {n} nodes: {total_bstint_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree (INT) search time for {n} nodes: {total_splayint_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree (INT) was {'faster' if total_splayint_duration < total_bstint_duration else 'slower'} than BST (INT) by {abs(total_splayint_duration - total_bstint_duration)*1000*1000:.6f} microseconds")
 
 def test_tree_deletion_comparison_random_100():
     n = 100
@@ -224,9 +224,9 @@ def test_tree_deletion_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST deletion time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree deletion time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST deletion time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree deletion time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
 def test_tree_search_comparison_random_100_20percent():
     n = 100
@@ -274,6 +274,6 @@ def test_tree_search_comparison_random_100_20percent():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST 20/80 search time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree 20/80 search time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
\ No newline at end of file
+    print(f"BST 20/80 search time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree 20/80 search time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
\ No newline at end of file
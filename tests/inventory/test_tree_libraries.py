@@ -36,9 +36,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST str insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree str insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree str was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST str by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST str insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree str insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree str was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST str by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     # Build BST with library
     bst_library = BST.CreateBST()
@@ -57,9 +57,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST library insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree library insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree library was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST library insertion time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree library insertion time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree library was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     ## Search comparison
     # BST search
@@ -79,9 +79,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST str search time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree str search time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree str was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST str by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST str search time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree str search time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree str was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST str by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     # BST search with library
     start_bst = time.perf_counter()
@@ -100,9 +100,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST library search time for {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree library search time for {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree library was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST str by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST library search time for {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree library search time for {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree library was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST str by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     ## Search 20% comparison
     search_keys = numbers_str[:int(n*0.2)]
@@ -123,9 +123,9 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST search time for 20% of {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree search time for 20% of {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
+    print(f"BST search time for 20% of {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree search time for 20% of {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
 
     # BST search with library
     start_bst = time.perf_counter()
@@ -144,6 +144,6 @@ def test_tree_normal_comparison_random_100():
     total_splay_duration = end_splay - start_splay
 
     print()
-    print(f"BST library search time for 20% of {n} nodes: {total_bst_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree library search time for 20% of {n} nodes: {total_splay_duration*1000*1000:.6f} nanoseconds")
-    print(f"Splay Tree library was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} nanoseconds")
\ No newline at end of file
+    print(f"BST library search time for 20% of {n} nodes: {total_bst_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree library search time for 20% of {n} nodes: {total_splay_duration*1000*1000:.6f} microseconds")
+    print(f"Splay Tree library was {'faster' if total_splay_duration < total_bst_duration else 'slower'} than BST by {abs(total_splay_duration - total_bst_duration)*1000*1000:.6f} microseconds")
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""Tests for the iterative loyalty AVL tree."""
+import random
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.logger import INFO, WARNING, configure_logging
+from src.pos_system.loyalty.avl_tree import AVLTree
+
+
+def _check_avl(node, low=None, high=None):
+    """Return the subtree height after checking order, stored heights and balance"""
+    if node is None:
+        return 0
+    key = node.customer.customer_id
+    assert (low is None or key > low) and (high is None or key < high)
+    left, right = _check_avl(node.left, low, key), _check_avl(node.right, key, high)
+    assert abs(left - right) <= 1 and node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_avl_insert_returns_whether_inserted():
+    configure_logging(level=WARNING)
+    try:
+        tree = AVLTree()
+        assert tree.insert(Customer("C002", "Ann", 10)) is True
+        assert tree.insert(Customer("C001", "Bob", 20)) is True
+        assert tree.insert(Customer("C002", "Other", 99)) is False
+        assert tree.search("C002").name == "Ann"
+        assert tree.search("C003") is None
+    finally:
+        configure_logging(level=INFO)
+
+
+def test_avl_sorted_inserts_stay_balanced():
+    configure_logging(level=WARNING)
+    try:
+        tree = AVLTree()
+        for i in range(1023):
+            tree.insert(Customer(f"C{i:04d}", f"Customer {i}"))
+        assert _check_avl(tree.root) == 10 # 1023 nodes fit a perfect tree of height 10
+        assert [c.customer_id for c in tree.inorder_traversal()] == [f"C{i:04d}" for i in range(1023)]
+    finally:
+        configure_logging(level=INFO)
+
+
+def test_avl_random_inserts_and_deletes_match_a_set():
+    configure_logging(level=WARNING)
+    try:
+        rng = random.Random(7)
+        tree = AVLTree()
+        expected = set()
+        for _ in range(3000):
+            key = f"C{rng.randrange(400):03d}"
+            if rng.random() < 0.55:
+                assert tree.insert(Customer(key, key)) is (key not in expected)
+                expected.add(key)
+            else:
+                tree.delete(key)    # Deleting a missing key is a no-op
+                expected.discard(key)
+            _check_avl(tree.root)
+        assert [c.customer_id for c in tree.inorder_traversal()] == sorted(expected)
+        for key in sorted(expected):
+            tree.delete(key)
+        assert tree.root is None
+    finally:
+        configure_logging(level=INFO)
+
+
+def test_avl_from_sorted_sets_heights():
+    customers = [Customer(f"C{i:03d}", f"Customer {i}") for i in range(100)]
+    tree = AVLTree.from_sorted(customers)
+    assert _check_avl(tree.root) == 7
+    assert tree.inorder_traversal() == customers
+    try:
+        AVLTree.from_sorted([customers[1], customers[0]])
+        assert False
+    except ValueError:
+        pass
@@ -0,0 +1,80 @@
+"""Tests for the workload benchmark suite (tiny sizes, correctness only)."""
+import json
+from src.pos_system.benchmarks import WORKLOADS, compare_results, run_benchmarks, run_once, summarise
+from src.pos_system.benchmarks.__main__ import main
+from src.pos_system.benchmarks.runner import percentile
+from src.pos_system.common import logger
+from src.pos_system.common.logger import INFO, configure_logging, flush_logs, log_operation, logging_settings
+
+
+def test_percentile_and_summary():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50 and percentile(values, 95) == 95 and percentile(values, 100) == 100
+    summary = summarise([1000] * 10)
+    assert summary["median_ns"] == 1000 and summary["ops"] == 10
+    assert summary["ops_per_sec"] == 1_000_000
+
+
+def test_workloads_are_deterministic_and_valid():
+    for name, make in WORKLOADS.items():
+        first, second = make(200, 300, 5), make(200, 300, 5)
+        assert first.operations == second.operations, name
+        assert first.operations
+    delete_heavy = WORKLOADS["delete-heavy"](100, 500, 1)
+    live = set(delete_heavy.preload)
+    for name, (key, *_) in delete_heavy.operations:  # deletes and searches only hit live keys
+        if name == "insert":
+            assert key not in live
+            live.add(key)
+        elif name == "delete":
+            live.remove(key)
+        else:
+            assert key in live
+
+
+def test_run_benchmarks_statuses():
+    results = run_benchmarks(backends=["bst", "splay", "btree"], workloads=["uniform", "sorted", "delete-heavy"],
+                             sizes=[50], ops=100, repeats=2, max_degenerate=10)["results"]
+    status = {(r["backend"], r["workload"]): r["status"] for r in results}
+    assert status[("bst", "uniform")] == "ok"
+    assert status[("bst", "sorted")] == "skipped"  # above max_degenerate
+    assert status[("splay", "sorted")] == "ok"
+    assert status[("btree", "delete-heavy")] == "unsupported"
+    ok = next(r for r in results if r["backend"] == "splay" and r["workload"] == "uniform")
+    assert ok["ops"] == 200 and ok["median_ns"] <= ok["p95_ns"] <= ok["p99_ns"]
+    assert len(run_once("bst", WORKLOADS["sequential-range"](100, 20, 0))) == 20
+
+
+def test_compare_flags_regressions(tmp_path, capsys):
+    def run(median):
+        return {"meta": {}, "results": [
+            {"backend": "bst", "workload": "uniform", "size": 10, "status": "ok", "median_ns": median, "p95_ns": median, "p99_ns": median},
+            {"backend": "bst", "workload": "sorted", "size": 10, "status": "skipped"},
+        ]}
+    rows = compare_results(run(1000), run(1300), threshold=0.1)
+    assert [row["verdict"] for row in rows] == ["regression"]
+    assert compare_results(run(1000), run(700))[0]["verdict"] == "improvement"
+
+    baseline, current = tmp_path / "baseline.json", tmp_path / "current.json"
+    baseline.write_text(json.dumps(run(1000)))
+    current.write_text(json.dumps(run(1050)))
+    assert main(["compare", str(baseline), str(current)]) == 0
+    current.write_text(json.dumps(run(2000)))
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_run_benchmarks_leaves_log_file_and_settings_alone(tmp_path):
+    path = tmp_path / "operations.log"
+    configure_logging(level=INFO, console=False, path=str(path))
+    try:
+        log_operation("Before benchmark")
+        flush_logs()
+        before = path.read_text()
+        run_benchmarks(backends=["avl", "loyalty_bst"], workloads=["uniform", "delete-heavy"],
+                       sizes=[50], ops=100, repeats=1)
+        flush_logs()
+        assert path.read_text() == before
+        assert logging_settings() == {"level": INFO, "console": False}
+    finally:
+        configure_logging(level=INFO, console=True, path=logger.DEFAULT_LOG_FILE)
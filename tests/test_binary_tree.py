@@ -31,3 +31,11 @@ def test_binary_tree_basic_operations():
     t.delete(10)
     keys = [n.key for n in t.traverse()]
     assert keys == [5, 15]
+
+
+def test_binary_tree_traverse_reverse_and_resume():
+    t = BinaryTree[int]()
+    for key in [10, 5, 15, 12, 3]:
+        t.insert(key)
+    assert [n.key for n in t.traverse(reverse=True)] == [15, 12, 10, 5, 3]
+    assert [n.key for n in t.traverse(start=11)] == [12, 15]
@@ -1,10 +1,21 @@
 """Tests that demonstrate loading data and using it with tree structures."""
 
 from src.pos_system.common.data_loader import (
+    CUSTOMER_SCHEMA,
+    PRODUCT_SCHEMA,
+    LoadStats,
+    iter_inventory_products,
+    iter_records,
+    load_customers,
     load_inventory_products,
     load_sales_transactions,
 )
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.Product import Product
+from src.pos_system.common.logger import ERROR, INFO, WARNING, configure_logging
 from src.pos_system.example.binary_tree import BinaryTree as ExampleBinaryTree
+from src.pos_system.loyalty.avl_tree import AVLTree
+from src.pos_system.loyalty.binary_tree import BSTTree
 
 
 def test_load_inventory_data():
@@ -45,3 +56,144 @@ def test_populate_tree_with_product_data():
     keys = [n.key for n in tree.traverse()]
     assert len(keys) == 100
     assert keys == sorted(keys)  # in-order traversal should be sorted
+
+
+def test_load_inventory_reorder_columns():
+    """Test that the extracted inventory keeps the reorder columns."""
+    products = load_inventory_products()
+    assert products[0]["reorder_level"] == "72"
+    assert products[0]["reorder_quantity"] == "70"
+
+
+def test_iter_inventory_products_yields_typed_products():
+    """Test that the streaming loader parses rows straight into Products."""
+    stats = LoadStats()
+    products = iter_inventory_products(stats=stats)
+    first = next(products)
+    assert isinstance(first, Product)
+    assert first.product_id == "29-205-1132" and first.price == 4.5
+    assert first.reorder_level == 72 and first.reorder_quantity == 70
+    assert 1 + sum(1 for _ in products) == 990
+    assert stats.rows == stats.loaded == 990 and stats.malformed == 0
+
+
+def test_iter_records_counts_malformed_rows(tmp_path):
+    """Test that bad rows are skipped and counted instead of failing the load."""
+    path = tmp_path / "products.csv"
+    path.write_text(
+        "product_id,name,category,price,quantity,reorder_level,reorder_quantity\n"
+        "A-1,Milk,Dairy,1.50,10,5,20\n"
+        "A-2,Bread,Bakery,not-a-price,4,1,1\n"
+        "A-3,Short row,Dairy\n"
+        "\n"
+        "A-4,Tea,Beverages,3.00,7,,\n"
+    )
+    stats = LoadStats()
+    products = list(iter_records(path, PRODUCT_SCHEMA, stats))
+    assert [p.product_id for p in products] == ["A-1", "A-4"]
+    assert products[1].reorder_level == 0  # empty optional cells use the default
+    assert stats.rows == 4 and stats.loaded == 2 and stats.malformed == 2
+    assert len(stats.errors) == 2
+
+
+def test_iter_records_missing_required_column(tmp_path):
+    """Test that a header without a required column is rejected."""
+    path = tmp_path / "customers.csv"
+    path.write_text("customer_id,name\nC1,Ann\n")
+    try:
+        list(iter_records(path, CUSTOMER_SCHEMA))
+        assert False
+    except ValueError:
+        pass
+    path.write_text("customer_id,name,loyalty_points,tier,join_date\nC1,Ann,120,Gold,2024-01-02\n")
+    (customer,) = iter_records(path, CUSTOMER_SCHEMA)
+    assert isinstance(customer, Customer) and customer.loyalty_points == 120
+
+
+def test_load_csv_reuses_parse_until_file_changes(tmp_path):
+    """Test the (path, mtime, size) parse cache and its invalidation."""
+    from src.pos_system.common import data_loader
+    first = load_inventory_products()
+    first[0]["name"] = "changed by caller"
+    second = load_inventory_products()
+    assert second[0]["name"] == "Sushi Rice"  # callers get fresh dicts
+
+    path = tmp_path / "customers.csv"
+    path.write_text("customer_id,name,loyalty_points,tier,join_date\nC1,Ann,120,Gold,2024-01-02\n")
+    assert [c.name for c in data_loader.load_records(path, CUSTOMER_SCHEMA)] == ["Ann"]
+    path.write_text("customer_id,name,loyalty_points,tier,join_date\nC1,Ann,120,Gold,2024-01-02\nC2,Bob,5,Bronze,2024-02-03\n")
+    assert [c.name for c in data_loader.load_records(path, CUSTOMER_SCHEMA)] == ["Ann", "Bob"]  # size changed
+    data_loader.invalidate_parse_cache(path)
+    assert not any(cached == path.resolve() for cached, _ in data_loader._parse_cache)
+
+
+def test_disk_parse_cache_skips_parsing(tmp_path, monkeypatch):
+    """Test that a second start reads the parsed cache file instead of the CSV."""
+    from src.pos_system.common import data_loader
+    path = tmp_path / "products.csv"
+    path.write_text("product_id,name,category,price,quantity,reorder_level,reorder_quantity\nA-1,Milk,Dairy,1.50,10,5,20\n")
+    kind = data_loader._schema_kind(PRODUCT_SCHEMA)
+    data_loader.load_records(path, PRODUCT_SCHEMA, disk_cache=True)
+    assert data_loader.disk_cache_path(path, kind).exists()
+    data_loader.invalidate_parse_cache(path)  # simulate a new process
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("CSV parsed again")
+    monkeypatch.setattr(data_loader, "iter_records", _fail)
+    (product,) = data_loader.load_records(path, PRODUCT_SCHEMA, disk_cache=True)
+    assert product.name == "Milk" and product.reorder_quantity == 20
+
+    data_loader.invalidate_parse_cache(path, disk=True)
+    assert not data_loader.disk_cache_path(path, kind).exists()
+
+
+def test_bad_disk_cache_is_reparsed(tmp_path):
+    """Test that a cache file of the wrong shape is ignored instead of failing the load."""
+    import pickle
+    from src.pos_system.common import data_loader
+    path = tmp_path / "products.csv"
+    path.write_text("product_id,name,category,price,quantity,reorder_level,reorder_quantity\nA-1,Milk,Dairy,1.50,10,5,20\n")
+    cache_file = data_loader.disk_cache_path(path, data_loader._schema_kind(PRODUCT_SCHEMA))
+    cache_file.write_bytes(pickle.dumps(42))  # Not a (version, signature, data) tuple
+    configure_logging(level=ERROR)
+    try:
+        (product,) = data_loader.load_records(path, PRODUCT_SCHEMA, disk_cache=True)
+    finally:
+        configure_logging(level=INFO)
+    assert product.name == "Milk"
+
+
+def test_schemas_of_one_class_do_not_share_cache(tmp_path):
+    """Test that two schemas building the same class get separate cache entries."""
+    from src.pos_system.common import data_loader
+    from src.pos_system.common.data_loader import RecordSchema
+    path = tmp_path / "customers.csv"
+    path.write_text("customer_id,name,loyalty_points,tier,join_date\nC1,Ann,120,Gold,2024-01-02\n")
+    short_schema = RecordSchema(Customer, (("customer_id", str), ("name", str)))
+    assert [c.loyalty_points for c in data_loader.load_records(path, CUSTOMER_SCHEMA)] == [120]
+    (customer,) = data_loader.load_records(path, short_schema)
+    assert customer.name == "Ann" and customer.loyalty_points == 0
+
+
+def test_load_customers_bulk_builds_both_trees(tmp_path):
+    """Test that customers are built sorted and balanced, keeping the first row of a duplicate id."""
+    path = tmp_path / "customers.csv"
+    path.write_text(
+        "customer_id,name,loyalty_points,tier,join_date\n"
+        "C3,Cara,30,Bronze,1/1/2024\n"
+        "C1,Abe,10,Bronze,1/1/2024\n"
+        "C2,Bea,20,Bronze,1/1/2024\n"
+        "C1,Abe again,99,Gold,1/1/2024\n"
+        "C4,Dan,40,Bronze,1/1/2024\n"
+    )
+    configure_logging(level=WARNING)
+    try:
+        bst, avl = BSTTree(), AVLTree()
+        load_customers(path, bst, avl)
+        for tree in (bst, avl):
+            assert [c.customer_id for c in tree.inorder_traversal()] == ["C1", "C2", "C3", "C4"]
+            assert tree.search("C1").name == "Abe"
+        assert avl.root.height == 3 and avl.root.customer.customer_id == "C2"
+        assert avl.insert(Customer("C5", "Eve", 50)) is True   # Built tree keeps working incrementally
+    finally:
+        configure_logging(level=INFO)
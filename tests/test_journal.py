@@ -0,0 +1,100 @@
+"""Tests for the loyalty customer journal, recovery and compaction."""
+import os
+from src.pos_system.common import journal as journal_module
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.data_loader import load_customers, save_customers
+from src.pos_system.common.journal import CustomerJournal, journal_path_for, replay_journal, write_snapshot
+from src.pos_system.common.logger import INFO, WARNING, configure_logging
+from src.pos_system.loyalty import update_points
+from src.pos_system.loyalty.avl_tree import AVLTree
+from src.pos_system.loyalty.binary_tree import BSTTree
+
+
+def test_journal_replay_applies_records_and_skips_torn_line(tmp_path):
+    path = tmp_path / "customers.csv.journal"
+    journal = CustomerJournal(path)
+    journal.record_customer(Customer("C1", "Abe", 10, "Bronze", "1/1/2024"))
+    journal.record_customer(Customer("C2", "Bea", 600, "Silver", "1/1/2024"))
+    journal.record_customer(Customer("C1", "Abe", 1200, "Gold", "1/1/2024"))
+    journal.record_removal("C2")
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"op":"upsert","customer_id":"C3"')   # Crash mid-append
+
+    customers = {"C2": Customer("C2", "Bea", 0), "C9": Customer("C9", "Old", 5)}
+    configure_logging(level=WARNING)
+    try:
+        assert replay_journal(path, customers) == 4
+    finally:
+        configure_logging(level=INFO)
+    assert sorted(customers) == ["C1", "C9"]
+    assert customers["C1"].loyalty_points == 1200 and customers["C1"].tier == "Gold"
+    assert replay_journal(tmp_path / "missing.journal", customers) == 0
+
+
+def test_journal_reopened_after_torn_line_keeps_new_records(tmp_path):
+    path = tmp_path / "customers.csv.journal"
+    journal = CustomerJournal(path)
+    journal.record_customer(Customer("C1", "Abe", 10, "Bronze", "1/1/2024"))
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"op":"upsert","customer_id":"C3"')   # Crash mid-append
+
+    configure_logging(level=WARNING)
+    try:
+        journal = CustomerJournal(path)
+        journal.record_customer(Customer("C2", "Bea", 20, "Bronze", "1/1/2024"))
+        journal.close()
+        customers = {}
+        assert replay_journal(path, customers) == 2
+    finally:
+        configure_logging(level=INFO)
+    assert sorted(customers) == ["C1", "C2"]
+
+    path.write_text('{"op":"delete"')   # Torn first record: journal starts empty
+    CustomerJournal(path).close()
+    assert path.read_text() == ""
+
+
+def test_journal_batches_fsync(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr(journal_module.os, "fsync", synced.append)
+    journal = CustomerJournal(tmp_path / "j", sync_every=4, sync_interval=3600)
+    for i in range(10):
+        journal.record_removal(f"C{i}")
+    assert journal.syncs == 2 and len(synced) == 2
+    journal.close()  # Syncs the last two records
+    assert journal.syncs == 3
+
+
+def test_recovery_and_compaction(tmp_path):
+    snapshot = tmp_path / "customers.csv"
+    write_snapshot(snapshot, [Customer("C1", "Abe", 100, "Bronze", "1/1/2024"),
+                              Customer("C2", "Bea", 200, "Bronze", "1/1/2024")])
+    journal_file = journal_path_for(snapshot)
+    configure_logging(level=WARNING)
+    try:
+        bst, avl = BSTTree(), AVLTree()
+        load_customers(snapshot, bst, avl, journal_path=journal_file)
+        journal = CustomerJournal(journal_file)
+        update_points(avl, "C1", 450)
+        journal.record_customer(avl.search("C1"))
+        avl.delete("C2")
+        bst.delete("C2")
+        journal.record_removal("C2")
+        journal.close()    # Process stops without saving
+
+        bst, avl = BSTTree(), AVLTree()
+        load_customers(snapshot, bst, avl, journal_path=journal_file)
+        assert [(c.customer_id, c.loyalty_points, c.tier) for c in avl.inorder_traversal()] == [("C1", 550, "Silver")]
+
+        journal = CustomerJournal(journal_file)
+        journal.record_customer(avl.search("C1"))
+        save_customers(snapshot, bst, avl, journal=journal)
+        journal.close()
+    finally:
+        configure_logging(level=INFO)
+    assert os.path.getsize(journal_file) == 0
+    assert not (tmp_path / "customers.csv.tmp").exists()
+    assert snapshot.read_text().splitlines() == ["customer_id,name,loyalty_points,tier,join_date",
+                                                 "C1,Abe,550,Silver,1/1/2024"]
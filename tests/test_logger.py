@@ -0,0 +1,63 @@
+"""Tests for the levelled, batched operation logger."""
+import pytest
+from src.pos_system.common import logger
+from src.pos_system.common.logger import DEBUG, INFO, WARNING, configure_logging, flush_logs, is_enabled, log_operation
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "operations.log"
+    configure_logging(level=INFO, console=False, path=str(path), queue_size=8, batch_size=4)
+    yield path
+    configure_logging(level=INFO, console=True, path=logger.DEFAULT_LOG_FILE, queue_size=10_000, batch_size=512)
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted a disabled message")
+
+
+def test_levels_skip_formatting(log_file):
+    assert is_enabled(INFO) and not is_enabled(DEBUG)
+    log_operation("Found customer: %s", _Exploding(), level=DEBUG)
+    log_operation("Loaded %d customers", 3)
+    configure_logging(level=WARNING)
+    log_operation("Inserted: %s", _Exploding())
+    log_operation("Disk nearly full", level=WARNING)
+    flush_logs()
+    lines = log_file.read_text().splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["Loaded 3 customers", "Disk nearly full"]
+
+
+def test_bounded_queue_batches_every_line(log_file):
+    for i in range(100):  # far more than the queue holds: callers wait, nothing is dropped
+        log_operation("Inserted: %d", i)
+    flush_logs()
+    lines = log_file.read_text().splitlines()
+    assert [int(line.rsplit(" ", 1)[1]) for line in lines] == list(range(100))
+    writer = logger._writer
+    assert writer.batches_written < 100  # lines were grouped into fewer writes
+
+
+def test_shutdown_flushes_and_restarts(log_file, capsys):
+    configure_logging(console=True)
+    log_operation("before shutdown")
+    logger.shutdown_logging()
+    assert "before shutdown" in log_file.read_text()
+    assert "before shutdown" in capsys.readouterr().out
+    log_operation("after restart")
+    flush_logs()
+    assert log_file.read_text().count("\n") == 2
+
+
+def test_failed_writer_drops_lines_instead_of_blocking(tmp_path, capsys):
+    configure_logging(level=INFO, console=False, path=str(tmp_path / "missing" / "x.log"), queue_size=10, batch_size=4)
+    try:
+        for i in range(500):    # Far more than the queue holds
+            log_operation("Line %d", i)
+        flush_logs()
+        writer = logger._writer
+        assert isinstance(writer.error, OSError) and writer.dropped == 500
+        assert "log lines are dropped" in capsys.readouterr().err
+    finally:
+        configure_logging(level=INFO, console=True, path=logger.DEFAULT_LOG_FILE, queue_size=10_000, batch_size=512)
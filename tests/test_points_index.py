@@ -0,0 +1,72 @@
+"""Tests for the points-ordered secondary loyalty index."""
+import random
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.logger import WARNING, configure_logging, INFO
+from src.pos_system.loyalty import enable_points_index, range_query, top_n_customers, update_points
+from src.pos_system.loyalty.avl_tree import AVLTree
+from src.pos_system.loyalty.binary_tree import BSTTree
+from src.pos_system.loyalty.customer_tree import build_customer_tree
+from src.pos_system.loyalty.points_index import PointsIndex
+
+
+def _check_balanced(node):
+    if node is None:
+        return 0
+    left, right = _check_balanced(node.left), _check_balanced(node.right)
+    assert abs(left - right) <= 1 and node.height == 1 + max(left, right)
+    return node.height
+
+
+def test_points_index_range_and_top():
+    customers = [Customer(f"C{i:03d}", f"Customer {i}", loyalty_points=(i * 37) % 500) for i in range(200)]
+    index = PointsIndex.from_customers(customers)
+    _check_balanced(index.root)
+    expected = sorted((c for c in customers if 100 <= c.loyalty_points <= 250), key=lambda c: (c.loyalty_points, c.customer_id))
+    assert index.range(100, 250) == expected
+    assert [c.loyalty_points for c in index.top(5)] == sorted((c.loyalty_points for c in customers), reverse=True)[:5]
+    assert index.range(600, 700) == [] and index.top(0) == []
+
+
+def test_points_index_stays_consistent_with_primary_trees():
+    configure_logging(level=WARNING)
+    try:
+        rng = random.Random(11)
+        customers = [Customer(f"C{i:04d}", f"Customer {i}", loyalty_points=rng.randrange(1000)) for i in range(300)]
+        for tree in (AVLTree(), BSTTree(), build_customer_tree("bst")):
+            for customer in customers[:150]:
+                tree.insert(customer)
+            enable_points_index(tree)
+            for customer in customers[150:]:
+                tree.insert(customer)
+            for customer in rng.sample(customers, 50):
+                tree.delete(customer.customer_id)
+            for _ in range(200):
+                update_points(tree, rng.choice(customers).customer_id, rng.randrange(-50, 300))
+
+            live = tree.inorder_traversal()
+            assert len(tree.points_index) == len(live)
+            _check_balanced(tree.points_index.root)
+            by_points = sorted(live, key=lambda c: (c.loyalty_points, c.customer_id))
+            assert range_query(tree, 200, 800) == [c for c in by_points if 200 <= c.loyalty_points <= 800]
+            assert [c.loyalty_points for c in top_n_customers(tree, 10)] == [c.loyalty_points for c in by_points[::-1][:10]]
+            for customer in customers:  # fresh objects per tree: updates above mutated these
+                customer.loyalty_points = rng.randrange(1000)
+    finally:
+        configure_logging(level=INFO)
+
+
+def test_reports_order_ties_the_same_with_and_without_index():
+    configure_logging(level=WARNING)
+    try:
+        results = []
+        for indexed in (False, True):
+            tree = AVLTree()
+            for cid, points in (("C1", 100), ("C2", 100), ("C3", 50), ("C4", 100)):
+                tree.insert(Customer(cid, cid, loyalty_points=points))
+            if indexed:
+                enable_points_index(tree)
+            results.append(([c.customer_id for c in top_n_customers(tree, 2)],
+                            [c.customer_id for c in range_query(tree, 0, 200)]))
+    finally:
+        configure_logging(level=INFO)
+    assert results[0] == results[1] == (["C1", "C2"], ["C3", "C1", "C2", "C4"])
@@ -0,0 +1,74 @@
+"""Tests for the tree backend registry and its adapters."""
+import random
+from src.pos_system.common.Customer import Customer
+from src.pos_system.common.interfaces import TreeInterface, UnsupportedOperation
+from src.pos_system.common.tree_registry import UnknownBackendError, backend_names, create_tree, register_backend
+from src.pos_system.inventory.inventory_data_loader import build_inventory_tree
+from src.pos_system.loyalty import top_n_customers, update_points
+from src.pos_system.loyalty.avl_tree import AVLTree
+from src.pos_system.loyalty.customer_tree import CustomerTree, build_customer_tree
+from src.pos_system.sales.transaction_trees import build_transaction_tree
+
+DELETE_UNSUPPORTED = {"btree", "sales_bst"}
+
+
+def test_every_backend_is_a_key_value_tree():
+    """Test insert/search/traverse (and delete where supported) on every built-in backend."""
+    assert {"bst", "splay", "array_bst", "avl", "loyalty_bst", "btree", "sales_bst"} <= set(backend_names())
+    keys = list(range(200))
+    random.Random(7).shuffle(keys)
+    for name in backend_names():
+        tree = create_tree(name)
+        assert isinstance(tree, TreeInterface)
+        for key in keys:
+            tree.insert(key, f"value {key}")
+        assert tree.search(42).value == "value 42"
+        assert tree.search(500) is None
+        assert [node.key for node in tree.traverse()] == sorted(keys), name
+        tree.insert(7, "replaced")  # Insert is an upsert on every backend
+        assert tree.search(7).value == "replaced"
+        assert len(list(tree.traverse())) == 200, name
+        if name in DELETE_UNSUPPORTED:
+            try:
+                tree.delete(42)
+                assert False
+            except UnsupportedOperation:
+                pass
+        else:
+            tree.delete(42)
+            assert tree.search(42) is None
+            assert len(list(tree.traverse())) == 199
+
+
+def test_unknown_and_duplicate_backends():
+    try:
+        create_tree("no-such-tree")
+        assert False
+    except UnknownBackendError:
+        pass
+    try:
+        register_backend("bst", dict)
+        assert False
+    except ValueError:
+        pass
+
+
+def test_module_builders_take_backend_names():
+    """Test that the inventory, loyalty and sales builders accept any backend."""
+    reference = [node.key for node in build_inventory_tree("bst", entries=150).traverse()]
+    for name in ("splay", "avl", "btree"):
+        tree = build_inventory_tree(name, entries=150)
+        assert [node.key for node in tree.traverse()] == reference
+        assert tree.search("29-205-1132").value.name == "Sushi Rice"
+
+    customers = [Customer(f"C{i:03d}", f"Customer {i}", loyalty_points=i * 10) for i in range(30)]
+    assert isinstance(build_customer_tree("avl", customers), AVLTree)
+    tree = build_customer_tree("splay", customers)
+    assert isinstance(tree, CustomerTree)
+    assert not tree.insert(Customer("C001", "Duplicate"))
+    assert update_points(tree, "C001", 1000) and tree.search("C001").tier == "Gold"
+    assert top_n_customers(tree, 1)[0].customer_id == "C001"
+
+    sales = build_transaction_tree({"R2": {"total": 5}, "R1": {"total": 3}}, backend="sales_bst")
+    assert [node.key for node in sales.traverse()] == ["R1", "R2"]
+    assert build_transaction_tree({"R1": {"total": 3}}, backend="btree", t=2).search("R1").value == {"total": 3}
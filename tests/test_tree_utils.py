@@ -0,0 +1,43 @@
+"""Tests for the shared balanced build, in-order walk and batched search."""
+from src.pos_system.common.tree_utils import build_balanced, check_strictly_increasing, in_order, search_sorted
+
+
+class _Node:
+    def __init__(self, key, left, right):
+        self.key, self.left, self.right = key, left, right
+
+
+def _tree(keys):
+    return build_balanced(len(keys), lambda i, left, right, size: _Node(keys[i], left, right))
+
+
+def _height(node):
+    return 0 if node is None else 1 + max(_height(node.left), _height(node.right))
+
+
+def test_build_balanced_and_in_order():
+    keys = list(range(0, 200, 2))
+    root = _tree(keys)
+    assert _height(root) == 7
+    assert build_balanced(0, None) is None
+    assert [n.key for n in in_order(root)] == keys
+    assert [n.key for n in in_order(root, reverse=True)] == keys[::-1]
+    assert [n.key for n in in_order(root, start=51)][:2] == [52, 54]
+    assert [n.key for n in in_order(root, reverse=True, start=51)][:2] == [50, 48]
+    assert list(in_order(root, start=500)) == []
+
+
+def test_search_sorted_finds_present_keys():
+    root = _tree(list(range(0, 200, 2)))
+    found = search_sorted(root, [10, 11, 198, 10, -4, 0])
+    assert sorted(found) == [0, 10, 198]
+    assert all(node.key == key for key, node in found.items())
+
+
+def test_check_strictly_increasing():
+    check_strictly_increasing([1, 2, 3])
+    try:
+        check_strictly_increasing(["C1", "C1"], "Customer ids")
+        assert False
+    except ValueError as e:
+        assert "Customer ids" in str(e)